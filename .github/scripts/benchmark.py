@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the validation scripts on synthetic catalogs.
+Generates antennas/ trees shaped like the real ones (README.md structure from CONTRIBUTING.md,
+structurally valid images of realistic sizes, a fraction of deliberate violations),
+times every validator and compares results with a JSON baseline.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List
+
+# Import configuration and utilities
+try:
+    from config import ANTENNAS_DIR, CACHE_DIR, DETAILS_FILE_NAME, IMAGES_DIR_NAME, MAX_FILE_SIZE_BYTES
+    from messages import ERROR_TEMPLATES, SUCCESS_TEMPLATES, PROGRESS_TEMPLATES
+    from catalog import CatalogSnapshot
+    from registry import load, select_validators
+except ImportError as e:
+    print(f"❌ Error: Could not import required modules: {e}")
+    sys.exit(1)
+
+# Bump when the layout of the results file or the generated catalog changes
+BENCHMARK_FORMAT_VERSION = 2
+
+DEFAULT_SIZES = [10, 1000, 10000, 100000]
+DEFAULT_RESULTS_FILE = CACHE_DIR / "benchmark.json"
+
+# Timings below this are too noisy to be compared with the baseline
+MIN_COMPARABLE_SECONDS = 0.01
+
+VIOLATIONS = [
+    'directory_naming', 'file_size', 'image_location', 'image_format',
+    'missing_readme', 'not_linked', 'missing_section', 'missing_image', 'truncated_image',
+]
+
+def png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    return struct.pack('>I', len(data)) + chunk_type + data + struct.pack('>I', zlib.crc32(chunk_type + data))
+
+def png_header(width: int, height: int) -> bytes:
+    """PNG signature and IHDR chunk."""
+    return b'\x89PNG\r\n\x1a\n' + png_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+
+@lru_cache(maxsize=None)
+def zero_chunk_crc(chunk_type: bytes, length: int) -> int:
+    """CRC of a PNG chunk with `length` zero bytes of data (generated sizes repeat a lot)."""
+    return zlib.crc32(bytes(length), zlib.crc32(chunk_type))
+
+def jpeg_header(width: int, height: int) -> bytes:
+    """JPEG SOI, JFIF APP0 and a baseline SOF0 segment."""
+    app0 = b'\xff\xe0' + struct.pack('>H', 16) + b'JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00'
+    sof0 = b'\xff\xc0' + struct.pack('>HBHHB', 17, 8, height, width, 3) + b'\x01\x22\x00\x02\x11\x01\x03\x11\x01'
+    return b'\xff\xd8' + app0 + sof0
+
+def write_png(path: Path, width: int, height: int, size: int, truncated: bool = False):
+    """Write a PNG of `size` bytes whose IDAT chunk is padded with zeros (pixels aren't decoded)."""
+    header = png_header(width, height)
+    length = max(size - len(header) - 24, 0)
+    trailer = struct.pack('>I', zero_chunk_crc(b'IDAT', length)) + png_chunk(b'IEND', b'')
+    write_file(path, header + struct.pack('>I4s', length, b'IDAT'), size, b'' if truncated else trailer)
+
+def write_jpeg(path: Path, width: int, height: int, size: int, truncated: bool = False):
+    """Write a JPEG of `size` bytes whose scan data is padded with zeros (pixels aren't decoded)."""
+    sos = b'\xff\xda' + struct.pack('>HB', 12, 3) + b'\x01\x00\x02\x11\x03\x11\x00\x3f\x00'
+    write_file(path, jpeg_header(width, height) + sos, size, b'' if truncated else b'\xff\xd9')
+
+def write_file(path: Path, header: bytes, size: int, trailer: bytes = b''):
+    """Write a file with the given header and trailer, extended to `size` bytes without writing the padding."""
+    with open(path, 'wb') as f:
+        f.write(header)
+        # Sparse padding keeps large catalogs cheap on disk while stat() reports realistic sizes
+        f.truncate(max(size - len(trailer), len(header)))
+        f.seek(0, os.SEEK_END)
+        f.write(trailer)
+
+def antenna_readme(title: str, images: List[str]) -> str:
+    """README.md content following the structure from CONTRIBUTING.md."""
+    screenshots = '\n'.join(f"![Measurement]({IMAGES_DIR_NAME}/{name})" for name in images[1:])
+    return (
+        f"# {title}\n\n"
+        f"![Photo]({IMAGES_DIR_NAME}/{images[0]})\n\n"
+        "## Where to buy\n\n"
+        "- [Store](https://example.com/item)\n\n"
+        "## Declared specs\n\n"
+        "Gain: `3dBi`\n\n"
+        "## Measurements\n\n"
+        "### 868 MHz\n\n"
+        "SWR: `1.234`\n\n"
+        "Impedance: `48.5 Ω`, `j3.1`\n\n"
+        "<details>\n<summary>Screenshots</summary>\n\n"
+        f"{screenshots}\n\n"
+        "</details>\n"
+    )
+
+def generate_catalog(root: Path, count: int, violation_rate: float, seed: int = 0) -> Dict[str, int]:
+    """
+    Generate a synthetic catalog in `root`.
+
+    Returns:
+        Number of generated antennas with each violation type
+    """
+    rng = random.Random(seed)
+    antennas_dir = root / ANTENNAS_DIR
+    antennas_dir.mkdir(parents=True)
+    violations = {name: 0 for name in VIOLATIONS}
+    readme_blocks = []
+
+    for number in range(count):
+        violation = rng.choice(VIOLATIONS) if rng.random() < violation_rate else None
+        if violation:
+            violations[violation] += 1
+
+        name = f"vendor_{number % 97}_antenna_{number}"
+        if violation == 'directory_naming':
+            name = f"Vendor-{number}"
+        antenna_dir = antennas_dir / name
+        images_dir = antenna_dir / IMAGES_DIR_NAME
+        images_dir.mkdir(parents=True)
+
+        images = ['00_photo.jpg'] + [f"{index:02d}_measurement.png" for index in range(1, rng.randint(2, 4))]
+        write_jpeg(images_dir / images[0], 1063, 800, rng.randint(30, 250) * 1024)
+        for image in images[1:]:
+            write_png(images_dir / image, 480, 320, rng.randint(5, 20) * 1024)
+
+        if violation == 'file_size':
+            write_jpeg(images_dir / images[0], 1063, 800, MAX_FILE_SIZE_BYTES + rng.randint(1, 500) * 1024)
+        elif violation == 'image_location':
+            write_jpeg(antenna_dir / 'photo.jpg', 1063, 800, 50 * 1024)
+        elif violation == 'image_format':
+            write_file(images_dir / '09_photo.gif', b'GIF89a', 20 * 1024)
+        elif violation == 'truncated_image':
+            write_png(images_dir / images[-1], 480, 320, rng.randint(5, 20) * 1024, truncated=True)
+
+        title = f"Vendor {number % 97} Antenna {number}"
+        readme = antenna_readme(title, images)
+        if violation == 'missing_section':
+            readme = readme.replace("## Where to buy", "## Links")
+        elif violation == 'missing_image':
+            readme = readme.replace(images[-1], '99_missing.png')
+        if violation != 'missing_readme':
+            (antenna_dir / DETAILS_FILE_NAME).write_text(readme, encoding='utf-8')
+
+        if violation != 'not_linked':
+            readme_blocks.append(
+                f"### [{title}]({ANTENNAS_DIR.as_posix()}/{name}/{DETAILS_FILE_NAME}) [`3dBi`]\n\n"
+                "#### 868 MHz\n\nSWR: `1.234`\n\nImpedance: `48.5 Ω`, `j3.1`\n"
+            )
+
+    (root / 'README.md').write_text(
+        "# Antenna stats\n\n## Antennas\n\n" + '\n'.join(readme_blocks), encoding='utf-8'
+    )
+    return violations
+
+def time_validators(jobs: int, repeat: int) -> Dict[str, float]:
+    """
+    Time the catalog scan and every validator in the current directory.
+
+    Returns:
+        Best of `repeat` wall-clock times in seconds by name
+    """
+    timings: Dict[str, float] = {}
+    for _ in range(repeat):
+        with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            snapshot = CatalogSnapshot(jobs=jobs)
+            results = {'scan': time.perf_counter() - start}
+
+            # Optional stages (external links) need network access and aren't benchmarked
+            for validator in select_validators():
+                function = load(validator)
+                start = time.perf_counter()
+                function(snapshot)
+                results[validator.function] = time.perf_counter() - start
+            results['total'] = sum(results.values())
+
+        for name, seconds in results.items():
+            timings[name] = min(seconds, timings.get(name, seconds))
+    return timings
+
+def compare_with_baseline(results: Dict[str, Dict[str, float]], baseline: dict, threshold: float) -> List[str]:
+    """Return regression messages for timings slower than `threshold` times the baseline."""
+    regressions = []
+    for count, timings in results.items():
+        baseline_timings = baseline.get('results', {}).get(count, {})
+        for name, seconds in timings.items():
+            previous = baseline_timings.get(name)
+            if previous is None or max(previous, seconds) < MIN_COMPARABLE_SECONDS:
+                continue
+            ratio = seconds / previous if previous else float('inf')
+            if ratio > threshold:
+                regressions.append(ERROR_TEMPLATES['benchmark_regression'].format(
+                    name=name, count=count, ratio=ratio, baseline=previous, seconds=seconds
+                ))
+    return regressions
+
+def parse_sizes(text: str) -> List[int]:
+    sizes = [int(size) for size in text.split(',') if size.strip()]
+    if not sizes or min(sizes) < 1:
+        raise argparse.ArgumentTypeError("sizes must be positive integers")
+    return sizes
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark validators on synthetic antenna catalogs.")
+    parser.add_argument(
+        '--sizes', type=parse_sizes, default=DEFAULT_SIZES, metavar='N,N,...',
+        help=f"catalog sizes in antennas (default: {','.join(map(str, DEFAULT_SIZES))})"
+    )
+    parser.add_argument(
+        '--violations', type=float, default=0.05, metavar='RATE',
+        help="fraction of antennas with a deliberate violation (default: 0.05)"
+    )
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N', help="worker threads (default: 1)")
+    parser.add_argument('--repeat', type=int, default=3, metavar='N', help="runs per size, best is kept (default: 3)")
+    parser.add_argument('--seed', type=int, default=0, help="random seed of the generated catalogs")
+    parser.add_argument(
+        '--output', type=Path, default=DEFAULT_RESULTS_FILE, metavar='FILE',
+        help=f"where to write results (default: {DEFAULT_RESULTS_FILE})"
+    )
+    parser.add_argument('--baseline', type=Path, metavar='FILE', help="compare results with a previous results file")
+    parser.add_argument(
+        '--threshold', type=float, default=1.2, metavar='RATIO',
+        help="slowdown against the baseline reported as a regression (default: 1.2)"
+    )
+    args = parser.parse_args()
+
+    try:
+        baseline = None
+        if args.baseline:
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+
+        output = args.output.resolve()
+        results = {}
+        cwd = Path.cwd()
+        for count in args.sizes:
+            with tempfile.TemporaryDirectory(prefix='antenna-benchmark-') as root:
+                print(PROGRESS_TEMPLATES['benchmark_generating'].format(count=count))
+                generate_catalog(Path(root), count, args.violations, args.seed)
+                # Validators work with paths relative to the repository root
+                os.chdir(root)
+                try:
+                    timings = time_validators(args.jobs, max(1, args.repeat))
+                finally:
+                    os.chdir(cwd)
+
+            results[str(count)] = timings
+            for name, seconds in timings.items():
+                print(PROGRESS_TEMPLATES['benchmark_result'].format(name=name, seconds=seconds))
+
+        data = {
+            'format_version': BENCHMARK_FORMAT_VERSION,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'jobs': args.jobs,
+            'violations': args.violations,
+            'results': results
+        }
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        print(SUCCESS_TEMPLATES['benchmark_saved'].format(path=output))
+
+        if baseline is not None:
+            regressions = compare_with_baseline(results, baseline, args.threshold)
+            for regression in regressions:
+                print(regression)
+            if regressions:
+                sys.exit(1)
+            print(SUCCESS_TEMPLATES['benchmark_no_regressions'])
+        sys.exit(0)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error in benchmark: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"❌ Unexpected error in benchmark: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Catalog snapshot shared by validation scripts.
+Walks the antennas directory once and caches directory entries, stat results and
+file contents so that validators don't re-scan the file system. Files are read
+through a storage backend: the working tree or a git revision (see storage.py).
+"""
+
+import contextlib
+import hashlib
+import io
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Callable, ContextManager, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+# Import configuration
+try:
+    from config import ANTENNAS_DIR
+    from storage import Buffer, CatalogEntry, WorkingTree
+except ImportError:
+    print("❌ Error: Could not import configuration file")
+    sys.exit(1)
+
+class Shard(NamedTuple):
+    """
+    One of `count` parts of the catalog (`index` is 1-based).
+
+    Antenna directories are assigned by a hash of their name, so the assignment is
+    stable across runs and machines and doesn't depend on the other antennas.
+    """
+    index: int
+    count: int
+
+    @classmethod
+    def parse(cls, text: str) -> 'Shard':
+        """
+        Parse a shard written as 'i/N', e.g. '2/4'.
+
+        Raises:
+            ValueError: If the text isn't a valid shard
+        """
+        index, separator, count = text.partition('/')
+        if not separator or not index.strip().isdigit() or not count.strip().isdigit():
+            raise ValueError(f"invalid shard '{text}', expected i/N, e.g. 1/4")
+        shard = cls(int(index), int(count))
+        if not 1 <= shard.index <= shard.count:
+            raise ValueError(f"invalid shard '{text}', i must be between 1 and N")
+        return shard
+
+    @property
+    def is_primary(self) -> bool:
+        """Whether this shard also covers checks that aren't split by antenna."""
+        return self.index == 1
+
+    def contains(self, antenna_name: str) -> bool:
+        digest = hashlib.sha256(antenna_name.encode('utf-8', errors='surrogateescape')).digest()
+        return int.from_bytes(digest[:8], 'big') % self.count == self.index - 1
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+# Function validating a single antenna directory and returning error messages
+AntennaCheck = Callable[['CatalogSnapshot', CatalogEntry], List[str]]
+
+class CatalogSnapshot:
+    """
+    Single-pass view of the antennas directory.
+
+    Directory listings are collected eagerly in one walk, stat results
+    are taken on first use and cached, file contents are read on demand and cached.
+
+    When `antenna_names` is given, the top level of the antennas directory is still
+    listed completely, but only the selected antenna directories are descended into
+    and returned by antenna_dirs(). `jobs` sets how many worker threads
+    run_per_antenna() may use. `storage` is the backend files are read from, the
+    working tree by default. With a `shard` only its antenna directories are selected,
+    and files placed directly in the antennas directory belong to the first shard.
+    """
+
+    def __init__(self, antennas_dir: Path = ANTENNAS_DIR, antenna_names: Optional[Iterable[str]] = None,
+                 jobs: int = 1, storage=None, shard: Optional[Shard] = None):
+        self.antennas_dir = Path(antennas_dir)
+        self.jobs = jobs
+        self.storage = storage if storage is not None else WorkingTree()
+        self.antennas_dir_exists = self.storage.is_dir(self.antennas_dir)
+        self.antenna_names = set(antenna_names) if antenna_names is not None else None
+        self.shard = shard
+        self.scan_errors: List[OSError] = []
+        # Optional store of per-antenna results (see results_cache.ValidationCache)
+        self.results_cache = None
+        self._entries: Dict[Path, CatalogEntry] = {}
+        self._children: Dict[Path, List[CatalogEntry]] = {}
+        self._texts: Dict[Path, str] = {}
+        # Paths of every file opened through the snapshot, in order (list.append is thread-safe)
+        self.opened_files: List[Path] = []
+
+        if self.antennas_dir_exists:
+            self._scan()
+
+    def _scan(self):
+        """Walk the antennas directory tree once, depth-first in name order."""
+        pending = [self.antennas_dir]
+        while pending:
+            directory = pending.pop()
+            try:
+                entries = sorted(self.storage.list_directory(directory), key=lambda entry: entry.name)
+            except OSError as e:
+                self.scan_errors.append(e)
+                continue
+
+            self._children[directory] = entries
+            for entry in entries:
+                self._entries[entry.path] = entry
+
+            # Don't follow directory symlinks to avoid loops
+            pending.extend(
+                entry.path for entry in reversed(entries)
+                if entry.is_dir and not entry.is_symlink and self._is_selected(entry)
+            )
+
+    def _is_selected(self, entry: CatalogEntry) -> bool:
+        """Check whether an entry is outside the top level or belongs to a selected antenna."""
+        if entry.path.parent != self.antennas_dir:
+            return True
+        if self.shard is not None and not self.shard.contains(entry.name):
+            return False
+        return self.antenna_names is None or entry.name in self.antenna_names
+
+    def children(self, directory: Path) -> List[CatalogEntry]:
+        """Return entries of a scanned directory (empty list if it wasn't scanned)."""
+        return self._children.get(Path(directory), [])
+
+    def antenna_dirs(self) -> List[CatalogEntry]:
+        """Return selected antenna directories sorted by name."""
+        return [entry for entry in self.all_antenna_dirs() if self._is_selected(entry)]
+
+    def all_antenna_dirs(self) -> List[CatalogEntry]:
+        """Return all antenna directories sorted by name, regardless of selection."""
+        return [entry for entry in self.children(self.antennas_dir) if entry.is_dir]
+
+    def walk(self, directory: Optional[Path] = None) -> List[CatalogEntry]:
+        """Return all entries below a directory (antennas tree by default), depth-first in name order."""
+        walked = []
+        pending = [Path(directory) if directory is not None else self.antennas_dir]
+        while pending:
+            entries = self.children(pending.pop())
+            walked.extend(entries)
+            pending.extend(entry.path for entry in reversed(entries) if entry.is_dir)
+        return walked
+
+    def files(self, directory: Optional[Path] = None) -> List[CatalogEntry]:
+        """Return all files below a directory (antennas tree by default), depth-first in name order."""
+        return [entry for entry in self.walk(directory) if entry.is_file]
+
+    def loose_files(self) -> List[CatalogEntry]:
+        """Return files placed directly in the antennas directory."""
+        if self.shard is not None and not self.shard.is_primary:
+            return []
+        return [entry for entry in self.children(self.antennas_dir) if entry.is_file]
+
+    def get(self, path: Path) -> Optional[CatalogEntry]:
+        """Return the snapshot entry for a path, or None if it's not in the snapshot."""
+        return self._entries.get(Path(path))
+
+    def is_scanned(self, path: Path) -> bool:
+        """Check whether the snapshot can answer questions about a path without touching the disk."""
+        path = Path(path)
+        return path == self.antennas_dir or path.parent in self._children
+
+    def exists(self, path: Path) -> bool:
+        """Check path existence, falling back to the storage for paths outside the snapshot."""
+        path = Path(path)
+        if path == self.antennas_dir:
+            return self.antennas_dir_exists
+        if self.is_scanned(path):
+            return path in self._entries
+        return self.storage.exists(path)
+
+    def is_dir(self, path: Path) -> bool:
+        """Check whether a path is a directory, falling back to the storage outside the snapshot."""
+        path = Path(path)
+        if path == self.antennas_dir:
+            return self.antennas_dir_exists
+        if self.is_scanned(path):
+            entry = self.get(path)
+            return entry is not None and entry.is_dir
+        return self.storage.is_dir(path)
+
+    def read_text(self, path: Path) -> str:
+        """Read a text file once and cache its contents."""
+        path = Path(path)
+        if path not in self._texts:
+            self.opened_files.append(path)
+            self._texts[path] = self.storage.read_text(path)
+        return self._texts[path]
+
+    def open_binary(self, path: Path) -> BinaryIO:
+        """Open a file for binary reading (e.g. to probe headers without reading whole files)."""
+        self.opened_files.append(Path(path))
+        return self.storage.open_binary(path)
+
+    def map_file(self, path: Path) -> ContextManager[Buffer]:
+        """Map a file for reading without copying it (e.g. to walk the structure of large images)."""
+        self.opened_files.append(Path(path))
+        return self.storage.map_file(path)
+
+    def run_per_antenna(self, stage: str, check: AntennaCheck) -> List[str]:
+        """
+        Run a per-antenna check over the selected antenna directories.
+
+        With `jobs` > 1 antennas are spread across a thread pool. Output printed by
+        the check is buffered per antenna and both output and errors are merged
+        back in antenna name order, so reports don't depend on scheduling.
+
+        Args:
+            stage: Name of the validation stage, used as the results cache key
+            check: Function validating a single antenna directory
+
+        Returns:
+            Errors of all antennas merged in antenna name order
+        """
+        antennas = self.antenna_dirs()
+        if self.jobs <= 1 or len(antennas) <= 1:
+            errors = []
+            for antenna in antennas:
+                errors.extend(self.run_antenna_check(stage, check, antenna))
+            return errors
+
+        # Cache lookups stay on the calling thread, only misses go to the pool
+        results: List[Optional[List[str]]] = [self._get_cached(stage, antenna) for antenna in antennas]
+        pending = [index for index, cached in enumerate(results) if cached is None]
+
+        with thread_local_stdout() as stdout:
+
+            def run(antenna: CatalogEntry):
+                buffer = stdout.capture()
+                try:
+                    return check(self, antenna), buffer.getvalue(), None
+                except Exception as e:
+                    return None, buffer.getvalue(), e
+                finally:
+                    stdout.release()
+
+            with ThreadPoolExecutor(max_workers=min(self.jobs, len(pending) or 1)) as executor:
+                futures = {index: executor.submit(run, antennas[index]) for index in pending}
+                for index, future in futures.items():
+                    errors, output, error = future.result()
+                    stdout.write(output)
+                    if error is not None:
+                        for other in futures.values():
+                            other.cancel()
+                        raise error
+                    self._store(stage, antennas[index], errors)
+                    results[index] = errors
+
+        return [error for antenna_errors in results for error in antenna_errors]
+
+    def run_antenna_check(self, stage: str, check: AntennaCheck, antenna: CatalogEntry) -> List[str]:
+        """Run a check on a single antenna, reusing cached results when available."""
+        cached_errors = self._get_cached(stage, antenna)
+        if cached_errors is not None:
+            return cached_errors
+
+        errors = check(self, antenna)
+        self._store(stage, antenna, errors)
+        return errors
+
+    def _get_cached(self, stage: str, antenna: CatalogEntry) -> Optional[List[str]]:
+        if self.results_cache is None:
+            return None
+        return self.results_cache.get(self, antenna, stage)
+
+    def _store(self, stage: str, antenna: CatalogEntry, errors: List[str]):
+        if self.results_cache is not None:
+            self.results_cache.put(self, antenna, stage, errors)
+
+class _ThreadLocalStdout(io.TextIOBase):
+    """Stdout proxy redirecting writes of worker threads into per-task buffers."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def capture(self) -> io.StringIO:
+        """Start buffering output of the current thread."""
+        self._local.buffer = io.StringIO()
+        return self._local.buffer
+
+    def release(self):
+        """Stop buffering output of the current thread."""
+        self._local.buffer = None
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer if buffer is not None else self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+@contextlib.contextmanager
+def thread_local_stdout() -> Iterator[_ThreadLocalStdout]:
+    """
+    Route stdout through a proxy that can buffer output per thread.
+
+    Reuses the proxy installed by an outer block, so nested thread pools (e.g. per-antenna
+    checks inside concurrently running stages) don't swap sys.stdout under each other.
+    Output of threads that don't capture goes straight to the real stdout, even when the
+    thread that started them is capturing.
+    """
+    if isinstance(sys.stdout, _ThreadLocalStdout):
+        yield sys.stdout
+        return
+
+    stdout = _ThreadLocalStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        yield stdout
+    finally:
+        sys.stdout = stdout.stream
@@ -6,6 +6,7 @@ Ensures all directories use snake_case naming (lowercase letters and underscores
 
 import sys
 from pathlib import Path
+from typing import List, Optional
 
 # Import configuration
 try:
@@ -13,33 +14,43 @@ try:
         ANTENNAS_DIR, SNAKE_CASE_PATTERN, 
         ERROR_TEMPLATES, SUCCESS_TEMPLATES, PROGRESS_TEMPLATES
     )
+    from catalog import CatalogEntry, CatalogSnapshot
 except ImportError:
     print("❌ Error: Could not import configuration file")
     sys.exit(1)
 
-def check_directory_naming():
+def check_antenna_directory_naming(snapshot: CatalogSnapshot, antenna: CatalogEntry) -> List[str]:
+    """Check that a single antenna directory uses snake_case naming."""
+    errors = []
+    
+    if not SNAKE_CASE_PATTERN.match(antenna.name):
+        errors.append(ERROR_TEMPLATES['directory_naming'].format(name=antenna.name))
+        print(f"  ❌ {antenna.name}: Invalid naming convention")
+    else:
+        print(PROGRESS_TEMPLATES['valid_directory'].format(name=antenna.name))
+    
+    return errors
+
+def check_directory_naming(snapshot: Optional[CatalogSnapshot] = None):
     """Check that all directories in antennas use snake_case naming."""
     errors = []
     
-    if not ANTENNAS_DIR.exists():
+    if snapshot is None:
+        snapshot = CatalogSnapshot(ANTENNAS_DIR)
+    
+    if not snapshot.antennas_dir_exists:
         print(ERROR_TEMPLATES['no_antennas_dir'])
         return errors
     
     print(PROGRESS_TEMPLATES['directory_naming'])
     
-    try:
-        for item in ANTENNAS_DIR.iterdir():
-            if item.is_dir():
-                if not SNAKE_CASE_PATTERN.match(item.name):
-                    errors.append(ERROR_TEMPLATES['directory_naming'].format(name=item.name))
-                    print(f"  ❌ {item.name}: Invalid naming convention")
-                else:
-                    print(PROGRESS_TEMPLATES['valid_directory'].format(name=item.name))
-    except OSError as e:
+    for e in snapshot.scan_errors:
         error_msg = f"❌ Error accessing antennas directory: {e}"
         errors.append(error_msg)
         print(error_msg)
     
+    errors.extend(snapshot.run_per_antenna('directory_naming', check_antenna_directory_naming))
+    
     return errors
 
 def main():
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Find duplicate and near-duplicate images across antenna directories.
+Every image gets a perceptual difference hash (dHash), which survives re-encoding
+and downscaling. Hashes are kept in a persistent index keyed by the SHA-256 of file
+contents, and similar hashes are looked up with multi-index hashing instead of
+comparing every pair of images. Requires Pillow.
+"""
+
+import hashlib
+import io
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Generic, Iterator, List, NamedTuple, Optional, Tuple, TypeVar
+
+# Import configuration
+try:
+    from config import (
+        ANTENNAS_DIR, ALLOWED_IMAGE_EXTENSIONS, IMAGES_DIR_NAME,
+        IMAGE_HASH_INDEX_FILE, IMAGE_HASH_SIZE, IMAGE_DUPLICATE_MAX_DISTANCE,
+        ERROR_TEMPLATES, SUCCESS_TEMPLATES, PROGRESS_TEMPLATES
+    )
+    from catalog import CatalogEntry, CatalogSnapshot
+except ImportError:
+    print("❌ Error: Could not import configuration file")
+    sys.exit(1)
+
+# Without Pillow the stage is skipped with a warning
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Bump when the hash computation changes to rebuild the index
+INDEX_FORMAT_VERSION = 1
+
+def difference_hash(image: "Image.Image", size: int = IMAGE_HASH_SIZE) -> int:
+    """
+    Compute the difference hash of an image.
+
+    The image is reduced to a (size + 1) x size grayscale thumbnail and every bit
+    tells whether a pixel is brighter than its right neighbour.
+    """
+    # Let JPEG decoding downscale on the fly, the thumbnail needs only a few pixels
+    image.draft('L', (size * 4, size * 4))
+    pixels = image.convert('L').resize((size + 1, size), Image.Resampling.LANCZOS).tobytes()
+
+    value = 0
+    for row in range(size):
+        offset = row * (size + 1)
+        for column in range(size):
+            value = (value << 1) | (pixels[offset + column] > pixels[offset + column + 1])
+    return value
+
+def hamming_distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+T = TypeVar('T')
+
+class MultiIndexHash(Generic[T]):
+    """
+    Multi-index hashing of fixed-width hashes for Hamming radius queries.
+
+    Hashes are split into radius + 1 chunks, each with its own lookup table. Two hashes
+    within the radius differ in at most `radius` bits, so by the pigeonhole principle
+    at least one chunk is equal and only items sharing a chunk have to be compared.
+    """
+
+    def __init__(self, bits: int, radius: int):
+        self.radius = radius
+        count = min(radius + 1, bits)
+        widths = [bits // count + (1 if index < bits % count else 0) for index in range(count)]
+        # (shift, mask) of every chunk
+        self._chunks = []
+        shift = 0
+        for width in widths:
+            self._chunks.append((shift, (1 << width) - 1))
+            shift += width
+        self._tables: List[Dict[int, List[int]]] = [{} for _ in widths]
+        self._values: List[int] = []
+        self._items: List[T] = []
+
+    def add(self, value: int, item: T):
+        position = len(self._values)
+        self._values.append(value)
+        self._items.append(item)
+        for table, (shift, mask) in zip(self._tables, self._chunks):
+            table.setdefault((value >> shift) & mask, []).append(position)
+
+    def search(self, value: int) -> Iterator[Tuple[int, T]]:
+        """Yield (distance, item) of all items within the radius of a hash."""
+        seen = set()
+        for table, (shift, mask) in zip(self._tables, self._chunks):
+            for position in table.get((value >> shift) & mask, ()):
+                if position in seen:
+                    continue
+                seen.add(position)
+                distance = hamming_distance(value, self._values[position])
+                if distance <= self.radius:
+                    yield distance, self._items[position]
+
+class Duplicate(NamedTuple):
+    """An image looking like an image of another antenna."""
+    path: Path
+    other: Path
+    distance: int
+
+def antenna_of(path: Path) -> str:
+    return path.relative_to(ANTENNAS_DIR).parts[0]
+
+def find_duplicates(hashes: Dict[Path, int], max_distance: int = IMAGE_DUPLICATE_MAX_DISTANCE) -> List[Duplicate]:
+    """
+    Find images similar to an image of another antenna.
+
+    Images are indexed in path order and each one is reported once,
+    against its closest match among the images inserted before it. Similar images
+    within one antenna (e.g. an old and a new measurement) are expected and ignored.
+    """
+    table: MultiIndexHash[Path] = MultiIndexHash(IMAGE_HASH_SIZE ** 2, max_distance)
+    duplicates = []
+    for path in sorted(hashes):
+        antenna = antenna_of(path)
+        matches = [(distance, other) for distance, other in table.search(hashes[path])
+                   if antenna_of(other) != antenna]
+        if matches:
+            distance, other = min(matches)
+            duplicates.append(Duplicate(path, other, distance))
+        table.add(hashes[path], path)
+    return duplicates
+
+class ImageHashIndex:
+    """
+    Persistent difference hashes of image contents.
+
+    Hashes are keyed by the SHA-256 of file contents, so renamed or copied files
+    aren't decoded again. The SHA-256 of a file is memoized by path, size and mtime
+    (by git object id for files of a git revision), so unchanged files aren't read at
+    all. Entries not used by a run are dropped on save.
+    """
+
+    def __init__(self, path: Path = IMAGE_HASH_INDEX_FILE, hash_size: int = IMAGE_HASH_SIZE):
+        self.path = Path(path)
+        self.hash_size = hash_size
+        self.decoded = 0
+        # file key (see file_key()) -> {'size': ..., 'mtime_ns': ..., 'sha256': ...}
+        self._files: Dict[str, dict] = {}
+        # SHA-256 -> difference hash in hex (None if the file isn't a decodable image)
+        self._hashes: Dict[str, Optional[str]] = {}
+        self._used_files: Dict[str, dict] = {}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if (not isinstance(data, dict) or data.get('format_version') != INDEX_FORMAT_VERSION
+                or data.get('hash_size') != self.hash_size):
+            return
+        self._files = data.get('files', {})
+        self._hashes = data.get('hashes', {})
+
+    def _known_sha256(self, key: str, stat: os.stat_result) -> Optional[str]:
+        known = self._files.get(key)
+        if known and known['size'] == stat.st_size and known['mtime_ns'] == stat.st_mtime_ns:
+            return known['sha256']
+        return None
+
+    def _record(self, key: str, stat: os.stat_result, sha256: str, value: Optional[str]):
+        self._used_files[key] = {
+            'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': sha256
+        }
+        self._hashes[sha256] = value
+
+    def lookup(self, key: str, stat: os.stat_result) -> Tuple[bool, Optional[int]]:
+        """
+        Return the hash of an unchanged file from the index.
+
+        Returns:
+            (found, hash) where hash is None for files that aren't decodable images
+        """
+        sha256 = self._known_sha256(key, stat)
+        if sha256 is None or sha256 not in self._hashes:
+            return False, None
+        self._record(key, stat, sha256, self._hashes[sha256])
+        value = self._hashes[sha256]
+        return True, None if value is None else int(value, 16)
+
+    def compute(self, data: bytes) -> Tuple[str, Optional[str]]:
+        """Return SHA-256 and hex difference hash of file contents, decoding only unknown contents."""
+        sha256 = hashlib.sha256(data).hexdigest()
+        if sha256 in self._hashes:
+            return sha256, self._hashes[sha256]
+        try:
+            with Image.open(io.BytesIO(data)) as image:
+                value = f"{difference_hash(image, self.hash_size):0{self.hash_size ** 2 // 4}x}"
+        except (OSError, ValueError, Image.DecompressionBombError):
+            # Broken images are reported by the image validation
+            value = None
+        return sha256, value
+
+    def store(self, key: str, stat: os.stat_result, sha256: str, value: Optional[str]):
+        """Record a computed hash (called from one thread only)."""
+        if sha256 not in self._hashes:
+            self.decoded += 1
+        self._record(key, stat, sha256, value)
+
+    def save(self):
+        """Atomically write the index, keeping only files and hashes seen by this run."""
+        used_hashes = {known['sha256'] for known in self._used_files.values()}
+        data = {
+            'format_version': INDEX_FORMAT_VERSION,
+            'hash_size': self.hash_size,
+            'files': self._used_files,
+            'hashes': {sha256: value for sha256, value in self._hashes.items() if sha256 in used_hashes}
+        }
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(temp_path, self.path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+def file_key(entry: CatalogEntry) -> str:
+    """Return the index key of a file: its path, or its object id in a git revision."""
+    return f"git:{entry.object_id}" if entry.object_id is not None else entry.path.as_posix()
+
+def image_entries(snapshot: CatalogSnapshot) -> List[CatalogEntry]:
+    """Return images in images/ directories of the selected antennas."""
+    images = []
+    for antenna in snapshot.antenna_dirs():
+        for entry in snapshot.children(antenna.path / IMAGES_DIR_NAME):
+            if entry.is_file and entry.path.suffix.lower() in ALLOWED_IMAGE_EXTENSIONS:
+                images.append(entry)
+    return images
+
+def unselected_antennas(snapshot: CatalogSnapshot) -> List[str]:
+    """Return names of antenna directories the snapshot doesn't select."""
+    selected = {antenna.name for antenna in snapshot.antenna_dirs()}
+    return [antenna.name for antenna in snapshot.all_antenna_dirs() if antenna.name not in selected]
+
+def hash_images(snapshot: CatalogSnapshot, index: ImageHashIndex) -> Dict[Path, int]:
+    """Return difference hashes of the selected images, decoding new contents in a thread pool."""
+    hashes = {}
+    pending = []
+    for entry in image_entries(snapshot):
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        found, value = index.lookup(file_key(entry), stat)
+        if not found:
+            pending.append((entry, stat))
+        elif value is not None:
+            hashes[entry.path] = value
+
+    def compute(item: Tuple[CatalogEntry, os.stat_result]) -> Optional[Tuple[str, Optional[str]]]:
+        entry, _ = item
+        try:
+            with snapshot.open_binary(entry.path) as f:
+                return index.compute(f.read())
+        except OSError:
+            return None
+
+    # Pillow releases the GIL while decoding
+    with ThreadPoolExecutor(max_workers=max(1, snapshot.jobs)) as executor:
+        for (entry, stat), result in zip(pending, executor.map(compute, pending)):
+            if result is None:
+                continue
+            sha256, value = result
+            index.store(file_key(entry), stat, sha256, value)
+            if value is not None:
+                hashes[entry.path] = int(value, 16)
+    return hashes
+
+def check_duplicate_images(snapshot: Optional[CatalogSnapshot] = None) -> List[str]:
+    """Check that no image is a (near-)duplicate of an image of another antenna."""
+    errors = []
+
+    if snapshot is None:
+        snapshot = CatalogSnapshot(ANTENNAS_DIR)
+
+    if not snapshot.antennas_dir_exists:
+        print(ERROR_TEMPLATES['no_antennas_dir'])
+        return errors
+
+    print(PROGRESS_TEMPLATES['image_duplicates'])
+
+    if Image is None:
+        print(ERROR_TEMPLATES['pillow_missing_duplicates'])
+        return errors
+
+    index = ImageHashIndex()
+    hashes = hash_images(snapshot, index)
+    selected = set(hashes)
+    others = unselected_antennas(snapshot)
+    if others:
+        # Compare with the rest of the catalog, hashing images the index doesn't know
+        rest = CatalogSnapshot(snapshot.antennas_dir, antenna_names=others, jobs=snapshot.jobs,
+                               storage=snapshot.storage)
+        hashes.update(hash_images(rest, index))
+    print(PROGRESS_TEMPLATES['hashed_images'].format(count=len(hashes), hashed=index.decoded))
+
+    for duplicate in find_duplicates(hashes):
+        # With a partial selection only report pairs involving a selected image
+        if duplicate.path not in selected and duplicate.other not in selected:
+            continue
+        error_msg = ERROR_TEMPLATES['duplicate_image'].format(
+            path=duplicate.path, other=duplicate.other, distance=duplicate.distance
+        )
+        errors.append(error_msg)
+        print(error_msg)
+
+    try:
+        index.save()
+    except OSError as e:
+        print(ERROR_TEMPLATES['image_hash_index_write_error'].format(path=index.path, error=e))
+
+    return errors
+
+def main():
+    """Main function."""
+    try:
+        errors = check_duplicate_images(CatalogSnapshot(ANTENNAS_DIR, jobs=os.cpu_count() or 1))
+
+        if errors:
+            print(f"\n❌ Duplicate image check failed!")
+            print(f"Total issues: {len(errors)}")
+            for error in errors:
+                print(f"  {error}")
+            sys.exit(1)
+        else:
+            print(f"\n{SUCCESS_TEMPLATES['image_duplicates']}")
+            sys.exit(0)
+    except Exception as e:
+        print(f"❌ Unexpected error in duplicate image check: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
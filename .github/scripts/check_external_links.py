@@ -0,0 +1,475 @@
+#!/usr/bin/env python3
+"""
+External link checker.
+Collects http(s) links from the root and antenna README.md files and checks that they
+are still alive. Links are checked concurrently with asyncio using a pool of keep-alive
+connections per host, HEAD requests with a GET fallback, and an on-disk result cache
+with a TTL so that repeated runs only check links that aren't fresh.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import ssl
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import quote, urljoin, urlsplit
+
+# Import configuration and utilities
+try:
+    from config import (
+        ANTENNAS_DIR, DETAILS_FILE_NAME, LINK_CHECK_CACHE_FILE, LINK_CHECK_CONCURRENCY,
+        LINK_CHECK_CONNECTIONS_PER_HOST, LINK_CHECK_FAILURE_TTL_SECONDS, LINK_CHECK_MAX_REDIRECTS,
+        LINK_CHECK_PROBE_HOSTS, LINK_CHECK_TIMEOUT_SECONDS, LINK_CHECK_TTL_SECONDS, LINK_CHECK_USER_AGENT
+    )
+    from messages import ERROR_TEMPLATES, SUCCESS_TEMPLATES, PROGRESS_TEMPLATES
+    from utils import extract_external_links
+    from catalog import CatalogSnapshot
+except ImportError as e:
+    print(f"❌ Error: Could not import required modules: {e}")
+    sys.exit(1)
+
+# Bump when the layout of the cache file changes
+CACHE_FORMAT_VERSION = 1
+
+# Link states
+LINK_OK = 'ok'
+# The page or the whole host is gone
+LINK_DEAD = 'dead'
+# Couldn't tell: bot protection (403, 429), server errors or network problems
+LINK_UNVERIFIED = 'unverified'
+
+DEAD_STATUSES = {404, 410}
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+# Responses without a body
+BODYLESS_STATUSES = {204, 304}
+# Small bodies (e.g. error pages) are read to keep the connection alive, larger ones close it
+MAX_DRAINED_BODY_BYTES = 64 * 1024
+
+# Characters left as is when quoting request targets (keeps already quoted URLs intact)
+SAFE_TARGET_CHARS = "/%:@!$&'()*+,;=?~-._"
+
+class LinkResult(NamedTuple):
+    """Outcome of a link check."""
+    state: str
+    # Final HTTP status after redirects, None if no response was received
+    status: Optional[int]
+    # Network error description, if any
+    error: Optional[str]
+    checked: float
+
+    @property
+    def reason(self) -> str:
+        return f"HTTP {self.status}" if self.status is not None else (self.error or "no response")
+
+def classify_status(status: int) -> str:
+    if status < 400:
+        return LINK_OK
+    return LINK_DEAD if status in DEAD_STATUSES else LINK_UNVERIFIED
+
+# (reader, writer) pair of an open connection
+Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+class HostPool:
+    """
+    Keep-alive HTTP/1.1 connections to a single host.
+
+    The pool size is also the number of requests sent to the host in parallel. A request
+    on a reused connection that the server has closed meanwhile is retried once on a new one.
+    """
+
+    def __init__(self, scheme: str, host: str, port: int, size: int, timeout: float,
+                 ssl_context: Optional[ssl.SSLContext]):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.ssl_context = ssl_context
+        self._slots = asyncio.Semaphore(size)
+        self._idle: List[Connection] = []
+
+    @property
+    def host_header(self) -> str:
+        default_port = 443 if self.scheme == 'https' else 80
+        return self.host if self.port == default_port else f"{self.host}:{self.port}"
+
+    async def _connect(self) -> Connection:
+        use_tls = self.scheme == 'https'
+        return await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, ssl=self.ssl_context if use_tls else None,
+                                    server_hostname=self.host if use_tls else None),
+            self.timeout
+        )
+
+    async def request(self, method: str, target: str) -> Tuple[int, Dict[str, str]]:
+        """Send a request and return the response status and headers (the body isn't returned)."""
+        async with self._slots:
+            reused = bool(self._idle)
+            connection = self._idle.pop() if reused else await self._connect()
+            try:
+                try:
+                    status, headers, reusable = await asyncio.wait_for(
+                        self._exchange(connection, method, target), self.timeout
+                    )
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    if not reused:
+                        raise
+                    _close(connection)
+                    connection = await self._connect()
+                    status, headers, reusable = await asyncio.wait_for(
+                        self._exchange(connection, method, target), self.timeout
+                    )
+            except BaseException:
+                _close(connection)
+                raise
+
+            if reusable:
+                self._idle.append(connection)
+            else:
+                _close(connection)
+            return status, headers
+
+    async def _exchange(self, connection: Connection, method: str, target: str) -> Tuple[int, Dict[str, str], bool]:
+        reader, writer = connection
+        writer.write((
+            f"{method} {target} HTTP/1.1\r\n"
+            f"Host: {self.host_header}\r\n"
+            f"User-Agent: {LINK_CHECK_USER_AGENT}\r\n"
+            "Accept: */*\r\n"
+            "Connection: keep-alive\r\n"
+            "\r\n"
+        ).encode('latin-1'))
+        await writer.drain()
+
+        # Skip informational responses (100 Continue, 103 Early Hints)
+        while True:
+            status_line = await reader.readline()
+            if not status_line:
+                raise ConnectionResetError("connection closed by server")
+            version, status = _parse_status_line(status_line)
+            headers = await _read_headers(reader)
+            if status >= 200:
+                break
+
+        reusable = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+        if method == 'HEAD' or status in BODYLESS_STATUSES:
+            return status, headers, reusable
+
+        length = headers.get('content-length')
+        if reusable and length is not None and length.isdigit() and int(length) <= MAX_DRAINED_BODY_BYTES:
+            await reader.readexactly(int(length))
+            return status, headers, True
+        # Don't download pages (or chunked bodies) just to reuse the connection
+        return status, headers, False
+
+    def close(self):
+        while self._idle:
+            _close(self._idle.pop())
+
+def _parse_status_line(line: bytes) -> Tuple[str, int]:
+    parts = line.decode('latin-1').split(None, 2)
+    if len(parts) < 2 or not parts[0].startswith('HTTP/') or not parts[1].isdigit():
+        raise ConnectionError(f"invalid HTTP status line: {line[:80]!r}")
+    return parts[0], int(parts[1])
+
+async def _read_headers(reader: asyncio.StreamReader) -> Dict[str, str]:
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            return headers
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+def _close(connection: Connection):
+    connection[1].close()
+
+def request_target(url: str) -> str:
+    """Return the quoted path and query of a URL for the request line."""
+    parts = urlsplit(url)
+    target = parts.path or '/'
+    if parts.query:
+        target += '?' + parts.query
+    return quote(target, safe=SAFE_TARGET_CHARS)
+
+def describe_error(error: BaseException) -> str:
+    if isinstance(error, socket.gaierror):
+        return "host not found"
+    if isinstance(error, asyncio.TimeoutError):
+        return "timed out"
+    if isinstance(error, ssl.SSLError):
+        return f"TLS error: {error.reason or error}"
+    return str(error) or type(error).__name__
+
+class LinkChecker:
+    """Checks URLs concurrently, sharing one connection pool per host."""
+
+    def __init__(self, concurrency: int = LINK_CHECK_CONCURRENCY,
+                 connections_per_host: int = LINK_CHECK_CONNECTIONS_PER_HOST,
+                 timeout: float = LINK_CHECK_TIMEOUT_SECONDS, max_redirects: int = LINK_CHECK_MAX_REDIRECTS):
+        self.connections_per_host = connections_per_host
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        self.ssl_context = ssl.create_default_context()
+        self._limit = asyncio.Semaphore(concurrency)
+        self._pools: Dict[Tuple[str, str, int], HostPool] = {}
+
+    def _pool(self, url: str) -> HostPool:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError(f"unsupported URL '{url}'")
+        port = parts.port or (443 if scheme == 'https' else 80)
+        key = (scheme, parts.hostname.lower(), port)
+        if key not in self._pools:
+            self._pools[key] = HostPool(scheme, key[1], port, self.connections_per_host, self.timeout,
+                                        self.ssl_context)
+        return self._pools[key]
+
+    async def _final_status(self, url: str) -> int:
+        """Follow redirects and return the final status, trying GET when HEAD fails."""
+        status = 0
+        for _ in range(self.max_redirects + 1):
+            pool = self._pool(url)
+            target = request_target(url)
+            status, headers = await pool.request('HEAD', target)
+            # HEAD is often unsupported or blocked, the page may still be fine
+            if status >= 400:
+                status, headers = await pool.request('GET', target)
+            if status not in REDIRECT_STATUSES or 'location' not in headers:
+                return status
+            url = urljoin(url, headers['location'])
+        return status
+
+    async def check(self, url: str) -> LinkResult:
+        async with self._limit:
+            try:
+                status = await self._final_status(url)
+            except socket.gaierror as e:
+                return LinkResult(LINK_DEAD, None, describe_error(e), time.time())
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as e:
+                return LinkResult(LINK_UNVERIFIED, None, describe_error(e), time.time())
+            return LinkResult(classify_status(status), status, None, time.time())
+
+    def close(self):
+        for pool in self._pools.values():
+            pool.close()
+
+def interleave_by_host(urls: List[str]) -> List[str]:
+    """Order URLs round-robin over hosts so early requests are spread across hosts."""
+    by_host: Dict[str, List[str]] = {}
+    for url in dict.fromkeys(urls):
+        by_host.setdefault(urlsplit(url).netloc.lower(), []).append(url)
+    groups = list(by_host.values())
+    ordered = []
+    for index in range(max((len(group) for group in groups), default=0)):
+        ordered.extend(group[index] for group in groups if index < len(group))
+    return ordered
+
+def check_urls(urls: List[str], **options) -> Dict[str, LinkResult]:
+    """
+    Check URLs and return results by URL.
+
+    Options are passed to LinkChecker (concurrency, connections_per_host, timeout, max_redirects).
+    """
+    async def run() -> List[LinkResult]:
+        checker = LinkChecker(**options)
+        try:
+            return await asyncio.gather(*(checker.check(url) for url in ordered))
+        finally:
+            checker.close()
+
+    ordered = interleave_by_host(urls)
+    if not ordered:
+        return {}
+    return dict(zip(ordered, asyncio.run(run())))
+
+class LinkCache:
+    """On-disk link check results; working links and failures expire after different TTLs."""
+
+    def __init__(self, path: Path = LINK_CHECK_CACHE_FILE, ttl: float = LINK_CHECK_TTL_SECONDS,
+                 failure_ttl: float = LINK_CHECK_FAILURE_TTL_SECONDS):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        self._results: Dict[str, LinkResult] = {}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get('format_version') != CACHE_FORMAT_VERSION:
+            return
+        for url, record in data.get('links', {}).items():
+            try:
+                self._results[url] = LinkResult(**record)
+            except TypeError:
+                continue
+
+    def is_fresh(self, result: LinkResult, now: float) -> bool:
+        ttl = self.ttl if result.state == LINK_OK else self.failure_ttl
+        return now - result.checked < ttl
+
+    def get(self, url: str, now: Optional[float] = None) -> Optional[LinkResult]:
+        """Return the cached result of a URL if it's still fresh."""
+        result = self._results.get(url)
+        if result is None or not self.is_fresh(result, time.time() if now is None else now):
+            return None
+        return result
+
+    def put(self, url: str, result: LinkResult):
+        self._results[url] = result
+
+    def answered_hosts(self) -> List[str]:
+        """Return hosts that sent a response in any recorded check, expired ones included."""
+        hosts = (urlsplit(url).hostname for url, result in self._results.items() if result.status is not None)
+        return list(dict.fromkeys(host for host in hosts if host))
+
+    def save(self):
+        """Drop expired results and atomically write the cache file."""
+        now = time.time()
+        data = {
+            'format_version': CACHE_FORMAT_VERSION,
+            'links': {url: result._asdict() for url, result in self._results.items() if self.is_fresh(result, now)}
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=1)
+            os.replace(temp_path, self.path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+def network_available(hosts: List[str]) -> bool:
+    """Check whether any of the hosts resolves, i.e. name resolution works at all."""
+    for host in hosts:
+        try:
+            socket.getaddrinfo(host, None)
+        except (OSError, UnicodeError):
+            continue
+        return True
+    return False
+
+def collect_external_links(snapshot: CatalogSnapshot) -> Dict[str, List[Path]]:
+    """Return external URLs of the root README.md and selected antenna README.md files with their sources."""
+    readmes = [Path(DETAILS_FILE_NAME)]
+    readmes.extend(antenna.path / DETAILS_FILE_NAME for antenna in snapshot.antenna_dirs())
+
+    links: Dict[str, List[Path]] = {}
+    for readme in readmes:
+        if not snapshot.exists(readme):
+            continue
+        try:
+            content = snapshot.read_text(readme)
+        except (OSError, UnicodeDecodeError):
+            # Unreadable files are reported by the structure validators
+            continue
+        for url in extract_external_links(content):
+            links.setdefault(url, []).append(readme)
+    return links
+
+def check_external_links(snapshot: Optional[CatalogSnapshot] = None, refresh: bool = False) -> List[str]:
+    """
+    Check external links of README.md files.
+
+    Dead links (404/410 responses, unknown hosts) are errors. Links that couldn't be
+    verified (bot protection, server errors, timeouts) are only reported as warnings,
+    as are checked links when no host answered and no host known to work (see
+    network_available()) resolves either (no network access).
+
+    Args:
+        snapshot: Catalog snapshot to validate, a fresh one is taken if omitted
+        refresh: Check all links, ignoring cached results
+
+    Returns:
+        List of error messages
+    """
+    errors = []
+
+    if snapshot is None:
+        snapshot = CatalogSnapshot(ANTENNAS_DIR)
+
+    print(PROGRESS_TEMPLATES['external_links'])
+
+    links = collect_external_links(snapshot)
+    cache = LinkCache()
+    now = time.time()
+    results = {} if refresh else {url: cache.get(url, now) for url in links}
+    pending = [url for url in links if results.get(url) is None]
+
+    print(PROGRESS_TEMPLATES['checking_links'].format(
+        count=len(pending), hosts=len({urlsplit(url).netloc.lower() for url in pending}),
+        cached=len(links) - len(pending)
+    ))
+    checked = check_urls(pending)
+    checked_hosts = {urlsplit(url).hostname for url in checked}
+    # When no checked host answered, unknown hosts only mean dead links if other hosts still resolve
+    offline = (
+        bool(checked) and all(result.status is None for result in checked.values())
+        and not network_available([host for host in cache.answered_hosts() if host not in checked_hosts]
+                                  + list(LINK_CHECK_PROBE_HOSTS))
+    )
+    if offline:
+        print(ERROR_TEMPLATES['links_offline'].format(count=len(checked)))
+    for url, result in checked.items():
+        if offline:
+            # Reported as unverified and not cached, so the links are checked again next time
+            results[url] = LinkResult(LINK_UNVERIFIED, None, "no network access", result.checked)
+            continue
+        results[url] = result
+        cache.put(url, result)
+
+    try:
+        cache.save()
+    except OSError as e:
+        print(ERROR_TEMPLATES['link_cache_write_error'].format(path=cache.path, error=e))
+
+    for url, sources in links.items():
+        result = results[url]
+        for source in sources:
+            if result.state == LINK_DEAD:
+                errors.append(ERROR_TEMPLATES['dead_external_link'].format(
+                    url=url, path=source.as_posix(), reason=result.reason
+                ))
+            elif result.state == LINK_UNVERIFIED:
+                print(ERROR_TEMPLATES['unverified_external_link'].format(
+                    url=url, path=source.as_posix(), reason=result.reason
+                ))
+        if result.state == LINK_OK:
+            print(PROGRESS_TEMPLATES['valid_link'].format(url=url, reason=result.reason))
+
+    return errors
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Check external links of README.md files.")
+    parser.add_argument('--refresh', action='store_true', help="check all links, ignoring cached results")
+    args = parser.parse_args()
+
+    try:
+        errors = check_external_links(refresh=args.refresh)
+
+        if errors:
+            print(f"\n❌ External link check failed!")
+            print(f"Total issues: {len(errors)}")
+            for error in errors:
+                print(f"  {error}")
+            sys.exit(1)
+        else:
+            print(f"\n{SUCCESS_TEMPLATES['external_links']}")
+            sys.exit(0)
+    except Exception as e:
+        print(f"❌ Unexpected error in external link check: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ Ensures no files exceed the configured size limit.
 
 import sys
 from pathlib import Path
+from typing import List, Optional
 
 # Import configuration
 try:
@@ -13,43 +14,65 @@ try:
         ANTENNAS_DIR, MAX_FILE_SIZE_BYTES, MAX_FILE_SIZE_KB,
         ERROR_TEMPLATES, SUCCESS_TEMPLATES, PROGRESS_TEMPLATES
     )
+    from catalog import CatalogEntry, CatalogSnapshot
 except ImportError:
     print("❌ Error: Could not import configuration file")
     sys.exit(1)
 
-def check_file_sizes():
+def check_file_size(entry: CatalogEntry) -> List[str]:
+    """Check that a single file doesn't exceed the size limit."""
+    errors = []
+    file_path = entry.path
+    
+    try:
+        file_size = entry.size
+        if file_size > MAX_FILE_SIZE_BYTES:
+            errors.append(ERROR_TEMPLATES['file_size_exceeded'].format(
+                path=file_path, size=file_size/1024, max_size=MAX_FILE_SIZE_KB
+            ))
+            print(f"  ❌ {file_path}: {file_size/1024:.1f}KB (exceeds limit)")
+        else:
+            print(PROGRESS_TEMPLATES['valid_file_size'].format(
+                path=file_path, size=file_size/1024
+            ))
+    except OSError as e:
+        error_msg = ERROR_TEMPLATES['file_access_error'].format(path=file_path, error=str(e))
+        errors.append(error_msg)
+        print(f"  ❌ {file_path}: Access error")
+    
+    return errors
+
+def check_antenna_file_sizes(snapshot: CatalogSnapshot, antenna: CatalogEntry) -> List[str]:
+    """Check sizes of all files in a single antenna directory."""
+    errors = []
+    for entry in snapshot.files(antenna.path):
+        errors.extend(check_file_size(entry))
+    return errors
+
+def check_file_sizes(snapshot: Optional[CatalogSnapshot] = None):
     """Check that no files in antennas subdirectories exceed the size limit."""
     errors = []
     
-    if not ANTENNAS_DIR.exists():
+    if snapshot is None:
+        snapshot = CatalogSnapshot(ANTENNAS_DIR)
+    
+    if not snapshot.antennas_dir_exists:
         print(ERROR_TEMPLATES['no_antennas_dir'])
         return errors
     
     print(PROGRESS_TEMPLATES['file_sizes'])
     
-    try:
-        for file_path in ANTENNAS_DIR.rglob('*'):
-            if file_path.is_file():
-                try:
-                    file_size = file_path.stat().st_size
-                    if file_size > MAX_FILE_SIZE_BYTES:
-                        errors.append(ERROR_TEMPLATES['file_size_exceeded'].format(
-                            path=file_path, size=file_size/1024, max_size=MAX_FILE_SIZE_KB
-                        ))
-                        print(f"  ❌ {file_path}: {file_size/1024:.1f}KB (exceeds limit)")
-                    else:
-                        print(PROGRESS_TEMPLATES['valid_file_size'].format(
-                            path=file_path, size=file_size/1024
-                        ))
-                except OSError as e:
-                    error_msg = ERROR_TEMPLATES['file_access_error'].format(path=file_path, error=str(e))
-                    errors.append(error_msg)
-                    print(f"  ❌ {file_path}: Access error")
-    except OSError as e:
+    for e in snapshot.scan_errors:
         error_msg = f"❌ Error traversing antennas directory: {e}"
         errors.append(error_msg)
         print(error_msg)
     
+    # Files placed directly in antennas/ don't belong to any antenna
+    for entry in snapshot.loose_files():
+        errors.extend(check_file_size(entry))
+    
+    errors.extend(snapshot.run_per_antenna('file_sizes', check_antenna_file_sizes))
+    
     return errors
 
 def main():
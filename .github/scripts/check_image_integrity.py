@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Integrity check of image files in antenna directories.
+Catches truncated and corrupted uploads that still have a valid header: PNG chunks
+are walked and their CRCs verified up to IEND, JPEG segments and scans are walked up
+to the EOI marker and WebP chunks are checked against the RIFF length. Files are
+memory-mapped and no pixels are decoded.
+"""
+
+import os
+import struct
+import sys
+import zlib
+from typing import List, Optional
+
+# Import configuration
+try:
+    from config import (
+        ANTENNAS_DIR, ALLOWED_IMAGE_EXTENSIONS,
+        ERROR_TEMPLATES, SUCCESS_TEMPLATES, PROGRESS_TEMPLATES
+    )
+    from catalog import CatalogEntry, CatalogSnapshot
+    from image_headers import (
+        HEADER_SIZE, JPEG_EOI, JPEG_SOS, JPEG_STANDALONE_MARKERS, PNG_SIGNATURE, detect_format, jpeg_scan_end
+    )
+    from storage import Buffer
+except ImportError:
+    print("❌ Error: Could not import configuration file")
+    sys.exit(1)
+
+# Chunk lengths above 2^31 - 1 are invalid in PNG
+PNG_MAX_CHUNK_LENGTH = 2 ** 31 - 1
+PNG_IEND = b'IEND'
+
+def check_png(data: Buffer) -> Optional[str]:
+    """
+    Walk PNG chunks up to IEND and verify their lengths and CRCs.
+
+    Returns:
+        Description of the first problem, or None if the file is intact
+    """
+    size = len(data)
+    position = len(PNG_SIGNATURE)
+    with memoryview(data) as view:
+        while position + 8 <= size:
+            length, chunk_type = struct.unpack_from('>I4s', data, position)
+            name = chunk_type.decode('latin-1')
+            if length > PNG_MAX_CHUNK_LENGTH:
+                return f"invalid length of the '{name}' chunk at offset {position}"
+            end = position + 8 + length
+            if end + 4 > size:
+                return f"file ends inside the '{name}' chunk at offset {position}"
+            # CRC covers the chunk type and data
+            with view[position + 4:end] as chunk:
+                crc = zlib.crc32(chunk)
+            if crc != struct.unpack_from('>I', data, end)[0]:
+                return f"CRC mismatch of the '{name}' chunk at offset {position}"
+            if chunk_type == PNG_IEND:
+                return None
+            position = end + 4
+    return "file ends before the IEND chunk"
+
+def check_jpeg(data: Buffer) -> Optional[str]:
+    """
+    Walk JPEG segments and entropy-coded scans up to the EOI marker.
+
+    Returns:
+        Description of the first problem, or None if the file is intact
+    """
+    size = len(data)
+    position = 2
+    while True:
+        if position + 2 > size:
+            return "file ends before the EOI marker"
+        if data[position] != 0xFF:
+            return f"expected a marker at offset {position}"
+        marker = data[position + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            position += 1
+            continue
+        if marker == JPEG_EOI:
+            return None
+        if marker in JPEG_STANDALONE_MARKERS:
+            position += 2
+            continue
+
+        if position + 4 > size:
+            return f"file ends inside the 0x{marker:02X} segment at offset {position}"
+        length = struct.unpack_from('>H', data, position + 2)[0]
+        if length < 2:
+            return f"invalid length of the 0x{marker:02X} segment at offset {position}"
+        if position + 2 + length > size:
+            return f"file ends inside the 0x{marker:02X} segment at offset {position}"
+        position += 2 + length
+
+        if marker == JPEG_SOS:
+            position = jpeg_scan_end(data, position)
+            if position is None:
+                return "file ends inside scan data before the EOI marker"
+
+def check_webp(data: Buffer) -> Optional[str]:
+    """
+    Check the RIFF length of a WebP file and that its chunks fit into it.
+
+    Returns:
+        Description of the first problem, or None if the file is intact
+    """
+    size = len(data)
+    if size < 12:
+        return "file ends inside the RIFF header"
+    end = 8 + struct.unpack_from('<I', data, 4)[0]
+    if end > size:
+        return f"RIFF header declares {end} bytes, but the file has {size}"
+
+    position = 12
+    while position < end:
+        if position + 8 > end:
+            return f"RIFF data ends inside a chunk header at offset {position}"
+        chunk_type, length = struct.unpack_from('<4sI', data, position)
+        chunk_end = position + 8 + length
+        if chunk_end > end:
+            return f"'{chunk_type.decode('latin-1')}' chunk at offset {position} exceeds the RIFF length"
+        # Chunks are padded to an even size
+        position = chunk_end + (length & 1)
+    return None
+
+# Detected format -> integrity check
+INTEGRITY_CHECKS = {
+    'png': check_png,
+    'jpeg': check_jpeg,
+    'webp': check_webp,
+}
+
+def check_image_file(snapshot: CatalogSnapshot, entry: CatalogEntry) -> List[str]:
+    """Check the integrity of a single image file."""
+    errors = []
+    try:
+        with snapshot.map_file(entry.path) as data:
+            check = INTEGRITY_CHECKS.get(detect_format(data[:HEADER_SIZE]))
+            # Unrecognized and unsupported formats are reported by the image validation
+            problem = check(data) if check else None
+    except (OSError, ValueError) as e:
+        errors.append(ERROR_TEMPLATES['image_read_error'].format(path=entry.path, error=e))
+        print(f"  ❌ {entry.path}: Could not read image")
+        return errors
+
+    if problem:
+        errors.append(ERROR_TEMPLATES['image_corrupt'].format(path=entry.path, problem=problem))
+        print(f"  ❌ {entry.path}: {problem}")
+    return errors
+
+def check_antenna_images(snapshot: CatalogSnapshot, antenna: CatalogEntry) -> List[str]:
+    """Check the integrity of all images in a single antenna directory."""
+    errors = []
+    for entry in snapshot.files(antenna.path):
+        if entry.path.suffix.lower() in ALLOWED_IMAGE_EXTENSIONS:
+            errors.extend(check_image_file(snapshot, entry))
+    return errors
+
+def check_image_integrity(snapshot: Optional[CatalogSnapshot] = None) -> List[str]:
+    """Check that images in antenna directories are complete and not corrupted."""
+    errors = []
+
+    if snapshot is None:
+        snapshot = CatalogSnapshot(ANTENNAS_DIR)
+
+    if not snapshot.antennas_dir_exists:
+        print(ERROR_TEMPLATES['no_antennas_dir'])
+        return errors
+
+    print(PROGRESS_TEMPLATES['image_integrity'])
+
+    errors.extend(snapshot.run_per_antenna('image_integrity', check_antenna_images))
+
+    return errors
+
+def main():
+    """Main function."""
+    try:
+        # Mapped files are walked by worker threads, CRCs are computed without the GIL
+        errors = check_image_integrity(CatalogSnapshot(ANTENNAS_DIR, jobs=os.cpu_count() or 1))
+
+        if errors:
+            print(f"\n❌ Image integrity check failed!")
+            print(f"Total issues: {len(errors)}")
+            for error in errors:
+                print(f"  {error}")
+            sys.exit(1)
+        else:
+            print(f"\n{SUCCESS_TEMPLATES['image_integrity']}")
+            sys.exit(0)
+    except Exception as e:
+        print(f"❌ Unexpected error in image integrity check: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
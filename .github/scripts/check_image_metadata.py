@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Check that images in antenna directories carry no metadata.
+Phone photos often contain EXIF blocks with GPS coordinates and thumbnails, and
+screenshots text chunks; they leak contributor details and take space of the file
+size budget. Images are memory-mapped and only their segment and chunk headers are read.
+"""
+
+import os
+import sys
+from typing import List, Optional
+
+# Import configuration
+try:
+    from config import (
+        ANTENNAS_DIR, ALLOWED_IMAGE_EXTENSIONS,
+        ERROR_TEMPLATES, SUCCESS_TEMPLATES, PROGRESS_TEMPLATES
+    )
+    from catalog import CatalogEntry, CatalogSnapshot
+    from image_metadata import plan_strip
+except ImportError:
+    print("❌ Error: Could not import configuration file")
+    sys.exit(1)
+
+def check_image_file(snapshot: CatalogSnapshot, entry: CatalogEntry) -> List[str]:
+    """Check a single image for metadata that strip_image_metadata.py would remove."""
+    errors = []
+    try:
+        with snapshot.map_file(entry.path) as data:
+            plan = plan_strip(data)
+            size = len(data)
+    except (OSError, ValueError) as e:
+        errors.append(ERROR_TEMPLATES['image_read_error'].format(path=entry.path, error=e))
+        print(f"  ❌ {entry.path}: Could not read image")
+        return errors
+
+    # Unsupported and malformed images are reported by the image and integrity validations
+    if plan is not None and plan.removed:
+        metadata = ', '.join(plan.removed)
+        errors.append(ERROR_TEMPLATES['image_metadata'].format(
+            path=entry.path, metadata=metadata, size=(size - plan.size) / 1024
+        ))
+        print(f"  ❌ {entry.path}: Contains {metadata}")
+    return errors
+
+def check_antenna_images(snapshot: CatalogSnapshot, antenna: CatalogEntry) -> List[str]:
+    """Check all images in a single antenna directory for metadata."""
+    errors = []
+    for entry in snapshot.files(antenna.path):
+        if entry.path.suffix.lower() in ALLOWED_IMAGE_EXTENSIONS:
+            errors.extend(check_image_file(snapshot, entry))
+    return errors
+
+def check_image_metadata(snapshot: Optional[CatalogSnapshot] = None) -> List[str]:
+    """Check that images in antenna directories contain no EXIF, GPS, XMP or other metadata."""
+    errors = []
+
+    if snapshot is None:
+        snapshot = CatalogSnapshot(ANTENNAS_DIR)
+
+    if not snapshot.antennas_dir_exists:
+        print(ERROR_TEMPLATES['no_antennas_dir'])
+        return errors
+
+    print(PROGRESS_TEMPLATES['image_metadata'])
+
+    errors.extend(snapshot.run_per_antenna('image_metadata', check_antenna_images))
+
+    return errors
+
+def main():
+    """Main function."""
+    try:
+        errors = check_image_metadata(CatalogSnapshot(ANTENNAS_DIR, jobs=os.cpu_count() or 1))
+
+        if errors:
+            print(f"\n❌ Image metadata check failed!")
+            print(f"Total issues: {len(errors)}")
+            for error in errors:
+                print(f"  {error}")
+            sys.exit(1)
+        else:
+            print(f"\n{SUCCESS_TEMPLATES['image_metadata']}")
+            sys.exit(0)
+    except Exception as e:
+        print(f"❌ Unexpected error in image metadata check: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
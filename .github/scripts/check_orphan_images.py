@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Find images that no README.md references and images of the root README.md that don't exist.
+Image references of the root and all antenna README.md files are collected into one
+reverse index (image path -> references), so unreferenced files in 'images/'
+directories and references to missing files are found with set differences against
+the file listing of the catalog snapshot.
+"""
+
+import sys
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# Import configuration and utilities
+try:
+    from config import ANTENNAS_DIR, DETAILS_FILE_NAME, IMAGES_DIR_NAME
+    from messages import ERROR_TEMPLATES, SUCCESS_TEMPLATES, PROGRESS_TEMPLATES
+    from utils import ImageReference, ReferenceIndex
+    from catalog import CatalogSnapshot
+except ImportError as e:
+    print(f"❌ Error: Could not import required modules: {e}")
+    sys.exit(1)
+
+ROOT_README = Path(DETAILS_FILE_NAME)
+
+def image_files(snapshot: CatalogSnapshot) -> List[Path]:
+    """Return files of the 'images/' directories of the selected antennas."""
+    return [
+        entry.path
+        for antenna in snapshot.antenna_dirs()
+        for entry in snapshot.files(antenna.path / IMAGES_DIR_NAME)
+    ]
+
+def build_reference_index(snapshot: CatalogSnapshot) -> Tuple[ReferenceIndex, List[ImageReference]]:
+    """
+    Index image references of the root README.md and of all antenna README.md files.
+
+    Returns:
+        Tuple of (index, references of the root README.md)
+    """
+    index = ReferenceIndex()
+    root_references = []
+    readmes = [ROOT_README] + [antenna.path / DETAILS_FILE_NAME for antenna in snapshot.all_antenna_dirs()]
+    for readme in readmes:
+        if not snapshot.exists(readme):
+            continue
+        try:
+            references = index.add_readme(readme, snapshot.read_text(readme))
+        except (OSError, UnicodeDecodeError):
+            # Unreadable README.md files are reported by the README.md validation
+            continue
+        if readme == ROOT_README:
+            root_references = references
+    return index, root_references
+
+def check_orphan_images(snapshot: Optional[CatalogSnapshot] = None) -> List[str]:
+    """
+    Check that every file in antenna 'images/' directories is referenced by a README.md
+    and that images of the root README.md exist.
+
+    Missing images of antenna README.md files are reported by the README.md validation.
+    """
+    errors = []
+
+    if snapshot is None:
+        snapshot = CatalogSnapshot(ANTENNAS_DIR)
+
+    if not snapshot.antennas_dir_exists:
+        print(ERROR_TEMPLATES['no_antennas_dir'])
+        return errors
+
+    print(PROGRESS_TEMPLATES['image_orphans'])
+
+    index, root_references = build_reference_index(snapshot)
+
+    files = {entry.path for entry in snapshot.files()}
+    dangling = index.dangling(files, snapshot.exists)
+    for reference in root_references:
+        if reference.path is None or reference.path in dangling:
+            errors.append(ERROR_TEMPLATES['non_existing_root_image'].format(image=reference.link))
+            print(f"  ❌ {ROOT_README}: Missing image {reference.link}")
+
+    for path in index.orphans(image_files(snapshot)):
+        errors.append(ERROR_TEMPLATES['orphan_image'].format(path=path))
+        print(f"  ❌ {path}: Not referenced")
+
+    return errors
+
+def main():
+    """Main function."""
+    try:
+        errors = check_orphan_images()
+
+        if errors:
+            print(f"\n❌ Orphan image check failed!")
+            print(f"Total issues: {len(errors)}")
+            for error in errors:
+                print(f"  {error}")
+            sys.exit(1)
+        else:
+            print(f"\n{SUCCESS_TEMPLATES['image_orphans']}")
+            sys.exit(0)
+    except Exception as e:
+        print(f"❌ Unexpected error in orphan image check: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
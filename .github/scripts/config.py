@@ -9,16 +9,69 @@ from pathlib import Path
 
 # Directory structure configuration
 ANTENNAS_DIR = Path("antennas")
+SCRIPTS_DIR = Path(".github/scripts")
 MAX_FILE_SIZE_KB = 300
 MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_KB * 1024
+# Longest image side in pixels (CONTRIBUTING.md recommends 1280x720, 4:3 and portrait photos are fine)
+MAX_IMAGE_DIMENSION = 1280
+
+# Validation results cache
+CACHE_DIR = SCRIPTS_DIR / ".cache"
+VALIDATION_CACHE_FILE = CACHE_DIR / "validation_cache.json"
+VALIDATION_CACHE_MAX_ENTRIES = 20000
+VALIDATION_CACHE_MAX_FILE_HASHES = 200000
+
+# Watch mode (validate_all.py --watch)
+# Quiet period after the last file system event before re-validating (editors save in several steps)
+WATCH_DEBOUNCE_SECONDS = 0.05
+# Interval of the polling fallback when inotify isn't available
+WATCH_POLL_INTERVAL_SECONDS = 0.5
+
+# External link checker (validate_all.py --check-links)
+LINK_CHECK_CACHE_FILE = CACHE_DIR / "link_check.json"
+# Working links are rechecked after a week, failures after a few hours (marketplaces have outages)
+LINK_CHECK_TTL_SECONDS = 7 * 24 * 3600
+LINK_CHECK_FAILURE_TTL_SECONDS = 6 * 3600
+LINK_CHECK_TIMEOUT_SECONDS = 15
+LINK_CHECK_CONCURRENCY = 32
+# Keep-alive connections per host, also the number of parallel requests to one host
+LINK_CHECK_CONNECTIONS_PER_HOST = 2
+LINK_CHECK_MAX_REDIRECTS = 5
+LINK_CHECK_USER_AGENT = "Mozilla/5.0 (compatible; antenna-stats-link-checker)"
+# Resolved to tell a missing network from dead hosts when no checked host answers
+LINK_CHECK_PROBE_HOSTS = ("github.com",)
+
+# Measurement catalog index
+CATALOG_INDEX_DIR = CACHE_DIR / "catalog"
+
+# Root README.md generator
+README_BLOCKS_CACHE_FILE = CACHE_DIR / "readme_blocks.json"
+
+# Image optimizer
+OPTIMIZED_IMAGES_MANIFEST_FILE = CACHE_DIR / "optimized_images.json"
+# Lossy quality search range (CONTRIBUTING.md recommends ~80% for photos)
+IMAGE_QUALITY_MIN = 40
+IMAGE_QUALITY_MAX = 85
+
+# Image metadata stripping
+STRIPPED_IMAGES_MANIFEST_FILE = CACHE_DIR / "stripped_images.json"
+
+# Duplicate image detection
+IMAGE_HASH_INDEX_FILE = CACHE_DIR / "image_hashes.json"
+# Side of the difference hash grid, the hash has IMAGE_HASH_SIZE² bits
+IMAGE_HASH_SIZE = 16
+# Largest Hamming distance (of 256 bits) between images reported as duplicates:
+# re-encoded and downscaled copies differ by up to ~17 bits, distinct screenshots by 28+
+IMAGE_DUPLICATE_MAX_DISTANCE = 20
 
 # Required files and directories
 REQUIRED_FILES = ['README.md']
-ALLOWED_DIRECTORIES = ['images']
+ALLOWED_DIRECTORIES = ['images', 'data']
 
 # File names (for dynamic references)
 DETAILS_FILE_NAME = REQUIRED_FILES[0]
 IMAGES_DIR_NAME = ALLOWED_DIRECTORIES[0]
+DATA_DIR_NAME = ALLOWED_DIRECTORIES[1]
 
 # Naming conventions
 SNAKE_CASE_PATTERN = re.compile(r'^[a-z0-9_]+$')
@@ -27,6 +80,19 @@ SNAKE_CASE_PATTERN = re.compile(r'^[a-z0-9_]+$')
 ALLOWED_IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.webp', '.png'}
 ALL_IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.webp', '.png', '.gif', '.bmp', '.tiff', '.svg'}
 
+# Allowed measurement data file extensions (Touchstone 1-port sweeps)
+ALLOWED_DATA_EXTENSIONS = {'.s1p'}
+
+# Allowed difference between README.md measurements and the sweep at the same frequency
+SWEEP_SWR_TOLERANCE = 0.05  # relative
+SWEEP_IMPEDANCE_TOLERANCE = 0.05  # relative to |Z|
+SWEEP_IMPEDANCE_TOLERANCE_OHMS = 1.0  # but at least this much
+
+# Sweep analysis thresholds
+RESONANCE_MAX_SWR = 3.0  # lowest point of every region below this SWR is a resonance
+BANDWIDTH_MAX_SWR = 2.0
+BANDWIDTH_MIN_RETURN_LOSS_DB = 10.0
+
 # Dynamic image naming pattern based on allowed extensions
 allowed_extensions_str = '|'.join(ext[1:] for ext in ALLOWED_IMAGE_EXTENSIONS)
 IMAGE_NAMING_PATTERN = re.compile(f'^[a-z0-9_]+\\.({allowed_extensions_str})$')
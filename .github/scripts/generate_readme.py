@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Generator for the "Antennas" section of the root README.md.
+Builds each antenna block from the antenna's own README.md and splices it into place,
+regenerating only the blocks whose source README.md changed since the previous run.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Import configuration and utilities
+try:
+    from config import ANTENNAS_DIR, DETAILS_FILE_NAME, README_BLOCKS_CACHE_FILE
+    from messages import ERROR_TEMPLATES, SUCCESS_TEMPLATES, PROGRESS_TEMPLATES
+    from markdown_tree import HeadingNode, parse_markdown
+    from measurements import (
+        MeasurementRecord, extract_measurements, parse_frequency_band, parse_impedance, parse_number
+    )
+    from catalog import CatalogSnapshot
+except ImportError as e:
+    print(f"❌ Error: Could not import required modules: {e}")
+    sys.exit(1)
+
+ROOT_README = Path("README.md")
+ANTENNAS_SECTION = 'Antennas'
+LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+# Declared gain at the end of a block title, e.g. "[`2.5dBi`]"
+TITLE_GAIN_PATTERN = re.compile(r'\[`([^`]*)`\]\s*$')
+SWR_LINE_PATTERN = re.compile(r'^SWR:(.*)$', re.MULTILINE)
+IMPEDANCE_LINE_PATTERN = re.compile(r'^Impedance:(.*)$', re.MULTILINE)
+# A quoted value or a unit label in parentheses
+VALUE_OR_LABEL_PATTERN = re.compile(r'`([^`]*)`|\(([^)]*)\)')
+
+# Bump when the generated block layout changes to regenerate all blocks
+BLOCKS_FORMAT_VERSION = 1
+
+class ReadmeBlock(NamedTuple):
+    """An antenna block ('###' subsection) of the root README.md "Antennas" section."""
+    title: str
+    antenna: Optional[str]
+    text: str
+    # Generated blocks have frequency subsections; other blocks (e.g. "Same as ..." aliases) are kept verbatim
+    managed: bool
+
+def format_number(value: float) -> str:
+    """Format a number without trailing zeros or float noise."""
+    return f"{round(value, 6):g}"
+
+def format_swr(value: float) -> str:
+    return f"{value:.3f}"
+
+def format_impedance(record: MeasurementRecord) -> List[str]:
+    """Format impedance as separate resistance/reactance values, e.g. ['38.09 Ω', 'j5.838']."""
+    parts = []
+    if record.resistance is not None:
+        parts.append(f"{format_number(record.resistance)} Ω")
+    if record.reactance is not None:
+        sign = '-' if record.reactance < 0 else ''
+        magnitude = abs(record.reactance)
+        # Sub-ohm reactance is written in milliohms like the NanoVNA shows it, e.g. 'j184m'
+        if 0 < magnitude < 1:
+            parts.append(f"{sign}j{format_number(magnitude * 1000)}m")
+        else:
+            parts.append(f"{sign}j{format_number(magnitude)}")
+    return parts
+
+def format_gain(gain: Optional[float]) -> str:
+    return f"{format_number(gain)}dBi" if gain is not None else "?dBi"
+
+def select_summary_records(records: List[MeasurementRecord]) -> List[MeasurementRecord]:
+    """
+    Pick records of a band shown in the summary.
+
+    An unlabeled record is the main measurement of the band and hides labeled variants
+    like '(old)' or '(wide view)'; otherwise all units are listed with their labels.
+    """
+    for record in records:
+        if not record.label:
+            return [record]
+    return records
+
+def format_labeled(values: List[str], label: str) -> str:
+    text = ', '.join(f"`{value}`" for value in values)
+    return f"{text} ({label})" if label else text
+
+def generate_block(antenna: str, content: str, existing: Optional[ReadmeBlock] = None) -> ReadmeBlock:
+    """
+    Generate the root README.md block of an antenna from its README.md content.
+
+    The title and gain of an existing block are curated by hand: its link title is kept,
+    and so is its gain when it is unknown on purpose ('?dBi', e.g. for a likely fake
+    declared gain) or the antenna README.md doesn't declare one. An existing block
+    showing the same values as the generated one is kept verbatim.
+
+    Args:
+        antenna: Antenna directory name
+        content: Antenna README.md content
+        existing: Current block of the antenna in the root README.md, if any
+
+    Returns:
+        Generated block
+    """
+    document = parse_markdown(content)
+    title_node = next(document.iter(level=1), None)
+    title = title_node.title if title_node is not None else antenna
+
+    records = extract_measurements(antenna, content)
+    gain = records[0].gain if records else None
+    gain_text = format_gain(gain)
+
+    if existing is not None:
+        link_match = LINK_PATTERN.search(existing.title)
+        if link_match:
+            title = link_match.group(1)
+        gain_match = TITLE_GAIN_PATTERN.search(existing.title)
+        if gain_match and (gain is None or parse_number(gain_match.group(1)) is None):
+            gain_text = gain_match.group(1)
+
+    bands: Dict[str, List[MeasurementRecord]] = {}
+    for record in records:
+        bands.setdefault(record.band, []).append(record)
+
+    link = f"{ANTENNAS_DIR.as_posix()}/{antenna}/{DETAILS_FILE_NAME}"
+    lines = [f"### [{title}]({link}) [`{gain_text}`]", ""]
+
+    for band, band_records in bands.items():
+        summary = select_summary_records(band_records)
+        lines.extend([f"#### {band}", ""])
+
+        swr_values = [format_labeled([format_swr(r.swr)], r.label) for r in summary if r.swr is not None]
+        if swr_values:
+            lines.extend([f"SWR: {', '.join(swr_values)}", ""])
+
+        impedance_values = [format_labeled(format_impedance(r), r.label) for r in summary if format_impedance(r)]
+        if impedance_values:
+            lines.extend([f"Impedance: {', '.join(impedance_values)}", ""])
+
+    block = ReadmeBlock(title, antenna, '\n'.join(lines) + '\n', bool(bands))
+    if existing is not None and block.managed:
+        # Keep hand formatting (e.g. 'j5.473 Ω') of blocks that are already up to date
+        current = parse_block_summary(existing)
+        if current is not None and current == parse_block_summary(block):
+            return existing
+    return block
+
+def parse_block_antenna(title: str) -> Optional[str]:
+    """Return the antenna directory name a block title links to."""
+    match = LINK_PATTERN.search(title)
+    if not match:
+        return None
+    parts = Path(match.group(2)).parts
+    if len(parts) >= 2 and Path(parts[0]) == ANTENNAS_DIR:
+        return parts[1]
+    return None
+
+class SummaryUnit(NamedTuple):
+    """Values of one unit in a summary band, as normalized strings."""
+    swr: Optional[str]
+    impedance: List[str]
+
+class SummaryBlock(NamedTuple):
+    """A measured antenna block of the summary."""
+    antenna: str
+    # Normalized gain, None if the block doesn't state one
+    gain: Optional[str]
+    # band -> unit label ('' for the main measurement) -> values
+    bands: Dict[str, Dict[str, SummaryUnit]]
+
+def split_labeled_values(text: str) -> List[Tuple[str, List[str]]]:
+    """
+    Split a summary value line into (label, values) groups.
+
+    A label in parentheses closes the group of values before it, e.g.
+    "`38.09 Ω`, `j5.838` (Antenna 1), `38.74 Ω`, `j4.954` (Antenna 2)".
+    """
+    groups = []
+    values = []
+    for match in VALUE_OR_LABEL_PATTERN.finditer(text):
+        value, label = match.groups()
+        if value is not None:
+            values.append(value)
+        elif values:
+            groups.append((label.strip(), values))
+            values = []
+    if values:
+        groups.append(('', values))
+    return groups
+
+def normalize_swr(text: str) -> Optional[str]:
+    value = parse_number(text)
+    return format_swr(value) if value is not None else None
+
+def normalize_impedance(text: str) -> List[str]:
+    """Normalize impedance text the way generate_readme.py writes it, e.g. ['51.33 Ω', 'j5.473']."""
+    resistance, reactance = parse_impedance(text)
+    return format_impedance(MeasurementRecord('', '', '', None, resistance, reactance, None))
+
+def parse_summary_block(block: HeadingNode) -> Optional[SummaryBlock]:
+    """
+    Parse a '###' antenna block of the summary.
+
+    Returns:
+        Parsed block, or None for blocks without frequency subsections (e.g. "Same as ..." aliases)
+        or without a link to an antenna directory
+    """
+    antenna = parse_block_antenna(block.title)
+    frequency_nodes = list(block.iter(level=4))
+    if antenna is None or not frequency_nodes:
+        return None
+
+    # '?dBi' leaves the gain unknown on purpose, e.g. when the declared gain is likely fake
+    gain_match = TITLE_GAIN_PATTERN.search(block.title)
+    gain_value = parse_number(gain_match.group(1)) if gain_match else None
+    gain = format_gain(gain_value) if gain_value is not None else None
+
+    bands: Dict[str, Dict[str, SummaryUnit]] = {}
+    for node in frequency_nodes:
+        parsed = parse_frequency_band(node.title)
+        if parsed is None:
+            continue
+        units: Dict[str, SummaryUnit] = bands.setdefault(parsed[0], {})
+
+        swr_values: Dict[str, Optional[str]] = {}
+        for match in SWR_LINE_PATTERN.finditer(node.body):
+            for label, values in split_labeled_values(match.group(1)):
+                swr_values[label] = normalize_swr(values[0])
+
+        impedance_values: Dict[str, List[str]] = {}
+        for match in IMPEDANCE_LINE_PATTERN.finditer(node.body):
+            for label, values in split_labeled_values(match.group(1)):
+                impedance_values[label] = normalize_impedance(' '.join(values))
+
+        for label in list(swr_values) + [label for label in impedance_values if label not in swr_values]:
+            units[label] = SummaryUnit(swr_values.get(label), impedance_values.get(label, []))
+
+    return SummaryBlock(antenna, gain, bands)
+
+def parse_block_summary(block: ReadmeBlock) -> Optional[SummaryBlock]:
+    """Parse the text of a block (see parse_summary_block())."""
+    node = next(parse_markdown(block.text).iter(level=3), None)
+    return parse_summary_block(node) if node is not None else None
+
+def block_sort_key(block: ReadmeBlock) -> str:
+    match = LINK_PATTERN.search(block.title)
+    return (match.group(1) if match else block.title).casefold()
+
+class BlocksCache:
+    """Hashes of antenna README.md files the current root README.md blocks were generated from."""
+
+    def __init__(self, path: Path = README_BLOCKS_CACHE_FILE):
+        self.path = Path(path)
+        self.hashes: Dict[str, str] = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('format_version') == BLOCKS_FORMAT_VERSION:
+                self.hashes = data.get('hashes', {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'format_version': BLOCKS_FORMAT_VERSION, 'hashes': self.hashes}, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+def update_antennas_section(readme_content: str, snapshot: CatalogSnapshot, cache: BlocksCache,
+                            force: bool = False) -> Tuple[str, List[str]]:
+    """
+    Regenerate changed antenna blocks and splice them into the "Antennas" section.
+
+    Args:
+        readme_content: Root README.md content
+        snapshot: Catalog snapshot with antenna README.md files
+        cache: Source hashes of the existing blocks, updated in place
+        force: Regenerate all blocks regardless of the cache
+
+    Returns:
+        Tuple of (new README.md content, names of regenerated antennas)
+
+    Raises:
+        ValueError: If README.md has no "Antennas" section
+    """
+    document = parse_markdown(readme_content)
+    section = document.find(ANTENNAS_SECTION, level=2)
+    if section is None:
+        raise ValueError(ERROR_TEMPLATES['missing_antennas_section'])
+
+    subsections = [node for node in section.children if node.level == 3]
+    region_start = subsections[0].start if subsections else section.end
+    region_end = section.end
+
+    existing = []
+    for node in subsections:
+        title = node.title
+        existing.append(ReadmeBlock(
+            title, parse_block_antenna(title), readme_content[node.start:node.end],
+            next(node.iter(level=4), None) is not None
+        ))
+    managed = {block.antenna: block for block in existing if block.managed and block.antenna}
+
+    blocks = [block for block in existing if not block.managed or not block.antenna]
+    regenerated = []
+    for antenna in snapshot.all_antenna_dirs():
+        readme_file = antenna.path / DETAILS_FILE_NAME
+        if not snapshot.exists(readme_file):
+            continue
+        content = snapshot.read_text(readme_file)
+        source_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+        block = managed.get(antenna.name)
+        if force or block is None or cache.hashes.get(antenna.name) != source_hash:
+            generated = generate_block(antenna.name, content, block)
+            if generated != block:
+                regenerated.append(antenna.name)
+            block = generated
+        cache.hashes[antenna.name] = source_hash
+        blocks.append(block)
+
+    # Forget antennas that no longer exist
+    existing_names = {antenna.name for antenna in snapshot.all_antenna_dirs()}
+    cache.hashes = {name: value for name, value in cache.hashes.items() if name in existing_names}
+
+    blocks.sort(key=block_sort_key)
+    region = ''.join(block.text.rstrip('\n') + '\n\n' for block in blocks)
+    return readme_content[:region_start] + region + readme_content[region_end:], regenerated
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Regenerate the 'Antennas' section of README.md.")
+    parser.add_argument('--check', action='store_true', help="don't write README.md, fail if it is out of date")
+    parser.add_argument('--force', action='store_true', help="regenerate all blocks ignoring the cache")
+    args = parser.parse_args()
+
+    try:
+        print(PROGRESS_TEMPLATES['generating_readme'])
+        if not ROOT_README.exists():
+            print(ERROR_TEMPLATES['readme_missing'])
+            sys.exit(1)
+
+        readme_content = ROOT_README.read_text(encoding='utf-8')
+        cache = BlocksCache()
+        # In check mode compare against a full regeneration, the cache may be stale or missing
+        new_content, regenerated = update_antennas_section(
+            readme_content, CatalogSnapshot(ANTENNAS_DIR), cache, force=args.force or args.check
+        )
+
+        if args.check:
+            if new_content != readme_content:
+                print(ERROR_TEMPLATES['readme_outdated'])
+                sys.exit(1)
+            print(SUCCESS_TEMPLATES['readme_up_to_date'])
+            sys.exit(0)
+
+        for name in regenerated:
+            print(PROGRESS_TEMPLATES['regenerated_block'].format(name=name))
+        if new_content != readme_content:
+            ROOT_README.write_text(new_content, encoding='utf-8')
+        cache.save()
+        print(SUCCESS_TEMPLATES['readme_generated'].format(count=len(regenerated)))
+        sys.exit(0)
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
+    except Exception as e:
+        print(f"❌ Unexpected error in README.md generation: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Git helpers for incremental validation.
+Maps paths changed since a base ref to the antenna directories that need re-validation
+and lists commits of revision ranges.
+"""
+
+import subprocess
+import sys
+from pathlib import PurePosixPath
+from typing import List, Optional, Set, Tuple
+
+# Import configuration
+try:
+    from config import ANTENNAS_DIR, SCRIPTS_DIR
+except ImportError:
+    print("❌ Error: Could not import configuration file")
+    sys.exit(1)
+
+class GitChangesError(Exception):
+    """Raised when the list of changed files can't be obtained from git."""
+
+def get_changed_paths(ref: str) -> List[str]:
+    """
+    Get paths changed between a ref and the working tree with a single `git diff` call.
+
+    Args:
+        ref: Base git ref (branch, tag or commit SHA)
+
+    Returns:
+        List of changed paths relative to the repository root. Renames and copies
+        contribute both the old and the new path.
+    """
+    try:
+        result = subprocess.run(
+            ['git', 'diff', '--name-status', '-z', ref, '--'],
+            capture_output=True, check=True
+        )
+    except FileNotFoundError as e:
+        raise GitChangesError(f"git executable not found: {e}")
+    except subprocess.CalledProcessError as e:
+        raise GitChangesError(e.stderr.decode('utf-8', errors='replace').strip() or str(e))
+
+    # -z output: "<status>\0<path>\0" or "<status>\0<old path>\0<new path>\0" for renames/copies
+    fields = result.stdout.decode('utf-8', errors='surrogateescape').split('\0')
+    paths = []
+    i = 0
+    while i < len(fields) and fields[i]:
+        status = fields[i]
+        path_count = 2 if status[0] in 'RC' else 1
+        paths.extend(fields[i + 1:i + 1 + path_count])
+        i += 1 + path_count
+
+    return paths
+
+def list_commits(revision_range: str) -> List[Tuple[str, str]]:
+    """
+    List commits of a revision range, oldest first.
+
+    Args:
+        revision_range: Range in git syntax, e.g. 'v1.0..main' or 'HEAD~20..HEAD'
+
+    Returns:
+        List of (commit SHA, subject) tuples
+    """
+    try:
+        result = subprocess.run(
+            ['git', 'log', '--reverse', '--format=%H%x00%s', revision_range, '--'],
+            capture_output=True, check=True
+        )
+    except FileNotFoundError as e:
+        raise GitChangesError(f"git executable not found: {e}")
+    except subprocess.CalledProcessError as e:
+        raise GitChangesError(e.stderr.decode('utf-8', errors='replace').strip() or str(e))
+
+    commits = []
+    for line in result.stdout.decode('utf-8', errors='replace').splitlines():
+        sha, _, subject = line.partition('\0')
+        commits.append((sha, subject))
+    return commits
+
+def get_changed_antennas(ref: str) -> Optional[Set[str]]:
+    """
+    Get names of antenna directories touched since a ref.
+
+    Args:
+        ref: Base git ref (branch, tag or commit SHA)
+
+    Returns:
+        Set of antenna directory names, or None if validation rules themselves
+        changed and the whole catalog has to be re-validated
+    """
+    antennas_prefix = PurePosixPath(ANTENNAS_DIR.as_posix())
+    scripts_prefix = PurePosixPath(SCRIPTS_DIR.as_posix())
+
+    changed_antennas = set()
+    for path in get_changed_paths(ref):
+        path = PurePosixPath(path)
+        if path.is_relative_to(scripts_prefix):
+            return None
+        if path.is_relative_to(antennas_prefix):
+            parts = path.relative_to(antennas_prefix).parts
+            # Files directly in antennas/ don't belong to any antenna
+            if len(parts) >= 2:
+                changed_antennas.add(parts[0])
+
+    return changed_antennas
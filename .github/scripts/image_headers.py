@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Header-only image probing.
+Detects the real image format from magic bytes and reads pixel dimensions
+from JPEG/PNG/WebP headers without decoding any pixel data.
+"""
+
+import mmap
+import struct
+from typing import BinaryIO, NamedTuple, Optional, Union
+
+# Bytes needed to recognize every supported format and read PNG/WebP dimensions
+HEADER_SIZE = 32
+
+# Extension -> format name returned by probe_image()
+EXTENSION_FORMATS = {
+    '.jpg': 'jpeg',
+    '.jpeg': 'jpeg',
+    '.png': 'png',
+    '.webp': 'webp',
+    '.gif': 'gif',
+    '.bmp': 'bmp',
+    '.tiff': 'tiff',
+}
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# JPEG start-of-frame markers carrying image dimensions (all SOFn except DHT, JPG and DAC)
+JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+# JPEG markers without a length field
+JPEG_STANDALONE_MARKERS = {0x01, 0xD0, 0xD1, 0xD2, 0xD3, 0xD4, 0xD5, 0xD6, 0xD7, 0xD8}
+JPEG_EOI = 0xD9
+JPEG_SOS = 0xDA
+# JPEG restart markers, allowed inside entropy-coded scan data
+JPEG_RST_MARKERS = range(0xD0, 0xD8)
+
+class ImageInfo(NamedTuple):
+    """Format and pixel dimensions of an image (dimensions are None if they couldn't be read)."""
+    format: str
+    width: Optional[int]
+    height: Optional[int]
+
+def detect_format(header: bytes) -> Optional[str]:
+    """Detect image format from the first bytes of a file."""
+    if header.startswith(b'\xff\xd8\xff'):
+        return 'jpeg'
+    if header.startswith(PNG_SIGNATURE):
+        return 'png'
+    if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+        return 'webp'
+    if header[:6] in (b'GIF87a', b'GIF89a'):
+        return 'gif'
+    if header[:2] == b'BM':
+        return 'bmp'
+    if header[:4] in (b'II*\x00', b'MM\x00*'):
+        return 'tiff'
+    return None
+
+def _png_size(header: bytes) -> Optional[tuple]:
+    # IHDR is always the first chunk: length(4) type(4) width(4) height(4)
+    if len(header) >= 24 and header[12:16] == b'IHDR':
+        return struct.unpack('>II', header[16:24])
+    return None
+
+def _webp_size(header: bytes) -> Optional[tuple]:
+    chunk = header[12:16]
+    data = header[20:]
+    if chunk == b'VP8 ' and len(data) >= 10 and data[3:6] == b'\x9d\x01\x2a':
+        width, height = struct.unpack('<HH', data[6:10])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b'VP8L' and len(data) >= 5 and data[0] == 0x2F:
+        bits = int.from_bytes(data[1:5], 'little')
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b'VP8X' and len(data) >= 10:
+        width = int.from_bytes(data[4:7], 'little') + 1
+        height = int.from_bytes(data[7:10], 'little') + 1
+        return width, height
+    return None
+
+def _jpeg_size(f: BinaryIO) -> Optional[tuple]:
+    """Walk JPEG segment headers (seeking over payloads) until a start-of-frame marker."""
+    f.seek(2)
+    while True:
+        byte = f.read(1)
+        if not byte:
+            return None
+        if byte != b'\xff':
+            # Not at a marker, the stream is malformed
+            return None
+
+        # Skip fill bytes
+        marker = f.read(1)
+        while marker == b'\xff':
+            marker = f.read(1)
+        if not marker:
+            return None
+        marker = marker[0]
+
+        if marker in JPEG_STANDALONE_MARKERS:
+            continue
+        if marker in (JPEG_EOI, JPEG_SOS):
+            # Dimensions must come before scan data
+            return None
+
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = struct.unpack('>H', length_bytes)[0]
+        if length < 2:
+            return None
+
+        if marker in JPEG_SOF_MARKERS:
+            frame = f.read(5)
+            if len(frame) < 5:
+                return None
+            height, width = struct.unpack('>HH', frame[1:5])
+            return width, height
+
+        f.seek(length - 2, 1)
+
+def jpeg_scan_end(data: Union[bytes, mmap.mmap], position: int) -> Optional[int]:
+    """
+    Find the end of JPEG entropy-coded scan data starting at `position`.
+
+    Scan data runs until a marker other than a stuffed 0xFF00 or a restart marker.
+
+    Returns:
+        Offset of the marker following the scan, or None if the data ends first
+    """
+    size = len(data)
+    while True:
+        position = data.find(b'\xff', position)
+        if position < 0 or position + 1 >= size:
+            return None
+        following = data[position + 1]
+        if following == 0x00 or following in JPEG_RST_MARKERS:
+            position += 2
+        elif following == 0xFF:
+            # Fill byte before a marker
+            position += 1
+        else:
+            return position
+
+def probe_image(f: BinaryIO) -> Optional[ImageInfo]:
+    """
+    Probe an image file object opened in binary mode.
+
+    Only the header is read; for JPEG only segment headers are read while seeking over
+    segment payloads (e.g. EXIF thumbnails) until the frame header.
+
+    Returns:
+        Image info, or None if the file isn't a recognized image format
+    """
+    header = f.read(HEADER_SIZE)
+    image_format = detect_format(header)
+    if image_format is None:
+        return None
+
+    size = None
+    if image_format == 'png':
+        size = _png_size(header)
+    elif image_format == 'webp':
+        size = _webp_size(header)
+    elif image_format == 'jpeg':
+        size = _jpeg_size(f)
+
+    width, height = size if size else (None, None)
+    return ImageInfo(image_format, width, height)
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Lossless metadata removal for JPEG, PNG and WebP images.
+Walks JPEG segments, PNG chunks and WebP chunks and plans a copy of the file
+without EXIF (including GPS location and thumbnails), XMP, IPTC, comments and text
+chunks; image data is copied as is and never re-encoded. An EXIF orientation other
+than the default is kept in a minimal EXIF block, so photos aren't displayed rotated.
+"""
+
+import struct
+import sys
+import zlib
+from typing import List, NamedTuple, Optional, Tuple, Union
+
+# Import configuration
+try:
+    from image_headers import JPEG_EOI, JPEG_SOS, JPEG_STANDALONE_MARKERS, PNG_SIGNATURE, detect_format, jpeg_scan_end
+    from storage import Buffer
+except ImportError:
+    print("❌ Error: Could not import configuration file")
+    sys.exit(1)
+
+# Piece of a rewritten file: a (start, end) range of the original or new bytes
+Piece = Union[Tuple[int, int], bytes]
+
+EXIF_ORIENTATION_TAG = 0x0112
+EXIF_GPS_IFD_TAG = 0x8825
+EXIF_TYPE_SHORT = 3
+EXIF_HEADER = b'Exif\0\0'
+
+JPEG_APP0 = 0xE0
+JPEG_APP1 = 0xE1
+JPEG_APP2 = 0xE2
+JPEG_APP13 = 0xED
+JPEG_APP14 = 0xEE
+JPEG_APP15 = 0xEF
+JPEG_COM = 0xFE
+
+# Identifiers at the start of JPEG APPn payloads
+JFIF_ID = b'JFIF\0'
+XMP_IDS = (b'http://ns.adobe.com/xap/1.0/\0', b'http://ns.adobe.com/xmp/extension/\0')
+ICC_PROFILE_ID = b'ICC_PROFILE\0'
+MPF_ID = b'MPF\0'
+
+PNG_TEXT_CHUNKS = {b'tEXt', b'zTXt', b'iTXt'}
+PNG_XMP_KEYWORD = b'XML:com.adobe.xmp\0'
+PNG_IEND = b'IEND'
+
+# VP8X feature flags of WebP metadata chunks
+WEBP_ICC_FLAG = 0x20
+WEBP_EXIF_FLAG = 0x08
+WEBP_XMP_FLAG = 0x04
+
+# Names of removed metadata
+EXIF = "EXIF"
+GPS = "GPS location"
+THUMBNAIL = "EXIF thumbnail"
+XMP = "XMP"
+IPTC = "Photoshop/IPTC data"
+COMMENT = "comment"
+TEXT = "text chunk"
+TIMESTAMP = "timestamp"
+ICC = "ICC profile"
+MULTI_PICTURE = "multi-picture data"
+TRAILING_DATA = "data after the end of the image"
+
+class ExifInfo(NamedTuple):
+    """Fields of an EXIF block that matter for stripping it."""
+    byte_order: bytes
+    orientation: Optional[int]
+    has_gps: bool
+    has_thumbnail: bool
+
+class StripPlan(NamedTuple):
+    """Planned rewrite of an image without metadata."""
+    # Names of removed metadata, empty if the image is clean
+    removed: List[str]
+    pieces: List[Piece]
+
+    @property
+    def size(self) -> int:
+        return sum(piece[1] - piece[0] if isinstance(piece, tuple) else len(piece) for piece in self.pieces)
+
+def parse_exif(tiff: Buffer) -> Optional[ExifInfo]:
+    """Read orientation and GPS/thumbnail presence from a TIFF-structured EXIF block."""
+    byte_order = bytes(tiff[:2])
+    if byte_order not in (b'II', b'MM'):
+        return None
+    endian = '<' if byte_order == b'II' else '>'
+    try:
+        magic, offset = struct.unpack_from(endian + 'HI', tiff, 2)
+        if magic != 42:
+            return None
+        count = struct.unpack_from(endian + 'H', tiff, offset)[0]
+        orientation = None
+        has_gps = False
+        for index in range(count):
+            tag, value_type, _, value = struct.unpack_from(endian + 'HHI4s', tiff, offset + 2 + 12 * index)
+            if tag == EXIF_ORIENTATION_TAG and value_type == EXIF_TYPE_SHORT:
+                orientation = struct.unpack_from(endian + 'H', value)[0]
+            elif tag == EXIF_GPS_IFD_TAG:
+                has_gps = True
+        # IFD1 holds the thumbnail
+        next_ifd = struct.unpack_from(endian + 'I', tiff, offset + 2 + 12 * count)[0]
+    except struct.error:
+        return None
+    return ExifInfo(byte_order, orientation, has_gps, next_ifd != 0)
+
+def minimal_exif(byte_order: bytes, orientation: int) -> bytes:
+    """EXIF block (TIFF structure) holding only the orientation."""
+    endian = '<' if byte_order == b'II' else '>'
+    return (byte_order + struct.pack(endian + 'HI', 42, 8) + struct.pack(endian + 'H', 1)
+            + struct.pack(endian + 'HHIHH', EXIF_ORIENTATION_TAG, EXIF_TYPE_SHORT, 1, orientation, 0)
+            + struct.pack(endian + 'I', 0))
+
+def exif_replacement(tiff: Buffer) -> Tuple[Optional[bytes], List[str]]:
+    """
+    Decide what to keep of an EXIF block.
+
+    Returns:
+        (EXIF block to write instead, None to drop it; names of removed metadata).
+        An EXIF block that is minimal already is returned unchanged with nothing removed.
+    """
+    info = parse_exif(tiff)
+    if info is None:
+        return None, [EXIF]
+    removed = [EXIF] + ([GPS] if info.has_gps else []) + ([THUMBNAIL] if info.has_thumbnail else [])
+    if info.orientation in (None, 1):
+        return None, removed
+    replacement = minimal_exif(info.byte_order, info.orientation)
+    if bytes(tiff) == replacement:
+        return replacement, []
+    return replacement, removed
+
+class _Rewrite:
+    """Collects pieces of a rewritten file, merging adjacent ranges of the original."""
+
+    def __init__(self):
+        self.pieces: List[Piece] = []
+        self.removed: List[str] = []
+
+    def keep(self, start: int, end: int):
+        if start == end:
+            return
+        if self.pieces and isinstance(self.pieces[-1], tuple) and self.pieces[-1][1] == start:
+            self.pieces[-1] = (self.pieces[-1][0], end)
+        else:
+            self.pieces.append((start, end))
+
+    def add(self, data: bytes):
+        self.pieces.append(data)
+
+    def remove(self, names: List[str]):
+        self.removed.extend(name for name in names if name not in self.removed)
+
+    def plan(self) -> StripPlan:
+        return StripPlan(self.removed, self.pieces)
+
+def _jpeg_metadata(marker: int, payload: Buffer, strip_icc: bool) -> Optional[str]:
+    """Name of the metadata in a JPEG segment, None for segments to keep."""
+    if marker == JPEG_COM:
+        return COMMENT
+    if marker == JPEG_APP0:
+        # JFIF is kept, its JFXX extension only carries a thumbnail
+        return None if payload[:len(JFIF_ID)] == JFIF_ID else THUMBNAIL
+    if marker == JPEG_APP1:
+        return XMP if any(payload[:len(prefix)] == prefix for prefix in XMP_IDS) else EXIF
+    if marker == JPEG_APP2:
+        if payload[:len(ICC_PROFILE_ID)] == ICC_PROFILE_ID:
+            return ICC if strip_icc else None
+        return MULTI_PICTURE if payload[:len(MPF_ID)] == MPF_ID else "APP2 data"
+    if marker == JPEG_APP13:
+        return IPTC
+    if marker == JPEG_APP14:
+        # Adobe segment, tells decoders how colors are transformed
+        return None
+    if JPEG_APP0 < marker <= JPEG_APP15:
+        return f"APP{marker - JPEG_APP0} data"
+    return None
+
+def plan_jpeg(data: Buffer, strip_icc: bool = False) -> Optional[StripPlan]:
+    """Plan a JPEG copy without metadata segments and data after EOI (None if malformed)."""
+    rewrite = _Rewrite()
+    size = len(data)
+    rewrite.keep(0, 2)
+    position = 2
+    while True:
+        if position + 2 > size or data[position] != 0xFF:
+            return None
+        marker = data[position + 1]
+        if marker == 0xFF:
+            position += 1
+            continue
+        if marker == JPEG_EOI:
+            rewrite.keep(position, position + 2)
+            if position + 2 < size:
+                rewrite.remove([TRAILING_DATA])
+            return rewrite.plan()
+        if marker in JPEG_STANDALONE_MARKERS:
+            rewrite.keep(position, position + 2)
+            position += 2
+            continue
+
+        if position + 4 > size:
+            return None
+        length = struct.unpack_from('>H', data, position + 2)[0]
+        end = position + 2 + length
+        if length < 2 or end > size:
+            return None
+
+        if marker == JPEG_SOS:
+            end = jpeg_scan_end(data, end)
+            if end is None:
+                return None
+            rewrite.keep(position, end)
+        else:
+            name = _jpeg_metadata(marker, data[position + 4:min(end, position + 40)], strip_icc)
+            if name == EXIF and data[position + 4:position + 10] == EXIF_HEADER:
+                replacement, removed = exif_replacement(data[position + 10:end])
+                if replacement is not None and not removed:
+                    rewrite.keep(position, end)
+                else:
+                    rewrite.remove(removed)
+                    if replacement is not None:
+                        rewrite.add(b'\xff' + bytes([JPEG_APP1]) + struct.pack('>H', 2 + len(EXIF_HEADER) + len(replacement))
+                                    + EXIF_HEADER + replacement)
+            elif name is not None:
+                rewrite.remove([name])
+            else:
+                rewrite.keep(position, end)
+        position = end
+
+def png_chunk(chunk_type: bytes, payload: bytes) -> bytes:
+    return struct.pack('>I', len(payload)) + chunk_type + payload + struct.pack('>I', zlib.crc32(chunk_type + payload))
+
+def plan_png(data: Buffer, strip_icc: bool = False) -> Optional[StripPlan]:
+    """Plan a PNG copy without text, time and EXIF chunks and data after IEND (None if malformed)."""
+    rewrite = _Rewrite()
+    size = len(data)
+    rewrite.keep(0, len(PNG_SIGNATURE))
+    position = len(PNG_SIGNATURE)
+    while position + 12 <= size:
+        length, chunk_type = struct.unpack_from('>I4s', data, position)
+        end = position + 12 + length
+        if end > size:
+            return None
+
+        if chunk_type == b'iTXt' and data[position + 8:position + 8 + len(PNG_XMP_KEYWORD)] == PNG_XMP_KEYWORD:
+            rewrite.remove([XMP])
+        elif chunk_type in PNG_TEXT_CHUNKS:
+            rewrite.remove([TEXT])
+        elif chunk_type == b'tIME':
+            rewrite.remove([TIMESTAMP])
+        elif chunk_type == b'iCCP' and strip_icc:
+            rewrite.remove([ICC])
+        elif chunk_type == b'eXIf':
+            replacement, removed = exif_replacement(data[position + 8:end - 4])
+            if replacement is not None and not removed:
+                rewrite.keep(position, end)
+            else:
+                rewrite.remove(removed)
+                if replacement is not None:
+                    rewrite.add(png_chunk(b'eXIf', replacement))
+        else:
+            rewrite.keep(position, end)
+
+        position = end
+        if chunk_type == PNG_IEND:
+            if position < size:
+                rewrite.remove([TRAILING_DATA])
+            return rewrite.plan()
+    return None
+
+def plan_webp(data: Buffer, strip_icc: bool = False) -> Optional[StripPlan]:
+    """Plan a WebP copy without EXIF and XMP chunks, updating VP8X flags and the RIFF length (None if malformed)."""
+    size = len(data)
+    if size < 12:
+        return None
+    riff_end = 8 + struct.unpack_from('<I', data, 4)[0]
+    if riff_end > size:
+        return None
+
+    rewrite = _Rewrite()
+    # Placeholder for the RIFF header, written once the new length is known
+    rewrite.add(b'')
+    vp8x_index = None
+    cleared_flags = 0
+    position = 12
+    while position < riff_end:
+        if position + 8 > riff_end:
+            return None
+        chunk_type, length = struct.unpack_from('<4sI', data, position)
+        end = position + 8 + length + (length & 1)
+        if position + 8 + length > riff_end:
+            return None
+        end = min(end, riff_end)
+
+        if chunk_type == b'VP8X':
+            vp8x_index = len(rewrite.pieces)
+            rewrite.add(bytes(data[position:end]))
+        elif chunk_type == b'XMP ':
+            rewrite.remove([XMP])
+            cleared_flags |= WEBP_XMP_FLAG
+        elif chunk_type == b'ICCP' and strip_icc:
+            rewrite.remove([ICC])
+            cleared_flags |= WEBP_ICC_FLAG
+        elif chunk_type == b'EXIF':
+            replacement, removed = exif_replacement(data[position + 8:position + 8 + length])
+            if replacement is not None and not removed:
+                rewrite.keep(position, end)
+            else:
+                rewrite.remove(removed)
+                if replacement is not None:
+                    padding = b'\0' if len(replacement) & 1 else b''
+                    rewrite.add(b'EXIF' + struct.pack('<I', len(replacement)) + replacement + padding)
+                else:
+                    cleared_flags |= WEBP_EXIF_FLAG
+        else:
+            rewrite.keep(position, end)
+        position = end
+
+    if riff_end < size:
+        rewrite.remove([TRAILING_DATA])
+    if vp8x_index is not None and cleared_flags:
+        vp8x = bytearray(rewrite.pieces[vp8x_index])
+        vp8x[8] &= ~cleared_flags & 0xFF
+        rewrite.pieces[vp8x_index] = bytes(vp8x)
+    plan = rewrite.plan()
+    plan.pieces[0] = b'RIFF' + struct.pack('<I', plan.size + 4) + b'WEBP'
+    return plan
+
+# Detected format -> planner
+PLANNERS = {
+    'jpeg': plan_jpeg,
+    'png': plan_png,
+    'webp': plan_webp,
+}
+
+def plan_strip(data: Buffer, strip_icc: bool = False) -> Optional[StripPlan]:
+    """
+    Plan a copy of an image without metadata.
+
+    Args:
+        data: Image contents (bytes or a memory map, only small parts are copied)
+        strip_icc: Also remove ICC color profiles (colors may render differently)
+
+    Returns:
+        Plan with the names of removed metadata, or None for unsupported or malformed images
+    """
+    planner = PLANNERS.get(detect_format(data[:16]))
+    return planner(data, strip_icc) if planner else None
+
+def apply_plan(data: Buffer, plan: StripPlan) -> bytes:
+    """Build the stripped image from a plan."""
+    return b''.join(data[piece[0]:piece[1]] if isinstance(piece, tuple) else piece for piece in plan.pieces)
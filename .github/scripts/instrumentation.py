@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Per-stage timing and profiling of validation runs.
+Records wall and CPU time, files opened, bytes read and memory of every validation
+stage, optionally with a cProfile dump per stage, as a machine-readable summary.
+"""
+
+import contextlib
+import cProfile
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows
+    resource = None
+
+# Import configuration
+try:
+    from config import CACHE_DIR
+    from messages import PROGRESS_TEMPLATES
+    from catalog import CatalogSnapshot
+except ImportError:
+    print("❌ Error: Could not import configuration file")
+    sys.exit(1)
+
+# Bump when the layout of the summary changes
+SUMMARY_FORMAT_VERSION = 1
+
+DEFAULT_TIMINGS_FILE = CACHE_DIR / "timings.json"
+DEFAULT_PROFILE_DIR = CACHE_DIR / "profiles"
+
+def read_bytes_counter() -> Optional[int]:
+    """Return bytes read by the process so far (Linux /proc/self/io 'rchar'), or None if unavailable."""
+    try:
+        with open('/proc/self/io', 'r', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('rchar:'):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return None
+
+def peak_rss_kb() -> Optional[int]:
+    """Return the peak resident set size of the process in KB, or None if unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+class StageRecorder:
+    """
+    Collects per-stage measurements of a validation run.
+
+    CPU time covers all threads of the process. Bytes read come from the OS counters
+    of the process and include the results cache; files are those opened through the
+    catalog snapshot. Memory is the process peak RSS after the stage and how much the
+    stage raised it. cProfile only sees the calling thread, so profiling should run
+    with a single job.
+    """
+
+    def __init__(self, profile_dir: Optional[Path] = None):
+        self.profile_dir = Path(profile_dir) if profile_dir else None
+        self.stages: Dict[str, dict] = {}
+
+    @contextlib.contextmanager
+    def measure(self, stage: str, snapshot: Optional[CatalogSnapshot] = None) -> Iterator[None]:
+        """Measure the code run inside the block as a stage (files are counted only with a snapshot)."""
+        opened_before = len(snapshot.opened_files) if snapshot is not None else 0
+        bytes_before = read_bytes_counter()
+        rss_before = peak_rss_kb()
+        profiler = cProfile.Profile() if self.profile_dir else None
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        if profiler:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler:
+                profiler.disable()
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+
+            bytes_after = read_bytes_counter()
+            rss_after = peak_rss_kb()
+            opened = snapshot.opened_files[opened_before:] if snapshot is not None else []
+
+            record = {
+                'wall_seconds': round(wall, 6),
+                'cpu_seconds': round(cpu, 6),
+                'files_opened': len(opened),
+                'files_touched': len(set(opened)),
+                'bytes_read': None if bytes_before is None or bytes_after is None else bytes_after - bytes_before,
+                'peak_rss_kb': rss_after,
+                'rss_growth_kb': None if rss_before is None or rss_after is None else rss_after - rss_before,
+            }
+            if profiler:
+                self.profile_dir.mkdir(parents=True, exist_ok=True)
+                profile_path = self.profile_dir / f"{stage}.prof"
+                profiler.dump_stats(profile_path)
+                record['profile'] = profile_path.as_posix()
+            self.stages[stage] = record
+
+    def summary(self) -> dict:
+        """Return the machine-readable summary of all recorded stages."""
+        return {
+            'format_version': SUMMARY_FORMAT_VERSION,
+            'pid': os.getpid(),
+            'stages': self.stages,
+            'total': {
+                'wall_seconds': round(sum(stage['wall_seconds'] for stage in self.stages.values()), 6),
+                'cpu_seconds': round(sum(stage['cpu_seconds'] for stage in self.stages.values()), 6),
+                'peak_rss_kb': peak_rss_kb(),
+            }
+        }
+
+    def write(self, path: Path):
+        """Write the summary as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, indent=2)
+
+    def print_table(self):
+        """Print a human-readable table of the recorded stages."""
+        print(PROGRESS_TEMPLATES['timings_header'])
+        for stage, record in self.stages.items():
+            bytes_read = record['bytes_read']
+            print(PROGRESS_TEMPLATES['stage_timing'].format(
+                stage=stage, wall=record['wall_seconds'], cpu=record['cpu_seconds'],
+                files=record['files_touched'],
+                read='?' if bytes_read is None else f"{bytes_read / 1024:.1f}KB",
+                rss='?' if record['peak_rss_kb'] is None else f"{record['peak_rss_kb'] / 1024:.1f}MB"
+            ))
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Markdown heading tree shared by README checks.
+Tokenizes a document once into nested headings with offset and line spans,
+so validators can query sections without re-scanning or copying lines.
+"""
+
+import re
+from typing import Iterator, List, Optional
+
+# ATX heading: 1-6 '#' characters followed by a space at the start of a line
+HEADING_PATTERN = re.compile(r'^(#{1,6}) (.*)$', re.MULTILINE)
+
+class HeadingNode:
+    """
+    A heading and the span of the document it owns.
+
+    The span runs from the heading line up to the next heading of the same or
+    higher level (or the end of the document) and includes nested headings.
+    The root node has level 0, an empty title and spans the whole document.
+    """
+
+    __slots__ = ('source', 'level', 'title', 'start', 'body_start', 'end', 'line', 'children')
+
+    def __init__(self, source: str, level: int, title: str, start: int, body_start: int, line: int):
+        self.source = source
+        self.level = level
+        self.title = title
+        # Offsets of the heading line start, the first character after the heading line and the span end
+        self.start = start
+        self.body_start = body_start
+        self.end = len(source)
+        # 1-based line number of the heading (0 for the root)
+        self.line = line
+        self.children: List['HeadingNode'] = []
+
+    @property
+    def body(self) -> str:
+        """Raw text below the heading, including nested headings."""
+        return self.source[self.body_start:self.end]
+
+    @property
+    def content(self) -> str:
+        """Text below the heading with surrounding whitespace stripped."""
+        return self.body.strip()
+
+    @property
+    def has_body(self) -> bool:
+        """Whether there is anything (even a blank line) below the heading."""
+        return self.body_start < self.end
+
+    def iter(self, level: Optional[int] = None) -> Iterator['HeadingNode']:
+        """Iterate over descendants in document order, optionally only those of a given level."""
+        pending = list(reversed(self.children))
+        while pending:
+            node = pending.pop()
+            if level is None or node.level == level:
+                yield node
+            pending.extend(reversed(node.children))
+
+    def find(self, title: str, level: Optional[int] = None) -> Optional['HeadingNode']:
+        """Return the first descendant with the given title (and level), or None."""
+        for node in self.iter(level):
+            if node.title == title:
+                return node
+        return None
+
+def parse_markdown(content: str) -> HeadingNode:
+    """
+    Parse markdown content into a heading tree in a single pass.
+
+    Args:
+        content: Markdown content as string
+
+    Returns:
+        Root node spanning the whole document
+    """
+    root = HeadingNode(content, 0, '', 0, 0, 0)
+    stack = [root]
+    line = 1
+    line_offset = 0
+
+    for match in HEADING_PATTERN.finditer(content):
+        start = match.start()
+        line += content.count('\n', line_offset, start)
+        line_offset = start
+
+        level = len(match.group(1))
+        # Close sections of the same or deeper level
+        while stack[-1].level >= level:
+            stack.pop().end = start
+
+        body_start = min(match.end() + 1, len(content))
+        node = HeadingNode(content, level, match.group(2).strip(), start, body_start, line)
+        stack[-1].children.append(node)
+        stack.append(node)
+
+    return root
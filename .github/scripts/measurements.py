@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+"""
+Structured measurement extraction.
+Parses antenna README.md files into typed measurement records and writes them
+into a compact columnar catalog index (CSV data, row orders sorted by each numeric
+field plus a JSON manifest).
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import math
+import os
+import re
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Import configuration and utilities
+try:
+    from config import ANTENNAS_DIR, DETAILS_FILE_NAME, CATALOG_INDEX_DIR
+    from messages import ERROR_TEMPLATES, SUCCESS_TEMPLATES, PROGRESS_TEMPLATES
+    from markdown_tree import HeadingNode, parse_markdown
+    from catalog import CatalogSnapshot
+except ImportError as e:
+    print(f"❌ Error: Could not import required modules: {e}")
+    sys.exit(1)
+
+# Bump when columns or their meaning change
+INDEX_FORMAT_VERSION = 3
+INDEX_DATA_FILE = "catalog_index.csv"
+INDEX_SORTED_FILE = "catalog_index_sorted.json"
+INDEX_MANIFEST_FILE = "catalog_index.json"
+
+# Reference impedance the 'z_error' column is measured from
+REFERENCE_IMPEDANCE = 50.0
+
+# Antenna name -> {'sha256': ..., 'size': ..., 'mtime_ns': ...} of its README.md (see source_record())
+Sources = Dict[str, dict]
+
+# Frequency or frequency range with unit, e.g. "868 MHz", "433-466 MHz"
+FREQUENCY_PATTERN = re.compile(
+    r'(\d+(?:\.\d+)?)(?:\s*-\s*(\d+(?:\.\d+)?))?\s*(GHz|MHz|KHz|Hz)\b', re.IGNORECASE
+)
+FREQUENCY_UNITS = {'hz': 'Hz', 'khz': 'kHz', 'mhz': 'MHz', 'ghz': 'GHz'}
+UNIT_MULTIPLIERS = {'Hz': 1.0, 'kHz': 1e3, 'MHz': 1e6, 'GHz': 1e9}
+
+# Unit label line inside a measurement subsection, e.g. "**Antenna 1:**"
+UNIT_LABEL_PATTERN = re.compile(r'^\*\*(.+?):?\*\*:?\s*$', re.MULTILINE)
+
+SWR_PATTERN = re.compile(r'SWR:[ \t]*`([^`]*)`')
+IMPEDANCE_PATTERN = re.compile(r'Impedance:[ \t]*(.*)$', re.MULTILINE)
+GAIN_PATTERN = re.compile(r'Gain:[ \t]*`([^`]*)`')
+
+NUMBER_PATTERN = re.compile(r'[-+]?\d+(?:\.\d+)?')
+# Resistance: plain number with optional metric suffix, e.g. "38.09 Ω", "50.2"
+RESISTANCE_PATTERN = re.compile(r'(?<![A-Za-z0-9.])([-+]?\d+(?:\.\d+)?)\s*([mk])?(?![A-Za-z0-9.])')
+# Reactance: optional sign, 'j', number and optional metric suffix, e.g. "j5.838", "-j13.86 Ω", "+ j8.266", "j184m"
+REACTANCE_PATTERN = re.compile(r'([-+])?\s*j\s*(\d+(?:\.\d+)?)\s*([mk])?(?![A-Za-z0-9.])')
+METRIC_SUFFIXES = {None: 1.0, '': 1.0, 'm': 1e-3, 'k': 1e3}
+
+class MeasurementRecord(NamedTuple):
+    """Single measured point of a single antenna unit."""
+    antenna: str
+    band: str
+    label: str
+    swr: Optional[float]
+    resistance: Optional[float]
+    reactance: Optional[float]
+    gain: Optional[float]
+
+# Column names and types of the catalog index
+INDEX_COLUMNS = [
+    ('antenna', 'str'),
+    ('band', 'str'),
+    ('label', 'str'),
+    ('swr', 'float'),
+    ('resistance', 'float'),
+    ('reactance', 'float'),
+    ('gain', 'float'),
+    ('z_error', 'float'),
+]
+
+# Numeric columns the index stores sorted row orders of
+SORTED_FIELDS = tuple(name for name, column_type in INDEX_COLUMNS if column_type == 'float')
+
+# (band, field) -> rows sorted by the field value, band None stands for all rows
+SortedRows = Dict[Tuple[Optional[str], str], List[int]]
+
+def parse_frequency_band(heading: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a measurement heading into a normalized band and the remaining qualifier.
+
+    Args:
+        heading: Heading text, e.g. "868 MHz, straight" or "868 MHz (old)"
+
+    Returns:
+        Tuple of (band, qualifier), e.g. ("868 MHz", "straight"), or None if there's no frequency
+    """
+    match = FREQUENCY_PATTERN.search(heading)
+    if not match:
+        return None
+
+    low, high, unit = match.groups()
+    unit = FREQUENCY_UNITS[unit.lower()]
+    band = f"{low}-{high} {unit}" if high else f"{low} {unit}"
+
+    qualifier = (heading[:match.start()] + heading[match.end():]).strip(' ,;:-')
+    if qualifier.startswith('(') and qualifier.endswith(')') and qualifier.count('(') == 1:
+        qualifier = qualifier[1:-1].strip()
+    return band, qualifier
+
+def band_range_hz(band: str) -> Optional[Tuple[float, float]]:
+    """
+    Convert a normalized band like "868 MHz" or "433-466 MHz" into a frequency range in Hz.
+
+    Returns:
+        Tuple of (low, high), equal for single frequencies, or None if there's no frequency
+    """
+    match = FREQUENCY_PATTERN.search(band)
+    if not match:
+        return None
+    low, high, unit = match.groups()
+    multiplier = UNIT_MULTIPLIERS[FREQUENCY_UNITS[unit.lower()]]
+    return float(low) * multiplier, float(high or low) * multiplier
+
+def parse_number(text: str) -> Optional[float]:
+    """Parse the first number in a text, or None if there is none (e.g. '?dBi')."""
+    match = NUMBER_PATTERN.search(text)
+    return float(match.group()) if match else None
+
+def parse_impedance(text: str) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Parse resistance and reactance from an impedance value.
+
+    Args:
+        text: Impedance text, e.g. "`38.09 Ω`, `j5.838`", "`69.67 + j8.266 Ω`" or "`40.73 Ω`, `j184m`"
+
+    Returns:
+        Tuple of (resistance, reactance) in ohms, missing parts are None
+    """
+    values = re.findall(r'`([^`]*)`', text)
+    text = ' '.join(values) if values else text
+
+    reactance = None
+    match = REACTANCE_PATTERN.search(text)
+    if match:
+        sign, number, suffix = match.groups()
+        reactance = float(number) * METRIC_SUFFIXES[suffix] * (-1 if sign == '-' else 1)
+        text = text[:match.start()] + ' ' + text[match.end():]
+
+    resistance = None
+    match = RESISTANCE_PATTERN.search(text)
+    if match:
+        number, suffix = match.groups()
+        resistance = float(number) * METRIC_SUFFIXES[suffix]
+
+    return resistance, reactance
+
+def parse_swr(text: str) -> Optional[float]:
+    """Parse the first SWR value of a text, or None if it's missing or empty."""
+    match = SWR_PATTERN.search(text)
+    return parse_number(match.group(1)) if match else None
+
+def extract_declared_gain(document: HeadingNode) -> Optional[float]:
+    """Extract declared gain in dBi from the 'Declared specs'/'Declared specifications' section."""
+    for section in document.iter(level=2):
+        if section.title.lower().startswith('declared spec'):
+            match = GAIN_PATTERN.search(section.content)
+            if match:
+                return parse_number(match.group(1))
+    return None
+
+def _split_unit_groups(text: str) -> List[Tuple[str, str]]:
+    """Split subsection text into (unit label, text) groups by bold label lines."""
+    groups = []
+    label = ''
+    position = 0
+    for match in UNIT_LABEL_PATTERN.finditer(text):
+        groups.append((label, text[position:match.start()]))
+        label = match.group(1).strip()
+        position = match.end()
+    groups.append((label, text[position:]))
+    return groups
+
+def extract_measurements(antenna: str, content: str) -> List[MeasurementRecord]:
+    """
+    Extract measurement records from an antenna README.md.
+
+    Each '###' subsection of '## Measurements' with a frequency in its title is a band.
+    Bold lines like '**Antenna 1:**' start a new unit inside a band; a heading qualifier
+    like '868 MHz, straight' is used as the label otherwise. Units without any value are skipped.
+
+    Args:
+        antenna: Antenna directory name
+        content: README.md content
+
+    Returns:
+        List of measurement records in document order
+    """
+    document = parse_markdown(content)
+    gain = extract_declared_gain(document)
+
+    measurements = document.find('Measurements', level=2)
+    if measurements is None:
+        return []
+
+    records = []
+    for subsection in measurements.iter(level=3):
+        parsed = parse_frequency_band(subsection.title)
+        if parsed is None:
+            continue
+        band, qualifier = parsed
+
+        for unit_label, text in _split_unit_groups(subsection.body):
+            swr = parse_swr(text)
+            impedance = IMPEDANCE_PATTERN.search(text)
+            resistance, reactance = parse_impedance(impedance.group(1)) if impedance else (None, None)
+            if swr is None and resistance is None and reactance is None:
+                continue
+
+            label = ', '.join(part for part in (qualifier, unit_label) if part)
+            records.append(MeasurementRecord(antenna, band, label, swr, resistance, reactance, gain))
+
+    return records
+
+def extract_catalog(snapshot: CatalogSnapshot) -> Tuple[List[MeasurementRecord], Sources]:
+    """
+    Extract measurement records of every antenna in a snapshot.
+
+    Returns:
+        Tuple of (records, README.md sources by antenna name, see catalog_sources())
+    """
+    records = []
+    sources = catalog_sources(snapshot)
+    for name in sources:
+        content = snapshot.read_text(snapshot.antennas_dir / name / DETAILS_FILE_NAME)
+        records.extend(extract_measurements(name, content))
+    return records, sources
+
+def source_record(content: str, stat: os.stat_result) -> dict:
+    """Return the manifest record of a README.md: SHA-256 of its text plus size and mtime to skip rehashing."""
+    return {
+        'sha256': hashlib.sha256(content.encode('utf-8')).hexdigest(),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+    }
+
+def catalog_sources(snapshot: CatalogSnapshot) -> Sources:
+    """Return manifest records of the README.md files of the selected antennas by antenna name."""
+    sources = {}
+    for antenna in snapshot.antenna_dirs():
+        for entry in snapshot.children(antenna.path):
+            if entry.name == DETAILS_FILE_NAME and entry.is_file:
+                sources[antenna.name] = source_record(snapshot.read_text(entry.path), entry.stat())
+    return sources
+
+def index_is_current(index_dir: Path = CATALOG_INDEX_DIR, antennas_dir: Path = ANTENNAS_DIR) -> bool:
+    """
+    Check whether the catalog index was built from the current antenna README.md files.
+
+    Only the antennas directory is listed and README.md files are stat'ed; files are read
+    and hashed only when their size or mtime differs from the manifest (e.g. after a
+    checkout). Records of such files that turn out unchanged are refreshed in the
+    manifest, so they aren't hashed again.
+
+    Returns:
+        False if the index is missing, of an older format or out of date
+    """
+    manifest_path = Path(index_dir) / INDEX_MANIFEST_FILE
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if not isinstance(manifest, dict) or manifest.get('format_version') != INDEX_FORMAT_VERSION:
+        return False
+
+    sources: Sources = manifest.get('sources', {})
+    found = 0
+    refreshed = False
+    try:
+        with os.scandir(antennas_dir) as iterator:
+            for item in iterator:
+                if not item.is_dir():
+                    continue
+                readme_file = Path(item.path) / DETAILS_FILE_NAME
+                try:
+                    stat = readme_file.stat()
+                except FileNotFoundError:
+                    continue
+                known = sources.get(item.name)
+                if known is None:
+                    return False
+                found += 1
+                if known.get('size') == stat.st_size and known.get('mtime_ns') == stat.st_mtime_ns:
+                    continue
+                record = source_record(readme_file.read_text(encoding='utf-8'), stat)
+                if record['sha256'] != known.get('sha256'):
+                    return False
+                sources[item.name] = record
+                refreshed = True
+    except (OSError, UnicodeDecodeError):
+        return False
+    if found != len(sources):
+        # README.md files or whole antennas were removed
+        return False
+
+    if refreshed:
+        try:
+            with open(manifest_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+        except OSError:
+            pass
+    return True
+
+def _format_float(value: Optional[float]) -> str:
+    return '' if value is None else repr(value)
+
+def impedance_error(resistance: Optional[float], reactance: Optional[float]) -> Optional[float]:
+    """Return the distance of an impedance from REFERENCE_IMPEDANCE, missing reactance is taken as zero."""
+    if resistance is None:
+        return None
+    return abs(complex(resistance, reactance or 0.0) - REFERENCE_IMPEDANCE)
+
+def sort_rows(rows: List[tuple]) -> Dict[Optional[str], Dict[str, List[int]]]:
+    """
+    Sort row numbers of index rows by each numeric field, per band and over all rows.
+
+    Rows without a value of a field are left out of its order, equal values keep row order.
+
+    Returns:
+        Dict of band (None for all rows) -> field -> sorted row numbers
+    """
+    band_position = [name for name, _ in INDEX_COLUMNS].index('band')
+    band_rows: Dict[Optional[str], List[int]] = {None: list(range(len(rows)))}
+    for number, row in enumerate(rows):
+        band_rows.setdefault(row[band_position], []).append(number)
+
+    orders = {}
+    for band, numbers in band_rows.items():
+        orders[band] = {}
+        for position, (name, column_type) in enumerate(INDEX_COLUMNS):
+            if column_type != 'float':
+                continue
+            orders[band][name] = sorted(
+                (number for number in numbers if rows[number][position] is not None),
+                key=lambda number: rows[number][position]
+            )
+    return orders
+
+def write_catalog_index(records: List[MeasurementRecord], sources: Sources,
+                        output_dir: Path = CATALOG_INDEX_DIR) -> Path:
+    """
+    Write records as CSV, their sorted row orders and a JSON manifest describing columns and sources.
+
+    Returns:
+        Path to the manifest file
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    rows = [tuple(record) + (impedance_error(record.resistance, record.reactance),) for record in records]
+    with open(output_dir / INDEX_DATA_FILE, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow([name for name, _ in INDEX_COLUMNS])
+        for row in rows:
+            writer.writerow([
+                value if column_type == 'str' else _format_float(value)
+                for (_, column_type), value in zip(INDEX_COLUMNS, row)
+            ])
+
+    orders = sort_rows(rows)
+    with open(output_dir / INDEX_SORTED_FILE, 'w', encoding='utf-8') as f:
+        json.dump({
+            'format_version': INDEX_FORMAT_VERSION,
+            'all': orders.pop(None),
+            'bands': orders
+        }, f, ensure_ascii=False, separators=(',', ':'))
+
+    manifest = {
+        'format_version': INDEX_FORMAT_VERSION,
+        'data_file': INDEX_DATA_FILE,
+        'rows': len(records),
+        'columns': [{'name': name, 'type': column_type} for name, column_type in INDEX_COLUMNS],
+        'sources': sources
+    }
+    manifest_path = output_dir / INDEX_MANIFEST_FILE
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+    return manifest_path
+
+def load_catalog_index(index_dir: Path = CATALOG_INDEX_DIR) -> Dict[str, list]:
+    """
+    Load the catalog index into columns.
+
+    String columns are returned as lists, float columns as array('d') with NaN for missing values.
+
+    Raises:
+        ValueError: If the index was written in an unsupported format
+    """
+    index_dir = Path(index_dir)
+    with open(index_dir / INDEX_MANIFEST_FILE, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    if manifest.get('format_version') != INDEX_FORMAT_VERSION:
+        raise ValueError(f"unsupported catalog index format: {manifest.get('format_version')}")
+
+    columns_spec = [(column['name'], column['type']) for column in manifest['columns']]
+    columns = {name: (array('d') if column_type == 'float' else []) for name, column_type in columns_spec}
+
+    with open(index_dir / manifest['data_file'], 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        next(reader)
+        for row in reader:
+            for (name, column_type), value in zip(columns_spec, row):
+                if column_type == 'float':
+                    columns[name].append(float(value) if value else math.nan)
+                else:
+                    columns[name].append(value)
+
+    return columns
+
+def load_sorted_rows(index_dir: Path = CATALOG_INDEX_DIR) -> SortedRows:
+    """
+    Load the row orders of the catalog index sorted by each numeric field.
+
+    Raises:
+        ValueError: If the index was written in an unsupported format
+    """
+    with open(Path(index_dir) / INDEX_SORTED_FILE, 'r', encoding='utf-8') as f:
+        orders = json.load(f)
+
+    if orders.get('format_version') != INDEX_FORMAT_VERSION:
+        raise ValueError(f"unsupported catalog index format: {orders.get('format_version')}")
+
+    sorted_rows: SortedRows = {(None, field): rows for field, rows in orders['all'].items()}
+    for band, fields in orders['bands'].items():
+        for field, rows in fields.items():
+            sorted_rows[(band, field)] = rows
+    return sorted_rows
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Extract antenna measurements into a catalog index.")
+    parser.add_argument(
+        '--output', type=Path, default=CATALOG_INDEX_DIR, metavar='DIR',
+        help=f"directory to write the index to (default: {CATALOG_INDEX_DIR})"
+    )
+    args = parser.parse_args()
+
+    try:
+        print(PROGRESS_TEMPLATES['extracting_measurements'])
+        snapshot = CatalogSnapshot(ANTENNAS_DIR)
+        if not snapshot.antennas_dir_exists:
+            print(ERROR_TEMPLATES['no_antennas_dir'])
+            sys.exit(0)
+
+        records, sources = extract_catalog(snapshot)
+        manifest_path = write_catalog_index(records, sources, args.output)
+        print(SUCCESS_TEMPLATES['catalog_index'].format(rows=len(records), antennas=len(sources), path=manifest_path))
+        sys.exit(0)
+    except Exception as e:
+        print(f"❌ Unexpected error in measurement extraction: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
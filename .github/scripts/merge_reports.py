@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Merge of validation reports written by shards of the catalog.
+Combines the JSON Lines, JUnit XML or SARIF reports of `validate_all.py --shard i/N`
+jobs into one report of the same format, e.g. for a single code scanning upload.
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from xml.etree import ElementTree
+
+# Import configuration and utilities
+try:
+    from messages import ERROR_TEMPLATES, SUCCESS_TEMPLATES, PROGRESS_TEMPLATES
+    from report import SARIF_LEVELS, Finding, write_junit, write_sarif
+except ImportError as e:
+    print(f"❌ Error: Could not import required modules: {e}")
+    sys.exit(1)
+
+# Report format by file suffix
+REPORT_FORMATS = {'.jsonl': 'jsonl', '.xml': 'junit', '.sarif': 'sarif', '.json': 'sarif'}
+
+# Failure line of a JUnit test case: "[code] path: message" ('-' without a path)
+JUNIT_LINE_PATTERN = re.compile(r'^\[([^\]]+)\] (.*?): (.*)$')
+
+SEVERITY_OF_LEVEL = {level: severity for severity, level in SARIF_LEVELS.items()}
+
+# stage -> (seconds, number of findings), like Reporter.stages
+Stages = Dict[str, Tuple[float, int]]
+
+def report_format(path: Path) -> Optional[str]:
+    return REPORT_FORMATS.get(path.suffix.lower())
+
+def read_jsonl(path: Path) -> List[Finding]:
+    findings = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                findings.append(Finding(**json.loads(line)))
+    return findings
+
+def read_junit(path: Path, stages: Stages) -> List[Finding]:
+    """Read findings of a JUnit report, adding its stages to `stages`."""
+    findings = []
+    for case in ElementTree.parse(path).getroot().iter('testcase'):
+        stage = case.get('name', '')
+        seconds, count = stages.get(stage, (0.0, 0))
+        seconds += float(case.get('time') or 0)
+        failure = case.find('failure')
+        if failure is not None:
+            for line in (failure.text or '').splitlines():
+                match = JUNIT_LINE_PATTERN.match(line)
+                if match:
+                    code, finding_path, message = match.groups()
+                    findings.append(Finding(stage, code, 'error', None if finding_path == '-' else finding_path,
+                                            message))
+                    count += 1
+        stages[stage] = (seconds, count)
+    return findings
+
+def read_sarif(path: Path) -> List[Finding]:
+    with open(path, 'r', encoding='utf-8') as f:
+        sarif = json.load(f)
+    findings = []
+    for run in sarif.get('runs', []):
+        for result in run.get('results', []):
+            locations = result.get('locations') or [{}]
+            uri = locations[0].get('physicalLocation', {}).get('artifactLocation', {}).get('uri')
+            findings.append(Finding('', result.get('ruleId', ''), SEVERITY_OF_LEVEL.get(result.get('level'), 'error'),
+                                    uri, result.get('message', {}).get('text', '')))
+    return findings
+
+def merge_reports(inputs: List[Path], output: Path) -> List[str]:
+    """
+    Merge shard reports into `output`.
+
+    All reports must have the format of the output file. Findings are kept in input
+    order; JUnit test cases of a stage that ran on several shards are combined, with
+    their times added up.
+
+    Args:
+        inputs: Reports of the shards
+        output: Merged report to write
+
+    Returns:
+        List of error messages
+    """
+    errors = []
+
+    print(PROGRESS_TEMPLATES['merging_reports'].format(count=len(inputs), path=output))
+
+    output_format = report_format(output)
+    if output_format is None:
+        errors.append(ERROR_TEMPLATES['report_format_error'].format(path=output))
+        return errors
+
+    findings: List[Finding] = []
+    stages: Stages = {}
+    for path in inputs:
+        if report_format(path) != output_format:
+            errors.append(ERROR_TEMPLATES['report_format_error'].format(path=path))
+            continue
+        try:
+            if output_format == 'jsonl':
+                findings.extend(read_jsonl(path))
+            elif output_format == 'junit':
+                findings.extend(read_junit(path, stages))
+            else:
+                findings.extend(read_sarif(path))
+        except (OSError, ValueError, TypeError, ElementTree.ParseError) as e:
+            errors.append(ERROR_TEMPLATES['report_read_error'].format(path=path, error=e))
+    if errors:
+        return errors
+
+    try:
+        if output_format == 'jsonl':
+            with open(output, 'w', encoding='utf-8') as f:
+                for finding in findings:
+                    f.write(json.dumps(finding._asdict(), ensure_ascii=False) + '\n')
+        elif output_format == 'junit':
+            write_junit(findings, stages, output)
+        else:
+            write_sarif(findings, output)
+    except OSError as e:
+        errors.append(ERROR_TEMPLATES['report_write_error'].format(error=e))
+        return errors
+
+    print(SUCCESS_TEMPLATES['reports_merged'].format(findings=len(findings), count=len(inputs), path=output))
+    return errors
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Merge validation reports of catalog shards.")
+    parser.add_argument('reports', nargs='+', type=Path, metavar='REPORT',
+                        help="shard reports (.jsonl, JUnit .xml or .sarif)")
+    parser.add_argument('--output', '-o', type=Path, required=True, metavar='FILE',
+                        help="merged report, of the same format as the shard reports")
+    args = parser.parse_args()
+
+    try:
+        errors = merge_reports(args.reports, args.output)
+
+        if errors:
+            for error in errors:
+                print(error)
+            sys.exit(1)
+        sys.exit(0)
+    except Exception as e:
+        print(f"❌ Unexpected error while merging reports: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
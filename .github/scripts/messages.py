@@ -12,14 +12,29 @@ ERROR_TEMPLATES = {
     'image_wrong_location': "❌ Image '{path}' found in antenna root directory. Images must be in 'images/' subdirectory",
     'image_unsupported_format': "❌ Image '{path}' has unsupported format '{ext}'. Only .jpg, .jpeg, .webp, .png are allowed",
     'image_invalid_naming': "❌ Image '{path}' does not use snake_case naming convention",
+    'image_unrecognized': "❌ Image '{path}' is not a valid image file",
+    'image_format_mismatch': "❌ Image '{path}' has extension '{ext}' but contains {format} data",
+    'image_resolution_exceeded': "❌ Image '{path}' is {width}x{height}, exceeds {max_size}px limit on the longest side",
+    'image_read_error': "❌ Could not read image '{path}': {error}",
+    'image_corrupt': "❌ Image '{path}' is truncated or corrupted: {problem}",
+    'image_metadata': "❌ Image '{path}' contains {metadata} ({size:.1f}KB), run strip_image_metadata.py",
+    'image_strip_error': "❌ Could not strip metadata from image '{path}': {error}",
+    'orphan_image': "❌ Image '{path}' isn't referenced by any README.md",
     'missing_details': "❌ Directory '{name}' is missing required 'README.md' file",
-    'unauthorized_file': "❌ Directory '{name}' contains unauthorized file '{file}'. Only 'README.md' and 'images/' directory are allowed",
-    'unauthorized_subdir': "❌ Directory '{name}' contains unauthorized subdirectory '{subdir}'. Only 'images/' directory is allowed",
+    'unauthorized_file': "❌ Directory '{name}' contains unauthorized file '{file}'. Only 'README.md', 'images/' and 'data/' directories are allowed",
+    'unauthorized_subdir': "❌ Directory '{name}' contains unauthorized subdirectory '{subdir}'. Only 'images/' and 'data/' directories are allowed",
+    'data_not_directory': "❌ Directory '{name}' contains 'data' but it's not a directory",
+    'unsupported_data_file': "❌ Data file '{path}' has unsupported format '{ext}'. Only .s1p (Touchstone) files are allowed",
+    'sweep_parse_error': "❌ Could not read Touchstone file '{path}': {error}",
+    'sweep_value_mismatch': "❌ Antenna '{name}' measurement '{measurement}' doesn't match the sweep: README.md has {quoted}, '{path}' has {measured} at {frequency}",
+    'numpy_required': "❌ Error: NumPy is required to analyze sweeps, install it with 'pip install numpy'",
+    'numpy_missing': "⚠️  NumPy is not installed, skipping comparison of README.md measurements with sweeps",
     'images_not_directory': "❌ Directory '{name}' contains 'images' but it's not a directory",
     'no_antennas_dir': "ℹ️  No antennas directory found, skipping validation",
     'readme_missing': "❌ README.md file not found in root directory",
     'antenna_not_linked': "❌ Antenna directory '{name}' is not linked from README.md",
     'broken_internal_link': "❌ README.md links to non-existing path: {link}",
+    'non_existing_root_image': "❌ README.md references non-existing image: {image}",
     'invalid_external_link': "❌ README.md contains invalid external link: {link}",
     'malformed_external_link': "❌ README.md contains malformed external link: {link}",
     'missing_required_section': "❌ Antenna '{name}' is missing required section '## {section}'",
@@ -27,8 +42,10 @@ ERROR_TEMPLATES = {
     'missing_measurements_subsection': "❌ Antenna '{name}' section 'Measurements' must contain at least one subsection (###)",
     'missing_swr_in_subsection': "❌ Antenna '{name}' subsection '{subsection}' must contain 'SWR'",
     'missing_impedance_in_subsection': "❌ Antenna '{name}' subsection '{subsection}' must contain 'Impedance'",
+    'missing_top_photo': "❌ {name}: Antenna photo should be displayed at the top of the file after the header",
     'non_existing_image': "❌ Antenna '{name}' references non-existing image: {image}",
     'non_image_file': "❌ Antenna '{name}' references non-image file: {image}",
+    'absolute_image_reference': "❌ Antenna '{name}' references image by absolute path: {image}, use a path relative to README.md",
     'readme_error': "❌ Error reading README.md: {error}",
     'missing_antennas_section': "❌ README.md is missing '## Antennas' section",
     'antenna_not_link': "❌ Antenna subsection '{subsection}' must be a link to README.md",
@@ -38,7 +55,37 @@ ERROR_TEMPLATES = {
     'missing_frequency_subsection': "❌ Antenna subsection '{subsection}' must contain at least one frequency subsection",
     'no_frequency_subsection': "❌ Antenna subsection '{subsection}' must contain at least one frequency subsection (e.g., '868 MHz', '433-466 MHz')",
     'frequency_missing_swr': "❌ Frequency subsection '{frequency}' in '{subsection}' must contain 'SWR'",
-    'details_read_error': "❌ Error reading README.md for antenna '{name}': {error}"
+    'summary_gain_mismatch': "❌ README.md lists gain '{summary}' for '{name}' but its README.md declares '{declared}'",
+    'summary_band_missing': "❌ README.md summary of '{name}' is missing band '{band}' measured in its README.md",
+    'summary_band_extra': "❌ README.md summary of '{name}' lists band '{band}' not measured in its README.md",
+    'summary_unit_missing': "❌ README.md summary of '{name}' at {band} is missing {unit} measured in its README.md",
+    'summary_unit_extra': "❌ README.md summary of '{name}' at {band} lists {unit} not measured in its README.md",
+    'summary_value_mismatch': "❌ README.md summary of '{name}' has {field} '{summary}' at {band} for {unit} but its README.md has '{actual}'",
+    'details_read_error': "❌ Error reading README.md for antenna '{name}': {error}",
+    'git_diff_error': "❌ Could not get changes since '{ref}': {error}",
+    'git_revision_error': "❌ Could not read git revision '{rev}': {error}",
+    'git_range_error': "❌ Could not list commits of '{range}': {error}",
+    'range_failed': "❌ {failed} of {count} commit(s) failed validation, first failing commit: {commit}",
+    'readme_outdated': "❌ README.md 'Antennas' section is out of date, run generate_readme.py",
+    'duplicate_image': "❌ Image '{path}' duplicates '{other}' from another antenna (hash distance {distance})",
+    'pillow_missing_duplicates': "⚠️  Pillow is not installed, skipping duplicate image detection",
+    'image_hash_index_write_error': "⚠️  Could not write image hash index '{path}': {error}",
+    'pillow_missing': "❌ Error: Pillow is required to optimize images, install it with 'pip install Pillow'",
+    'image_optimize_error': "❌ Could not optimize image '{path}': {error}",
+    'image_target_exists': "❌ Could not convert image '{path}': '{target}' already exists",
+    'invalid_query': "❌ Invalid condition '{condition}', expected <field><op><value> with one of fields: {fields}",
+    'catalog_index_error': "❌ Could not load catalog index '{path}': {error}",
+    'benchmark_regression': "❌ {name} with {count} antennas is {ratio:.2f}x slower than the baseline ({baseline:.3f}s -> {seconds:.3f}s)",
+    'dead_external_link': "❌ Link '{url}' in '{path}' is dead: {reason}",
+    'unverified_external_link': "⚠️  Could not verify link '{url}' in '{path}': {reason}",
+    'links_offline': "⚠️  No host answered and no known host resolves, {count} external link(s) couldn't be checked (no network access?)",
+    'link_cache_write_error': "⚠️  Could not write link check cache '{path}': {error}",
+    'report_write_error': "⚠️  Could not write validation report: {error}",
+    'report_read_error': "❌ Could not read report {path}: {error}",
+    'report_format_error': "❌ Unknown report format of {path}, expected .jsonl, .xml or .sarif",
+    'stage_skipped': "⚠️  Skipped {stage} validation: error limit reached",
+    'timings_write_error': "⚠️  Could not write timings '{path}': {error}",
+    'cache_write_error': "⚠️  Could not write validation cache '{path}': {error}"
 }
 
 # Success message templates
@@ -49,7 +96,25 @@ SUCCESS_TEMPLATES = {
     'required_files': "✅ All antenna directories have proper structure!",
     'readme_validation': "✅ README.md validation passed!",
     'details_validation': "✅ README.md validation passed!",
-    'all_checks': "✅ All antenna structure validation checks passed!"
+    'summary_consistency': "✅ README.md summary matches antenna README.md files!",
+    'sweeps': "✅ All sweep files are valid and match README.md measurements!",
+    'all_checks': "✅ All antenna structure validation checks passed!",
+    'readme_generated': "✅ Regenerated {count} antenna block(s) in README.md",
+    'readme_up_to_date': "✅ README.md 'Antennas' section is up to date!",
+    'images_optimized': "✅ Optimized {count} image(s), saved {saved:.1f}KB",
+    'sweeps_analyzed': "✅ Analyzed {sweeps} sweep(s) of {antennas} antenna(s)",
+    'query_results': "✅ {count} matching measurement(s)",
+    'benchmark_saved': "✅ Benchmark results written to {path}",
+    'benchmark_no_regressions': "✅ No regressions against the baseline",
+    'image_duplicates': "✅ No duplicate images across antennas!",
+    'image_integrity': "✅ All images are complete!",
+    'image_metadata': "✅ No metadata in images!",
+    'image_orphans': "✅ All images are referenced!",
+    'images_stripped': "✅ Removed metadata from {count} image(s), saved {saved:.1f}KB",
+    'external_links': "✅ All external links are reachable!",
+    'range': "✅ All {count} commit(s) passed validation!",
+    'reports_merged': "✅ Merged {findings} finding(s) of {count} report(s) into {path}",
+    'catalog_index': "✅ Wrote {rows} measurement records of {antennas} antennas to {path}"
 }
 
 # Progress message templates
@@ -60,12 +125,54 @@ PROGRESS_TEMPLATES = {
     'required_files': "📄 Validating required files in antenna directories...",
     'readme_validation': "📖 Validating README.md links...",
     'readme_sections': "📋 Validating README.md antenna sections...",
+    'summary_consistency': "🔗 Comparing README.md summary with antenna README.md files...",
     'details_validation': "📄 Validating README.md files...",
     'starting': "🔍 Starting antenna structure validation...",
+    'generating_readme': "📝 Generating README.md 'Antennas' section...",
+    'regenerated_block': "  🔄 {name}: Regenerated",
+    'extracting_measurements': "📐 Extracting measurements from antenna README.md files...",
+    'catalog_index_stale': "🔄 Catalog index is out of date (antenna README.md files changed), rebuilding it",
+    'changed_antennas': "🔀 Validating {count} antenna directories changed since {ref}",
+    'rules_changed': "🔀 Validation scripts changed since {ref}, validating all antenna directories",
+    'validating_revision': "🔀 Validating {name} ({rev}) from the git object store",
+    'range_commits': "🔀 Validating {count} commit(s) of {range} from the git object store...",
+    'range_commit_passed': "  ✅ {commit} {subject}{note}",
+    'range_commit_failed': "  ❌ {commit} {subject}: {count} issue(s), {new} new, {fixed} fixed{note}",
+    'range_new_issue': "      + {error}",
+    'range_reused': " (same files as {commit}, results reused)",
+    'shard': "🧩 Validating shard {shard}: {count} of {total} antenna directories",
+    'shard_catalog_stages': "🧩 Shard {shard} also runs catalog-wide stages: {stages}",
+    'merging_reports': "🧩 Merging {count} report(s) into {path}...",
+    'cache_stats': "♻️  Reused cached results for {hits} of {total} antenna checks",
+    'optimizing_images': "🗜️  Optimizing images in antenna directories...",
+    'optimized_image': "  🗜️  {path}: {old_size:.1f}KB -> {new_size:.1f}KB ({width}x{height})",
+    'renamed_image_reference': "    🔗 {readme}: {old} -> {new}",
+    'sweeps': "📈 Validating Touchstone sweep files...",
+    'valid_sweep': "  ✅ {path}: {points} points, {start}-{stop}",
+    'analyzing_sweeps': "📈 Analyzing sweep files...",
+    'benchmark_generating': "🏗️  Generating synthetic catalog of {count} antennas...",
+    'benchmark_result': "  ⏱️  {name}: {seconds:.3f}s",
+    'watching': "👀 Watching antennas/ and README.md for changes ({mode}), press Ctrl+C to stop...",
+    'watch_changes': "\n🔄 {count} changed path(s), re-running: {stages}",
+    'watch_finished': "⏱️  Validated in {seconds:.3f}s, waiting for changes...",
+    'timings_header': "\n⏱️  Stage timings:",
+    'stage_timing': "  {stage}: {wall:.3f}s wall, {cpu:.3f}s CPU, {files} files, {read} read, {rss} peak RSS",
+    'timings_written': "📊 Timings written to {path}",
+    'image_metadata': "🏷️  Checking images for EXIF, GPS and other metadata...",
+    'stripping_images': "🧽 Removing metadata from images...",
+    'stripped_image': "  🧽 {path}: removed {metadata} ({old_size:.1f}KB -> {new_size:.1f}KB)",
+    'image_integrity': "🩺 Checking image files for truncation and corruption...",
+    'image_orphans': "🔗 Looking for images not referenced by any README.md...",
+    'image_duplicates': "🧬 Looking for duplicate images across antennas...",
+    'hashed_images': "  🧬 {count} image(s) indexed, {hashed} decoded",
+    'external_links': "🌐 Checking external links...",
+    'checking_links': "  🌐 {count} link(s) on {hosts} host(s) to check, {cached} fresh in cache",
+    'valid_link': "  ✅ {url}: {reason}",
     'checking_dir': "  Checking directory: {name}",
     'valid_image': "  ✅ {path}: Valid image",
     'valid_file_size': "  ✅ {path}: {size:.1f}KB",
     'valid_directory': "  ✅ {name}: Valid snake_case naming",
     'found_details': "    ✅ Found README.md",
-    'found_images': "    ✅ Found images/ directory"
+    'found_images': "    ✅ Found images/ directory",
+    'found_data': "    ✅ Found data/ directory"
 } 
\ No newline at end of file
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Image optimizer for antenna directories.
+Recompresses and downscales images in antenna 'images/' directories that exceed
+the file size or resolution limits, searching for the best quality that fits.
+Images it has written are recorded in a hash manifest and skipped on later runs.
+Requires Pillow.
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Import configuration
+try:
+    from config import (
+        ANTENNAS_DIR, DETAILS_FILE_NAME, IMAGES_DIR_NAME, ALLOWED_IMAGE_EXTENSIONS,
+        MAX_FILE_SIZE_BYTES, MAX_IMAGE_DIMENSION, IMAGE_QUALITY_MIN, IMAGE_QUALITY_MAX,
+        OPTIMIZED_IMAGES_MANIFEST_FILE,
+        ERROR_TEMPLATES, SUCCESS_TEMPLATES, PROGRESS_TEMPLATES
+    )
+    from catalog import CatalogEntry, CatalogSnapshot
+    from image_headers import EXTENSION_FORMATS, probe_image
+except ImportError:
+    print("❌ Error: Could not import configuration file")
+    sys.exit(1)
+
+# Pillow is only needed by this tool, not by the validation
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+
+# Bump when the optimization settings change to re-optimize all images
+MANIFEST_FORMAT_VERSION = 1
+
+# Images are downscaled by this factor when even the lowest quality doesn't fit
+DOWNSCALE_FACTOR = 0.8
+# Don't downscale the longest side below this
+MIN_IMAGE_DIMENSION = 320
+
+# Pillow format names and file extensions of optimizer output formats
+PILLOW_FORMATS = {'jpeg': 'JPEG', 'png': 'PNG', 'webp': 'WEBP'}
+FORMAT_EXTENSIONS = {'jpeg': '.jpg', 'png': '.png', 'webp': '.webp'}
+
+class OptimizedImage(NamedTuple):
+    """Result of optimizing a single image."""
+    path: Path
+    new_path: Path
+    data: bytes
+    old_size: int
+    width: int
+    height: int
+
+def file_sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+def needs_optimization(snapshot: CatalogSnapshot, entry: CatalogEntry) -> bool:
+    """Check whether an image exceeds the file size or resolution limits (only the header is read)."""
+    if entry.size > MAX_FILE_SIZE_BYTES:
+        return True
+    with snapshot.open_binary(entry.path) as f:
+        info = probe_image(f)
+    return info is not None and info.width is not None and max(info.width, info.height) > MAX_IMAGE_DIMENSION
+
+def encode_image(image, image_format: str, quality: Optional[int] = None) -> bytes:
+    """Encode an image into the given format ('jpeg', 'png' or 'webp')."""
+    if image_format == 'png':
+        options = {'optimize': True, 'compress_level': 9}
+    elif image_format == 'webp':
+        options = {'quality': quality, 'method': 6}
+    else:
+        options = {'quality': quality, 'optimize': True}
+    icc_profile = image.info.get('icc_profile')
+    if icc_profile:
+        options['icc_profile'] = icc_profile
+
+    buffer = io.BytesIO()
+    image.save(buffer, PILLOW_FORMATS[image_format], **options)
+    return buffer.getvalue()
+
+def encode_best_quality(image, image_format: str, max_size: int) -> Optional[bytes]:
+    """
+    Binary search the highest quality whose encoded size fits into `max_size`.
+
+    Returns:
+        Encoded image, or None if even the lowest quality doesn't fit (or a lossless PNG doesn't fit)
+    """
+    if image_format == 'png':
+        data = encode_image(image, image_format)
+        return data if len(data) <= max_size else None
+
+    # Most images fit at the highest quality, skip the search for them
+    best = encode_image(image, image_format, IMAGE_QUALITY_MAX)
+    if len(best) <= max_size:
+        return best
+
+    best = None
+    low, high = IMAGE_QUALITY_MIN, IMAGE_QUALITY_MAX - 1
+    while low <= high:
+        quality = (low + high) // 2
+        data = encode_image(image, image_format, quality)
+        if len(data) <= max_size:
+            best = data
+            low = quality + 1
+        else:
+            high = quality - 1
+    return best
+
+def lossy_format(image) -> str:
+    """Format to convert a PNG photo to: WebP keeps transparency, JPEG otherwise."""
+    has_alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+    return 'webp' if has_alpha else 'jpeg'
+
+def optimize_image(path: Path, max_size: int = MAX_FILE_SIZE_BYTES) -> OptimizedImage:
+    """
+    Fit an image into the size and resolution limits.
+
+    The image is downscaled to MAX_IMAGE_DIMENSION first, then encoded with the highest
+    quality that fits into `max_size`, downscaling further while it doesn't fit.
+    PNG images are kept lossless if possible and converted to JPEG (or WebP if they
+    have transparency) otherwise.
+
+    Raises:
+        OSError: If the image can't be read
+        ValueError: If the image can't be fit into the limits
+    """
+    with open(path, 'rb') as f:
+        original = f.read()
+
+    with Image.open(io.BytesIO(original)) as source:
+        image = ImageOps.exif_transpose(source)
+        image.load()
+
+    image_format = EXTENSION_FORMATS[path.suffix.lower()]
+    image.thumbnail((MAX_IMAGE_DIMENSION, MAX_IMAGE_DIMENSION), Image.LANCZOS)
+
+    data = encode_best_quality(image, image_format, max_size) if image_format == 'png' else None
+    if data is None and image_format == 'png':
+        image_format = lossy_format(image)
+    if image_format == 'jpeg' and image.mode not in ('RGB', 'L'):
+        image = image.convert('RGB')
+
+    while data is None:
+        data = encode_best_quality(image, image_format, max_size)
+        if data is not None:
+            break
+        width, height = image.size
+        if max(width, height) * DOWNSCALE_FACTOR < MIN_IMAGE_DIMENSION:
+            raise ValueError(f"can't fit into {max_size // 1024}KB")
+        image = image.resize(
+            (max(1, round(width * DOWNSCALE_FACTOR)), max(1, round(height * DOWNSCALE_FACTOR))),
+            Image.LANCZOS
+        )
+
+    # Keep the original extension spelling (e.g. '.jpeg') if the format didn't change
+    new_path = path
+    if EXTENSION_FORMATS[path.suffix.lower()] != image_format:
+        new_path = path.with_suffix(FORMAT_EXTENSIONS[image_format])
+
+    return OptimizedImage(path, new_path, data, len(original), image.size[0], image.size[1])
+
+def update_image_references(readme_path: Path, old_name: str, new_name: str) -> bool:
+    """
+    Replace links to 'images/<old_name>' with 'images/<new_name>' in an antenna README.md.
+
+    Returns:
+        True if the file was changed
+    """
+    if not readme_path.exists():
+        return False
+    content = readme_path.read_text(encoding='utf-8')
+    pattern = re.compile(r'(\]\((?:\./)?' + re.escape(IMAGES_DIR_NAME) + r'/)' + re.escape(old_name) + r'(\s*(?:"[^"]*")?\))')
+    new_content = pattern.sub(lambda match: match.group(1) + new_name + match.group(2), content)
+    if new_content == content:
+        return False
+    readme_path.write_text(new_content, encoding='utf-8')
+    return True
+
+def write_atomic(path: Path, data: bytes):
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+class OptimizedManifest:
+    """
+    SHA-256 hashes of images written (or already checked) by the optimizer, keyed by path.
+
+    strip_image_metadata.py keeps its own manifest with a separate file and format version.
+    """
+
+    def __init__(self, path: Path = OPTIMIZED_IMAGES_MANIFEST_FILE, format_version: int = MANIFEST_FORMAT_VERSION):
+        self.path = Path(path)
+        self.format_version = format_version
+        self.hashes: Dict[str, str] = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('format_version') == self.format_version:
+                self.hashes = data.get('hashes', {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def is_optimized(self, path: Path, data_hash: str) -> bool:
+        return self.hashes.get(path.as_posix()) == data_hash
+
+    def mark(self, path: Path, data_hash: str):
+        self.hashes[path.as_posix()] = data_hash
+
+    def forget(self, path: Path):
+        self.hashes.pop(path.as_posix(), None)
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'format_version': self.format_version, 'hashes': self.hashes}, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+def find_candidates(snapshot: CatalogSnapshot, manifest: OptimizedManifest,
+                    recompress_all: bool = False) -> List[Tuple[CatalogEntry, bool]]:
+    """
+    Find images in antenna 'images/' directories to optimize.
+
+    Returns:
+        List of (entry, exceeds limits) tuples; images within limits are only included
+        with `recompress_all` and if the manifest doesn't mark them as optimized already
+    """
+    candidates = []
+    for antenna in snapshot.antenna_dirs():
+        for entry in snapshot.files(antenna.path / IMAGES_DIR_NAME):
+            if entry.path.suffix.lower() not in ALLOWED_IMAGE_EXTENSIONS:
+                continue
+            if needs_optimization(snapshot, entry):
+                candidates.append((entry, True))
+                continue
+            if recompress_all:
+                with snapshot.open_binary(entry.path) as f:
+                    data_hash = hashlib.file_digest(f, 'sha256').hexdigest()
+                if not manifest.is_optimized(entry.path, data_hash):
+                    candidates.append((entry, False))
+    return candidates
+
+def apply_result(result: OptimizedImage, required: bool, manifest: OptimizedManifest,
+                 dry_run: bool = False) -> List[str]:
+    """
+    Write an optimized image, renaming it and updating README.md links if the extension changed.
+
+    Images that were within limits are only replaced if the result is smaller,
+    otherwise the original is marked as optimized in the manifest.
+    """
+    errors = []
+    if not required and len(result.data) >= result.old_size:
+        if not dry_run:
+            manifest.mark(result.path, file_sha256(result.path.read_bytes()))
+        return errors
+
+    print(PROGRESS_TEMPLATES['optimized_image'].format(
+        path=result.path, old_size=result.old_size / 1024, new_size=len(result.data) / 1024,
+        width=result.width, height=result.height
+    ))
+
+    if result.new_path != result.path and result.new_path.exists():
+        error_msg = ERROR_TEMPLATES['image_target_exists'].format(path=result.path, target=result.new_path)
+        errors.append(error_msg)
+        print(error_msg)
+        return errors
+
+    if dry_run:
+        return errors
+
+    write_atomic(result.new_path, result.data)
+    manifest.mark(result.new_path, file_sha256(result.data))
+
+    if result.new_path != result.path:
+        result.path.unlink()
+        manifest.forget(result.path)
+        readme_path = result.path.parent.parent / DETAILS_FILE_NAME
+        if update_image_references(readme_path, result.path.name, result.new_path.name):
+            print(PROGRESS_TEMPLATES['renamed_image_reference'].format(
+                readme=readme_path, old=result.path.name, new=result.new_path.name
+            ))
+
+    return errors
+
+def optimize_images(snapshot: CatalogSnapshot, manifest: OptimizedManifest, jobs: int = 1,
+                    recompress_all: bool = False, dry_run: bool = False) -> List[str]:
+    """
+    Optimize all images exceeding the limits (or all not yet optimized images with `recompress_all`).
+
+    Images are encoded on a thread pool (Pillow releases the GIL while encoding),
+    results are written from the calling thread in catalog order.
+
+    Returns:
+        List of error messages
+    """
+    errors = []
+    print(PROGRESS_TEMPLATES['optimizing_images'])
+    candidates = find_candidates(snapshot, manifest, recompress_all)
+
+    def run(candidate: Tuple[CatalogEntry, bool]):
+        entry, required = candidate
+        try:
+            return optimize_image(entry.path), required, None
+        except (OSError, ValueError) as e:
+            return None, required, ERROR_TEMPLATES['image_optimize_error'].format(path=entry.path, error=e)
+
+    saved = 0
+    optimized = 0
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        for result, required, error_msg in executor.map(run, candidates):
+            if error_msg:
+                errors.append(error_msg)
+                print(error_msg)
+                continue
+            result_errors = apply_result(result, required, manifest, dry_run)
+            errors.extend(result_errors)
+            if not result_errors and (required or len(result.data) < result.old_size):
+                optimized += 1
+                saved += result.old_size - len(result.data)
+
+    print(SUCCESS_TEMPLATES['images_optimized'].format(count=optimized, saved=saved / 1024))
+    return errors
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Fit antenna images into the file size and resolution limits.")
+    parser.add_argument('antennas', nargs='*', metavar='ANTENNA', help="antenna directory names (default: all)")
+    parser.add_argument(
+        '--jobs', '-j', type=int, default=os.cpu_count() or 1, metavar='N',
+        help="number of images encoded in parallel (default: number of CPUs)"
+    )
+    parser.add_argument(
+        '--all', action='store_true', dest='recompress_all',
+        help="also recompress images within limits that weren't optimized yet"
+    )
+    parser.add_argument('--dry-run', action='store_true', help="only show what would be changed")
+    args = parser.parse_args()
+
+    if Image is None:
+        print(ERROR_TEMPLATES['pillow_missing'])
+        sys.exit(1)
+
+    try:
+        snapshot = CatalogSnapshot(ANTENNAS_DIR, antenna_names=args.antennas or None)
+        if not snapshot.antennas_dir_exists:
+            print(ERROR_TEMPLATES['no_antennas_dir'])
+            sys.exit(0)
+
+        manifest = OptimizedManifest()
+        errors = optimize_images(snapshot, manifest, args.jobs, args.recompress_all, args.dry_run)
+        if not args.dry_run:
+            manifest.save()
+        sys.exit(1 if errors else 0)
+    except Exception as e:
+        print(f"❌ Unexpected error in image optimization: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Query the measurement catalog.
+Loads the catalog index written by measurements.py and answers range and top-k
+queries with binary search over its sorted per-band row orders.
+
+Example: antennas with SWR < 1.5 at 868 MHz sorted by declared gain:
+    python .github/scripts/query.py --band "868 MHz" --where "swr<1.5" --sort gain --desc
+"""
+
+import argparse
+import json
+import math
+import re
+import sys
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Import configuration and utilities
+try:
+    from config import ANTENNAS_DIR, CATALOG_INDEX_DIR
+    from messages import ERROR_TEMPLATES, SUCCESS_TEMPLATES, PROGRESS_TEMPLATES
+    from measurements import (
+        INDEX_MANIFEST_FILE, REFERENCE_IMPEDANCE, SORTED_FIELDS, SortedRows, extract_catalog, index_is_current,
+        load_catalog_index, load_sorted_rows, parse_frequency_band, write_catalog_index
+    )
+    from catalog import CatalogSnapshot
+except ImportError as e:
+    print(f"❌ Error: Could not import required modules: {e}")
+    sys.exit(1)
+
+# Numeric fields that can be filtered and sorted on
+QUERY_FIELDS = SORTED_FIELDS
+
+CONDITION_PATTERN = re.compile(r'^\s*([a-z_]+)\s*(<=|>=|<|>|=)\s*([-+]?\d+(?:\.\d+)?)\s*$')
+
+class Condition(NamedTuple):
+    """Range condition on a field, bounds are inclusive unless marked otherwise."""
+    field: str
+    low: float
+    high: float
+    include_low: bool = True
+    include_high: bool = True
+
+def parse_condition(text: str) -> Condition:
+    """
+    Parse a condition like 'swr<1.5', 'gain>=3' or 'z_error<5'.
+
+    Raises:
+        ValueError: If the condition can't be parsed
+    """
+    match = CONDITION_PATTERN.match(text)
+    if not match or match.group(1) not in QUERY_FIELDS:
+        raise ValueError(ERROR_TEMPLATES['invalid_query'].format(condition=text, fields=', '.join(QUERY_FIELDS)))
+
+    field, operator, value = match.group(1), match.group(2), float(match.group(3))
+    if operator == '=':
+        return Condition(field, value, value)
+    if operator in ('<', '<='):
+        return Condition(field, -math.inf, value, include_high=operator == '<=')
+    return Condition(field, value, math.inf, include_low=operator == '>=')
+
+def normalize_band(band: str) -> str:
+    """Normalize user input like '868mhz' to the band format of the index ('868 MHz')."""
+    parsed = parse_frequency_band(band)
+    return parsed[0] if parsed else band.strip()
+
+class CatalogQuery:
+    """
+    Sorted indexes over the columns of a catalog index.
+
+    An index of a (band, field) pair holds row numbers sorted by value together
+    with the sorted values for bisecting; band None indexes all rows. Row orders
+    come from the catalog index (see measurements.load_sorted_rows()), orders
+    that weren't given are sorted on first use. Indexes are reused by later queries.
+    """
+
+    def __init__(self, columns: Dict[str, list], sorted_rows: Optional[SortedRows] = None):
+        self.columns = columns
+        self.rows = len(self.columns['antenna'])
+        self._sorted_rows = sorted_rows or {}
+
+        self._band_rows: Dict[Optional[str], List[int]] = {None: list(range(self.rows))}
+        for row, band in enumerate(self.columns['band']):
+            self._band_rows.setdefault(band, []).append(row)
+        self._indexes: Dict[Tuple[Optional[str], str], Tuple[List[float], List[int]]] = {}
+
+    @property
+    def bands(self) -> List[str]:
+        return sorted(band for band in self._band_rows if band is not None)
+
+    def index(self, band: Optional[str], field: str) -> Tuple[List[float], List[int]]:
+        """Return (sorted values, rows) of a band and field, rows with missing values are left out."""
+        key = (band, field)
+        if key not in self._indexes:
+            values = self.columns[field]
+            rows = self._sorted_rows.get(key)
+            if rows is None:
+                rows = sorted(
+                    (row for row in self._band_rows.get(band, []) if not math.isnan(values[row])),
+                    key=values.__getitem__
+                )
+            self._indexes[key] = ([values[row] for row in rows], rows)
+        return self._indexes[key]
+
+    def range(self, band: Optional[str], condition: Condition) -> List[int]:
+        """Return rows of a band matching a range condition, ordered by the field value."""
+        values, rows = self.index(band, condition.field)
+        start = (bisect_left if condition.include_low else bisect_right)(values, condition.low)
+        stop = (bisect_right if condition.include_high else bisect_left)(values, condition.high)
+        return rows[start:stop]
+
+    def top(self, band: Optional[str], field: str, limit: int, descending: bool = False) -> List[int]:
+        """Return `limit` rows of a band with the lowest (or highest) values of a field."""
+        _, rows = self.index(band, field)
+        return rows[::-1][:limit] if descending else rows[:limit]
+
+    def query(self, band: Optional[str] = None, conditions: Optional[List[Condition]] = None,
+              sort: Optional[str] = None, descending: bool = False, limit: Optional[int] = None) -> List[int]:
+        """
+        Return rows matching all conditions.
+
+        Each condition is answered by a binary search and the results are intersected starting
+        from the smallest one, so the work depends on the number of matches rather than the
+        catalog size. Without conditions, a sorted query is a top-k lookup.
+        """
+        conditions = conditions or []
+        sort = sort or (conditions[0].field if conditions else None)
+
+        if not conditions:
+            if sort is None:
+                rows = self._band_rows.get(band, [])
+                return rows[:limit] if limit is not None else list(rows)
+            return self.top(band, sort, self.rows if limit is None else limit, descending)
+
+        matches = {condition: self.range(band, condition) for condition in conditions}
+        smallest = sorted(matches.values(), key=len)
+        selected = set(smallest[0])
+        for other in smallest[1:]:
+            selected.intersection_update(other)
+
+        # A range result is already ordered by its field, otherwise only the matches are sorted
+        ordered_by_sort = next((rows for condition, rows in matches.items() if condition.field == sort), None)
+        if ordered_by_sort is not None:
+            ordered = [row for row in ordered_by_sort if row in selected]
+            if descending:
+                ordered.reverse()
+        else:
+            values = self.columns[sort]
+            # Rows without a value of the sort field go last
+            ordered = sorted((row for row in selected if not math.isnan(values[row])),
+                             key=values.__getitem__, reverse=descending)
+            ordered.extend(sorted(row for row in selected if math.isnan(values[row])))
+        return ordered[:limit] if limit is not None else ordered
+
+    def record(self, row: int) -> dict:
+        """Return a row as a dict, missing values are None."""
+        result = {}
+        for name, values in self.columns.items():
+            value = values[row]
+            result[name] = None if isinstance(value, float) and math.isnan(value) else value
+        return result
+
+def ensure_index(index_dir: Path, rebuild: bool = False) -> Path:
+    """
+    Build the catalog index if it doesn't exist yet, is out of date or if requested.
+
+    The index is out of date when antenna README.md files were edited, added or
+    removed since it was built (see measurements.index_is_current()).
+    """
+    manifest_path = Path(index_dir) / INDEX_MANIFEST_FILE
+    if not rebuild:
+        if index_is_current(index_dir):
+            return manifest_path
+        if manifest_path.exists():
+            print(PROGRESS_TEMPLATES['catalog_index_stale'], file=sys.stderr)
+    print(PROGRESS_TEMPLATES['extracting_measurements'], file=sys.stderr)
+    records, sources = extract_catalog(CatalogSnapshot(ANTENNAS_DIR))
+    write_catalog_index(records, sources, index_dir)
+    return manifest_path
+
+def format_value(value: Optional[float]) -> str:
+    return '-' if value is None else f"{value:g}"
+
+def format_impedance(resistance: Optional[float], reactance: Optional[float]) -> str:
+    if resistance is None and reactance is None:
+        return '-'
+    text = format_value(resistance)
+    if reactance is not None:
+        text += f"{reactance:+g}j"
+    return f"{text} Ω"
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Query antenna measurements.",
+        epilog=f"Fields: {', '.join(QUERY_FIELDS)} (z_error is |Z - {REFERENCE_IMPEDANCE:g} Ω|)"
+    )
+    parser.add_argument('--band', help="frequency band, e.g. '868 MHz' (default: all bands)")
+    parser.add_argument(
+        '--where', action='append', default=[], metavar='CONDITION',
+        help="condition like 'swr<1.5' or 'z_error<=5', may be repeated"
+    )
+    parser.add_argument('--sort', choices=QUERY_FIELDS, help="field to sort by (default: first condition field)")
+    parser.add_argument('--desc', action='store_true', help="sort in descending order")
+    parser.add_argument('--limit', type=int, metavar='N', help="return at most N results")
+    parser.add_argument('--json', action='store_true', help="print results as JSON lines")
+    parser.add_argument(
+        '--index', type=Path, default=CATALOG_INDEX_DIR, metavar='DIR',
+        help=f"catalog index directory (default: {CATALOG_INDEX_DIR})"
+    )
+    parser.add_argument('--rebuild', action='store_true', help="rebuild the catalog index before querying")
+    args = parser.parse_args()
+
+    try:
+        conditions = [parse_condition(text) for text in args.where]
+    except ValueError as e:
+        parser.error(str(e))
+
+    try:
+        ensure_index(args.index, args.rebuild)
+        catalog = CatalogQuery(load_catalog_index(args.index), load_sorted_rows(args.index))
+        band = normalize_band(args.band) if args.band else None
+
+        rows = catalog.query(band, conditions, args.sort, args.desc, args.limit)
+        for row in rows:
+            record = catalog.record(row)
+            if args.json:
+                print(json.dumps(record, ensure_ascii=False))
+            else:
+                label = f" ({record['label']})" if record['label'] else ''
+                print(
+                    f"{record['antenna']}{label} @ {record['band']}: SWR {format_value(record['swr'])}, "
+                    f"Z {format_impedance(record['resistance'], record['reactance'])}, "
+                    f"gain {format_value(record['gain'])} dBi"
+                )
+
+        if not args.json:
+            print(SUCCESS_TEMPLATES['query_results'].format(count=len(rows)))
+        sys.exit(0)
+    except (OSError, ValueError) as e:
+        print(ERROR_TEMPLATES['catalog_index_error'].format(path=args.index, error=e))
+        sys.exit(1)
+    except Exception as e:
+        print(f"❌ Unexpected error in catalog query: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Registry of validation stages.
+Every validator declares the catalog inputs it reads and its cost class; validator
+modules are imported only when their stage is selected. The scheduler runs cheap
+stages first and independent stages concurrently.
+"""
+
+import importlib
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# Import configuration
+try:
+    from catalog import CatalogSnapshot, thread_local_stdout
+except ImportError:
+    print("❌ Error: Could not import configuration file")
+    sys.exit(1)
+
+# Cost classes from cheapest to most expensive
+COST_CLASSES = ('cheap', 'moderate', 'expensive')
+
+# Inputs a validator can read from the catalog snapshot:
+#   listing        directory entries collected by the scan (always available)
+#   stats          file sizes (one stat() per file)
+#   root_readme    text of the root README.md
+#   readme         text of antenna README.md files
+#   image_headers  first bytes of every image
+#   image_data     complete contents of every image (decoded pixels)
+#   sweep_data     text of Touchstone files in data/
+#   network        responses of external web sites
+INPUTS = ('listing', 'stats', 'root_readme', 'readme', 'image_headers', 'image_data', 'sweep_data', 'network')
+
+# Scopes: 'antenna' stages validate every antenna directory on its own and are split
+# between shards, 'catalog' stages compare across the whole catalog (root README.md,
+# duplicates between antennas) and run on the first shard only
+SCOPES = ('antenna', 'catalog')
+
+# Inputs that are read from file contents. Stages sharing one of them run one after
+# another, so the later stage finds the contents in the snapshot cache instead of
+# reading the same files concurrently.
+CONTENT_INPUTS = {'root_readme', 'readme', 'image_headers', 'image_data', 'sweep_data'}
+
+class Validator(NamedTuple):
+    """A validation stage and where its function lives."""
+    stage: str
+    label: str
+    module: str
+    function: str
+    inputs: Tuple[str, ...]
+    cost: str
+    aliases: Tuple[str, ...] = ()
+    # Optional stages only run when selected explicitly
+    optional: bool = False
+    scope: str = 'antenna'
+
+# Validation stages in their declared order (used to break ties between equal costs)
+VALIDATORS = [
+    Validator('directory_naming', "directory naming", 'check_directory_naming', 'check_directory_naming',
+              ('listing',), 'cheap', ('naming',)),
+    Validator('file_sizes', "file size", 'check_file_sizes', 'check_file_sizes',
+              ('listing', 'stats'), 'cheap', ('sizes',)),
+    Validator('images', "image", 'validate_images', 'validate_images',
+              ('listing', 'image_headers'), 'expensive'),
+    Validator('required_files', "required files", 'validate_required_files', 'validate_required_files',
+              ('listing',), 'cheap', ('structure',)),
+    Validator('readme_links', "README", 'validate_readme', 'validate_readme_links',
+              ('listing', 'root_readme'), 'moderate', ('links',), scope='catalog'),
+    Validator('readme_sections', "README.md summary", 'validate_readme', 'validate_readme_sections',
+              ('listing', 'root_readme', 'readme'), 'moderate', ('summary',), scope='catalog'),
+    Validator('details', "README.md", 'validate_details', 'validate_antenna_readme_files',
+              ('listing', 'readme'), 'moderate'),
+    Validator('image_orphans', "orphan image", 'check_orphan_images', 'check_orphan_images',
+              ('listing', 'root_readme', 'readme'), 'moderate', ('orphans',), scope='catalog'),
+    Validator('sweeps', "sweep", 'validate_sweeps', 'validate_sweeps',
+              ('listing', 'readme', 'sweep_data'), 'expensive'),
+    Validator('image_integrity', "image integrity", 'check_image_integrity', 'check_image_integrity',
+              ('listing', 'image_data'), 'expensive', ('integrity',)),
+    Validator('image_metadata', "image metadata", 'check_image_metadata', 'check_image_metadata',
+              ('listing', 'image_data'), 'expensive', ('metadata',)),
+    Validator('image_duplicates', "duplicate image", 'check_duplicate_images', 'check_duplicate_images',
+              ('listing', 'image_data'), 'expensive', ('duplicates',), scope='catalog'),
+    Validator('external_links', "external link", 'check_external_links', 'check_external_links',
+              ('listing', 'root_readme', 'readme', 'network'), 'expensive', ('http',), optional=True,
+              scope='catalog'),
+]
+
+# Function taking the catalog snapshot and returning error messages
+ValidatorFunction = Callable[[CatalogSnapshot], List[str]]
+
+def stage_names() -> List[str]:
+    """Return stage names and aliases accepted by select_validators()."""
+    return [name for validator in VALIDATORS for name in (validator.stage, *validator.aliases)]
+
+def select_validators(names: Optional[Iterable[str]] = None) -> List[Validator]:
+    """
+    Return validators by stage name or alias in declared order.
+
+    Without names all stages except optional ones are returned.
+
+    Raises:
+        ValueError: If a name doesn't match any stage
+    """
+    if names is None:
+        return [validator for validator in VALIDATORS if not validator.optional]
+
+    wanted = set()
+    for name in names:
+        matches = [validator.stage for validator in VALIDATORS if name in (validator.stage, *validator.aliases)]
+        if not matches:
+            raise ValueError(f"unknown stage '{name}', expected one of: {', '.join(stage_names())}")
+        wanted.update(matches)
+    return [validator for validator in VALIDATORS if validator.stage in wanted]
+
+def affected_validators(validators: List[Validator], inputs: Iterable[str]) -> List[Validator]:
+    """Return validators reading any of the given inputs."""
+    inputs = set(inputs)
+    return [validator for validator in validators if inputs.intersection(validator.inputs)]
+
+def load(validator: Validator) -> ValidatorFunction:
+    """Import the module of a validator and return its function."""
+    return getattr(importlib.import_module(validator.module), validator.function)
+
+def schedule(validators: List[Validator]) -> List[Tuple[Validator, List[Validator]]]:
+    """
+    Order validators cheap first and find what each one has to wait for.
+
+    A validator depends on the closest earlier validator reading each of its content
+    inputs, which chains stages sharing inputs and leaves the others independent.
+
+    Returns:
+        (validator, dependencies) pairs in run order
+    """
+    ordered = sorted(validators, key=lambda validator: (COST_CLASSES.index(validator.cost),
+                                                        VALIDATORS.index(validator)))
+    last_reader: Dict[str, Validator] = {}
+    scheduled = []
+    for validator in ordered:
+        dependencies = []
+        for name in validator.inputs:
+            if name in CONTENT_INPUTS:
+                if name in last_reader and last_reader[name] not in dependencies:
+                    dependencies.append(last_reader[name])
+                last_reader[name] = validator
+        scheduled.append((validator, dependencies))
+    return scheduled
+
+class StageResult(NamedTuple):
+    """Outcome of a validation stage; errors is None if the stage was skipped."""
+    validator: Validator
+    errors: Optional[List[str]]
+    output: str
+
+# Runs a stage, may wrap it with measurements; returns the stage errors
+StageRunner = Callable[[Validator, ValidatorFunction], List[str]]
+
+def run_scheduled(validators: List[Validator], functions: Dict[str, ValidatorFunction], run_stage: StageRunner,
+                  concurrency: int = 1, max_errors: Optional[int] = None) -> Iterable[StageResult]:
+    """
+    Run validators in schedule order and yield their results in that order.
+
+    With `concurrency` > 1 independent stages run in a thread pool and their output is
+    buffered and returned with the result, so it isn't interleaved. With a single
+    worker stages run on the calling thread and print directly. Once `max_errors`
+    errors have been yielded, stages that haven't started yet are skipped.
+    """
+    scheduled = schedule(validators)
+    total_errors = 0
+    stop = threading.Event()
+
+    def limit_reached(errors: List[str]) -> bool:
+        nonlocal total_errors
+        total_errors += len(errors)
+        return max_errors is not None and total_errors >= max_errors
+
+    if concurrency <= 1 or len(scheduled) <= 1:
+        for validator, _ in scheduled:
+            if stop.is_set():
+                yield StageResult(validator, None, '')
+                continue
+            errors = run_stage(validator, functions[validator.stage])
+            if limit_reached(errors):
+                stop.set()
+            yield StageResult(validator, errors, '')
+        return
+
+    with thread_local_stdout() as stdout:
+        futures: Dict[str, Future] = {}
+
+        def run(validator: Validator, dependencies: List[Validator]) -> StageResult:
+            # Dependencies were submitted earlier, so they are running or done
+            for dependency in dependencies:
+                futures[dependency.stage].result()
+            if stop.is_set():
+                return StageResult(validator, None, '')
+            buffer = stdout.capture()
+            try:
+                errors = run_stage(validator, functions[validator.stage])
+            finally:
+                stdout.release()
+            return StageResult(validator, errors, buffer.getvalue())
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(scheduled))) as executor:
+            for validator, dependencies in scheduled:
+                futures[validator.stage] = executor.submit(run, validator, dependencies)
+
+            for validator, _ in scheduled:
+                result = futures[validator.stage].result()
+                if result.errors is not None and limit_reached(result.errors):
+                    stop.set()
+                yield result
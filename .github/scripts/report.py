@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Structured reporting of validation findings.
+Turns error messages into typed findings (template key, severity, path) and writes
+them as JSON Lines, JUnit XML or SARIF. Also provides the quiet output filter that
+hides per-file progress lines of validators.
+"""
+
+import io
+import json
+import re
+import string
+import sys
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, TextIO
+from xml.etree import ElementTree
+
+# Import configuration
+try:
+    from config import ANTENNAS_DIR, DETAILS_FILE_NAME, IMAGES_DIR_NAME, DATA_DIR_NAME
+    from messages import ERROR_TEMPLATES
+except ImportError:
+    print("❌ Error: Could not import configuration file")
+    sys.exit(1)
+
+TOOL_NAME = "antenna-validation"
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+# Code of errors that don't come from a message template (e.g. unexpected exceptions)
+GENERIC_CODE = 'validation_error'
+
+SEVERITY_MARKERS = [('❌', 'error'), ('⚠️', 'warning'), ('ℹ️', 'note')]
+SARIF_LEVELS = {'error': 'error', 'warning': 'warning', 'note': 'note'}
+
+# Lines kept on the console in quiet mode: warnings and notes (errors are listed in the summary)
+QUIET_MARKERS = ('⚠️', 'ℹ️')
+
+ROOT_README = DETAILS_FILE_NAME
+ANTENNA_DIR = f"{ANTENNAS_DIR.as_posix()}/{{name}}"
+
+# Location of findings whose template has no '{path}' field
+PATH_TEMPLATES = {
+    'directory_naming': ANTENNA_DIR,
+    'missing_details': ANTENNA_DIR,
+    'unauthorized_file': ANTENNA_DIR + "/{file}",
+    'unauthorized_subdir': ANTENNA_DIR + "/{subdir}",
+    'images_not_directory': ANTENNA_DIR + f"/{IMAGES_DIR_NAME}",
+    'data_not_directory': ANTENNA_DIR + f"/{DATA_DIR_NAME}",
+    'non_existing_image': ANTENNA_DIR + f"/{DETAILS_FILE_NAME}",
+    'non_image_file': ANTENNA_DIR + f"/{DETAILS_FILE_NAME}",
+    'absolute_image_reference': ANTENNA_DIR + f"/{DETAILS_FILE_NAME}",
+}
+# Findings about the root README.md
+ROOT_README_CODES = {
+    'readme_missing', 'antenna_not_linked', 'broken_internal_link', 'invalid_external_link',
+    'malformed_external_link', 'readme_error', 'missing_antennas_section', 'antenna_not_link',
+    'antenna_not_details_link', 'antenna_file_not_exists', 'antenna_dir_invalid',
+    'missing_frequency_subsection', 'no_frequency_subsection', 'frequency_missing_swr', 'readme_outdated',
+    'summary_gain_mismatch', 'summary_band_missing', 'summary_band_extra', 'summary_unit_missing',
+    'summary_unit_extra', 'summary_value_mismatch', 'non_existing_root_image',
+}
+
+class Finding(NamedTuple):
+    """A single validation finding."""
+    stage: str
+    code: str
+    severity: str
+    path: Optional[str]
+    message: str
+
+def _template_pattern(template: str) -> re.Pattern:
+    """Compile a message template into a regex with a named group per field."""
+    parts = []
+    seen = set()
+    for literal, field, _, _ in string.Formatter().parse(template):
+        parts.append(re.escape(literal))
+        if field is None:
+            continue
+        parts.append(f"(?P={field})" if field in seen else f"(?P<{field}>.*?)")
+        seen.add(field)
+    return re.compile(''.join(parts) + '$', re.DOTALL)
+
+# Longer literal text first, so specific templates win over generic ones
+_TEMPLATE_PATTERNS = sorted(
+    ((code, _template_pattern(template)) for code, template in ERROR_TEMPLATES.items()),
+    key=lambda item: len(item[1].pattern), reverse=True
+)
+
+def severity_of(message: str) -> str:
+    stripped = message.lstrip()
+    for marker, severity in SEVERITY_MARKERS:
+        if stripped.startswith(marker):
+            return severity
+    return 'error'
+
+def classify(message: str, stage: str = '') -> Finding:
+    """
+    Turn an error message into a finding by matching it against message templates.
+
+    Messages that don't match any template get the generic code and no path.
+    """
+    for code, pattern in _TEMPLATE_PATTERNS:
+        match = pattern.match(message)
+        if match:
+            fields = match.groupdict()
+            if 'path' in fields:
+                path = fields['path']
+            elif code in PATH_TEMPLATES:
+                path = PATH_TEMPLATES[code].format(**fields)
+            elif code in ROOT_README_CODES:
+                path = ROOT_README
+            elif 'name' in fields:
+                path = f"{ANTENNA_DIR.format(name=fields['name'])}/{DETAILS_FILE_NAME}"
+            else:
+                path = None
+            return Finding(stage, code, severity_of(message), path, message)
+    return Finding(stage, GENERIC_CODE, severity_of(message), None, message)
+
+def plain_message(message: str) -> str:
+    """Strip the leading status marker of a message for reports that have their own severity."""
+    stripped = message.lstrip()
+    for marker, _ in SEVERITY_MARKERS:
+        if stripped.startswith(marker):
+            return stripped[len(marker):].strip()
+    return stripped
+
+class Reporter:
+    """
+    Collects findings per stage and writes them to report files.
+
+    JSON Lines are streamed as every stage finishes; JUnit XML and SARIF are written
+    on close(), since both formats need the complete run.
+    """
+
+    def __init__(self, jsonl: Optional[Path] = None, junit: Optional[Path] = None, sarif: Optional[Path] = None):
+        self.junit = junit
+        self.sarif = sarif
+        self.findings: List[Finding] = []
+        # stage -> (seconds, number of findings)
+        self.stages: Dict[str, tuple] = {}
+        self._jsonl: Optional[TextIO] = open(jsonl, 'w', encoding='utf-8') if jsonl else None
+
+    def add_stage(self, stage: str, errors: List[str], seconds: float = 0.0):
+        """Record errors of a finished stage."""
+        findings = [classify(message, stage) for message in errors]
+        self.findings.extend(findings)
+        self.stages[stage] = (seconds, len(findings))
+        if self._jsonl:
+            for finding in findings:
+                self._jsonl.write(json.dumps(finding._asdict(), ensure_ascii=False) + '\n')
+            self._jsonl.flush()
+
+    def close(self):
+        """Finish streamed reports and write JUnit XML and SARIF reports."""
+        if self._jsonl:
+            self._jsonl.close()
+            self._jsonl = None
+        if self.junit:
+            write_junit(self.findings, self.stages, self.junit)
+        if self.sarif:
+            write_sarif(self.findings, self.sarif)
+
+def write_junit(findings: List[Finding], stages: Dict[str, tuple], path: Path):
+    """Write a JUnit XML report with a test case per stage."""
+    failures = sum(1 for stage, (_, count) in stages.items() if count)
+    total_time = sum(seconds for seconds, _ in stages.values())
+    suites = ElementTree.Element('testsuites')
+    suite = ElementTree.SubElement(suites, 'testsuite', {
+        'name': TOOL_NAME, 'tests': str(len(stages)), 'failures': str(failures),
+        'errors': '0', 'time': f"{total_time:.3f}"
+    })
+    for stage, (seconds, count) in stages.items():
+        case = ElementTree.SubElement(suite, 'testcase', {
+            'classname': TOOL_NAME, 'name': stage, 'time': f"{seconds:.3f}"
+        })
+        if count:
+            stage_findings = [finding for finding in findings if finding.stage == stage]
+            failure = ElementTree.SubElement(case, 'failure', {
+                'message': f"{count} issue(s)", 'type': stage_findings[0].code
+            })
+            failure.text = '\n'.join(
+                f"[{finding.code}] {finding.path or '-'}: {plain_message(finding.message)}"
+                for finding in stage_findings
+            )
+    ElementTree.ElementTree(suites).write(path, encoding='utf-8', xml_declaration=True)
+
+def write_sarif(findings: List[Finding], path: Path):
+    """Write a SARIF 2.1.0 report (used for pull request annotations)."""
+    codes = sorted({finding.code for finding in findings})
+    rules = [
+        {
+            'id': code,
+            'shortDescription': {'text': plain_message(ERROR_TEMPLATES.get(code, "Validation error"))}
+        }
+        for code in codes
+    ]
+    results = []
+    for finding in findings:
+        result = {
+            'ruleId': finding.code,
+            'level': SARIF_LEVELS[finding.severity],
+            'message': {'text': plain_message(finding.message)},
+        }
+        if finding.path:
+            result['locations'] = [{'physicalLocation': {'artifactLocation': {'uri': finding.path}}}]
+        results.append(result)
+
+    sarif = {
+        '$schema': SARIF_SCHEMA,
+        'version': '2.1.0',
+        'runs': [{
+            'tool': {'driver': {'name': TOOL_NAME, 'rules': rules}},
+            'results': results
+        }]
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(sarif, f, ensure_ascii=False, indent=2)
+
+class QuietOutput(io.TextIOBase):
+    """
+    Stdout filter for quiet mode.
+
+    Passes through only lines with warning or note markers and drops progress and
+    per-file lines; errors are reported in the final summary instead.
+    """
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self._pending = ''
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        # Fast path: nothing to keep in this chunk and no partial line waiting
+        if not self._pending and not any(marker[0] in text for marker in QUIET_MARKERS):
+            if text.endswith('\n') or not text:
+                return len(text)
+
+        lines = (self._pending + text).split('\n')
+        self._pending = lines.pop()
+        for line in lines:
+            if any(marker in line for marker in QUIET_MARKERS):
+                self.stream.write(line + '\n')
+        return len(text)
+
+    def flush(self):
+        self.stream.flush()
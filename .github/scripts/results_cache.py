@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Persistent cache of per-antenna validation results.
+Antenna directories are fingerprinted by their contents, so unchanged antennas
+reuse the errors produced by a previous run instead of being validated again.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+# Import configuration
+try:
+    from config import (
+        VALIDATION_CACHE_FILE, VALIDATION_CACHE_MAX_ENTRIES, VALIDATION_CACHE_MAX_FILE_HASHES
+    )
+    from catalog import CatalogEntry, CatalogSnapshot
+except ImportError:
+    print("❌ Error: Could not import configuration file")
+    sys.exit(1)
+
+# Bump when the layout of the cache file changes
+CACHE_FORMAT_VERSION = 1
+
+def compute_rules_version() -> str:
+    """
+    Hash configuration, message templates and validator sources.
+
+    Any change to the validation rules produces a new version and invalidates all cached results.
+    """
+    digest = hashlib.sha256(str(CACHE_FORMAT_VERSION).encode())
+    for source in sorted(Path(__file__).resolve().parent.glob('*.py')):
+        digest.update(source.name.encode())
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+class ValidationCache:
+    """
+    Per-antenna validation results keyed by antenna content fingerprints.
+
+    A fingerprint covers every path in the antenna directory together with file sizes
+    and SHA-256 hashes of file contents (or is derived from the git tree id when the
+    snapshot reads a git revision). File hashes are memoized by path, size and
+    mtime, so files that weren't touched since the previous run aren't read again.
+    Both tables are bounded and evicted in least-recently-used order on save.
+    """
+
+    def __init__(self, path: Path = VALIDATION_CACHE_FILE,
+                 max_entries: int = VALIDATION_CACHE_MAX_ENTRIES,
+                 max_file_hashes: int = VALIDATION_CACHE_MAX_FILE_HASHES, load: bool = True):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_file_hashes = max_file_hashes
+        self.rules_version = compute_rules_version()
+        self.hits = 0
+        self.misses = 0
+        self._now = time.time()
+        # fingerprint -> {'used': timestamp, 'stages': {stage: [errors]}}
+        self._results: Dict[str, dict] = {}
+        # file path -> {'size': ..., 'mtime_ns': ..., 'sha256': ..., 'used': timestamp}
+        self._file_hashes: Dict[str, dict] = {}
+        self._fingerprints: Dict[Path, Optional[str]] = {}
+        if load:
+            self._load()
+
+    def _load(self):
+        """Load the cache file, discarding it if it was written for other validation rules."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(data, dict) or data.get('rules_version') != self.rules_version:
+            return
+
+        self._results = data.get('results', {})
+        self._file_hashes = data.get('file_hashes', {})
+
+    def _file_hash(self, snapshot: CatalogSnapshot, entry: CatalogEntry) -> str:
+        """Return SHA-256 of a file, re-reading it only if its size or mtime changed."""
+        stat = entry.stat()
+        key = entry.path.as_posix()
+
+        known = self._file_hashes.get(key)
+        if known and known['size'] == stat.st_size and known['mtime_ns'] == stat.st_mtime_ns:
+            known['used'] = self._now
+            return known['sha256']
+
+        with snapshot.open_binary(entry.path) as f:
+            sha256 = hashlib.file_digest(f, 'sha256').hexdigest()
+
+        self._file_hashes[key] = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': sha256,
+            'used': self._now
+        }
+        return sha256
+
+    def fingerprint(self, snapshot: CatalogSnapshot, antenna: CatalogEntry) -> Optional[str]:
+        """
+        Compute the content fingerprint of an antenna directory.
+
+        Returns:
+            Hex digest, or None if some file couldn't be read (such antennas are never cached)
+        """
+        if antenna.path in self._fingerprints:
+            return self._fingerprints[antenna.path]
+
+        # A git tree id already identifies everything below the directory
+        if antenna.object_id is not None:
+            fingerprint = hashlib.sha256(f"{antenna.path.as_posix()}\0git tree {antenna.object_id}".encode()).hexdigest()
+            self._fingerprints[antenna.path] = fingerprint
+            return fingerprint
+
+        digest = hashlib.sha256(antenna.path.as_posix().encode())
+        try:
+            for entry in snapshot.walk(antenna.path):
+                relative_path = entry.path.relative_to(antenna.path).as_posix()
+                if entry.is_dir:
+                    digest.update(f"\0d {relative_path}".encode())
+                elif entry.is_file:
+                    digest.update(f"\0f {relative_path} {entry.size} {self._file_hash(snapshot, entry)}".encode())
+                else:
+                    digest.update(f"\0o {relative_path}".encode())
+            fingerprint = digest.hexdigest()
+        except OSError:
+            fingerprint = None
+
+        self._fingerprints[antenna.path] = fingerprint
+        return fingerprint
+
+    def forget_fingerprints(self, antenna_paths: Optional[Iterable[Path]] = None):
+        """
+        Drop memoized fingerprints of antennas (all if None) so they are computed again.
+
+        Needed when one cache outlives a snapshot, e.g. in watch mode after files changed.
+        """
+        if antenna_paths is None:
+            self._fingerprints.clear()
+            return
+        for path in antenna_paths:
+            self._fingerprints.pop(Path(path), None)
+
+    def get(self, snapshot: CatalogSnapshot, antenna: CatalogEntry, stage: str) -> Optional[List[str]]:
+        """Return cached errors of a stage for an antenna, or None on cache miss."""
+        fingerprint = self.fingerprint(snapshot, antenna)
+        entry = self._results.get(fingerprint) if fingerprint else None
+
+        if entry is None or stage not in entry['stages']:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        entry['used'] = self._now
+        return list(entry['stages'][stage])
+
+    def put(self, snapshot: CatalogSnapshot, antenna: CatalogEntry, stage: str, errors: List[str]):
+        """Store errors of a stage for an antenna."""
+        fingerprint = self.fingerprint(snapshot, antenna)
+        if not fingerprint:
+            return
+
+        entry = self._results.setdefault(fingerprint, {'used': self._now, 'stages': {}})
+        entry['used'] = self._now
+        entry['stages'][stage] = list(errors)
+
+    @staticmethod
+    def _evict(table: Dict[str, dict], max_size: int) -> Dict[str, dict]:
+        """Keep only the `max_size` most recently used entries of a table."""
+        if len(table) <= max_size:
+            return table
+        recent = sorted(table.items(), key=lambda item: item[1]['used'], reverse=True)[:max_size]
+        return dict(recent)
+
+    def save(self):
+        """Evict old entries and atomically write the cache file."""
+        self._results = self._evict(self._results, self.max_entries)
+        self._file_hashes = self._evict(self._file_hashes, self.max_file_hashes)
+
+        data = {
+            'rules_version': self.rules_version,
+            'results': self._results,
+            'file_hashes': self._file_hashes
+        }
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_path, self.path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
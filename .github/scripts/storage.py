@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Storage backends of the catalog snapshot.
+The working tree backend reads files relative to the current directory; the git
+tree backend reads a revision straight from the object store through a single
+long-lived `git cat-file` process, so any commit can be validated without a checkout.
+"""
+
+import contextlib
+import io
+import mmap
+import os
+import posixpath
+import stat
+import subprocess
+import threading
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+# Read-only file contents: a memory map of a working tree file or the bytes of a git blob
+Buffer = Union[mmap.mmap, bytes]
+
+class StorageError(Exception):
+    """Raised when a storage backend can't be opened (e.g. unknown git revision)."""
+
+class CatalogEntry:
+    """A single file or directory captured by the snapshot."""
+
+    __slots__ = ('path', 'name', 'is_dir', 'is_file', 'is_symlink', 'object_id', '_stat', '_stat_function')
+
+    def __init__(self, path: Path, is_dir: bool, is_file: bool, stat_function: Callable[[], os.stat_result],
+                 is_symlink: bool = False, object_id: Optional[str] = None):
+        self.path = path
+        self.name = path.name
+        self.is_dir = is_dir
+        self.is_file = is_file
+        self.is_symlink = is_symlink
+        # Git object id of the entry contents (tree id for directories), None in the working tree
+        self.object_id = object_id
+        self._stat = None
+        self._stat_function = stat_function
+
+    @classmethod
+    def from_dir_entry(cls, dir_entry: os.DirEntry) -> 'CatalogEntry':
+        is_dir = dir_entry.is_dir()
+        return cls(Path(dir_entry.path), is_dir, not is_dir and dir_entry.is_file(), dir_entry.stat,
+                   dir_entry.is_symlink())
+
+    def stat(self) -> os.stat_result:
+        """Return the stat result of the entry, calling stat() at most once."""
+        if self._stat is None:
+            self._stat = self._stat_function()
+        return self._stat
+
+    @property
+    def size(self) -> int:
+        return self.stat().st_size
+
+class WorkingTree:
+    """Files below the current directory."""
+
+    name = 'working tree'
+
+    def list_directory(self, directory: Path) -> List[CatalogEntry]:
+        with os.scandir(directory) as iterator:
+            return [CatalogEntry.from_dir_entry(item) for item in iterator]
+
+    def exists(self, path: Path) -> bool:
+        return Path(path).exists()
+
+    def is_dir(self, path: Path) -> bool:
+        return Path(path).is_dir()
+
+    def read_text(self, path: Path) -> str:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def open_binary(self, path: Path) -> BinaryIO:
+        return open(path, 'rb')
+
+    @contextlib.contextmanager
+    def map_file(self, path: Path) -> Iterator[Buffer]:
+        """Memory-map a file for reading; pages are loaded on access and dropped on exit."""
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # Empty files can't be mapped
+                yield b''
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                yield mapped
+
+class ObjectInfo(NamedTuple):
+    """Header of a git object."""
+    object_id: str
+    type: str
+    size: int
+
+class GitObjectReader:
+    """
+    Reads git objects through one long-lived `git cat-file --batch-command` process.
+
+    Object headers ('info') and contents ('contents') are requested over the same pipe,
+    so sizes of large blobs are known without transferring them. Requests are
+    serialized with a lock, so the reader can be shared by worker threads.
+    """
+
+    def __init__(self, repository: Path = Path('.')):
+        try:
+            self._process = subprocess.Popen(
+                ['git', 'cat-file', '--batch-command'], cwd=repository,
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+        except FileNotFoundError as e:
+            raise StorageError(f"git executable not found: {e}")
+        self._lock = threading.Lock()
+
+    def _request(self, command: str, name: str) -> Tuple[Optional[ObjectInfo], Optional[bytes]]:
+        if '\n' in name:
+            return None, None
+        with self._lock:
+            self._process.stdin.write(f"{command} {name}\n".encode('utf-8', errors='surrogateescape'))
+            self._process.stdin.flush()
+            header = self._process.stdout.readline()
+            if not header:
+                raise StorageError("git cat-file exited unexpectedly")
+
+            # "<oid> <type> <size>" or "<name> missing" / "<name> ambiguous"
+            fields = header.decode('utf-8', errors='surrogateescape').rstrip('\n').rsplit(' ', 2)
+            if len(fields) != 3 or not fields[2].isdigit():
+                return None, None
+            info = ObjectInfo(fields[0], fields[1], int(fields[2]))
+            if command != 'contents':
+                return info, None
+            data = self._read_exactly(info.size + 1)[:-1]
+            return info, data
+
+    def _read_exactly(self, size: int) -> bytes:
+        chunks = []
+        while size > 0:
+            chunk = self._process.stdout.read(size)
+            if not chunk:
+                raise StorageError("git cat-file exited unexpectedly")
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b''.join(chunks)
+
+    def info(self, name: str) -> Optional[ObjectInfo]:
+        """Return the header of an object (any name git understands, e.g. 'HEAD:README.md')."""
+        return self._request('info', name)[0]
+
+    def contents(self, name: str) -> Tuple[Optional[ObjectInfo], Optional[bytes]]:
+        """Return the header and contents of an object, (None, None) if it doesn't exist."""
+        return self._request('contents', name)
+
+    def close(self):
+        if self._process.poll() is None:
+            self._process.stdin.close()
+            self._process.wait()
+
+# Tree entry: (file mode, object id)
+TreeEntry = Tuple[int, str]
+
+class GitTree:
+    """
+    Files of a git revision, read from the object store without a checkout.
+
+    Tree objects are parsed on first use and cached; blob contents are read on
+    demand and blob sizes are taken from object headers. Paths are relative to the
+    repository root, like working tree paths relative to the current directory.
+    """
+
+    def __init__(self, revision: str, reader: Optional[GitObjectReader] = None):
+        self.reader = reader or GitObjectReader()
+        info = self.reader.info(f"{revision}^{{commit}}")
+        if info is None:
+            raise StorageError(f"unknown revision '{revision}'")
+        self.revision = revision
+        self.commit = info.object_id
+        self.name = f"commit {self.commit[:12]}"
+        root = self.reader.info(f"{self.commit}^{{tree}}")
+        self._root_tree = root.object_id
+        self._trees: Dict[str, Dict[str, TreeEntry]] = {}
+        self._trees_lock = threading.Lock()
+
+    def _parse_tree(self, object_id: str) -> Dict[str, TreeEntry]:
+        with self._trees_lock:
+            if object_id in self._trees:
+                return self._trees[object_id]
+        _, data = self.reader.contents(object_id)
+        # Binary tree format: "<octal mode> <name>\0<raw object id>" per entry
+        id_size = len(object_id) // 2
+        entries = {}
+        position = 0
+        while position < len(data):
+            space = data.index(b' ', position)
+            null = data.index(b'\0', space)
+            mode = int(data[position:space], 8)
+            name = data[space + 1:null].decode('utf-8', errors='surrogateescape')
+            entries[name] = (mode, data[null + 1:null + 1 + id_size].hex())
+            position = null + 1 + id_size
+        with self._trees_lock:
+            self._trees[object_id] = entries
+        return entries
+
+    @staticmethod
+    def _parts(path: Path) -> Optional[List[str]]:
+        """Split a relative path into components, None if it points outside the repository."""
+        normalized = posixpath.normpath(Path(path).as_posix())
+        if normalized == '.':
+            return []
+        if normalized.startswith('/') or normalized == '..' or normalized.startswith('../'):
+            return None
+        return normalized.split('/')
+
+    def _lookup(self, path: Path) -> Optional[TreeEntry]:
+        parts = self._parts(path)
+        if parts is None:
+            return None
+        entry: TreeEntry = (stat.S_IFDIR, self._root_tree)
+        for part in parts:
+            if not stat.S_ISDIR(entry[0]):
+                return None
+            entry = self._parse_tree(entry[1]).get(part)
+            if entry is None:
+                return None
+        return entry
+
+    def _stat_function(self, mode: int, object_id: str) -> Callable[[], os.stat_result]:
+        def stat_function() -> os.stat_result:
+            size = 0
+            if not stat.S_ISDIR(mode):
+                info = self.reader.info(object_id)
+                size = info.size if info else 0
+            # Git stores no timestamps, object ids identify contents instead
+            return os.stat_result((mode, 0, 0, 1, 0, 0, size, 0, 0, 0))
+        return stat_function
+
+    def list_directory(self, directory: Path) -> List[CatalogEntry]:
+        entry = self._lookup(directory)
+        if entry is None:
+            raise FileNotFoundError(f"No such directory in {self.name}: '{directory}'")
+        if not stat.S_ISDIR(entry[0]):
+            raise NotADirectoryError(f"Not a directory in {self.name}: '{directory}'")
+
+        entries = []
+        for name, (mode, object_id) in self._parse_tree(entry[1]).items():
+            is_dir = stat.S_ISDIR(mode)
+            # Submodules (gitlinks) are neither files nor directories here
+            is_file = stat.S_ISREG(mode) or stat.S_ISLNK(mode)
+            entries.append(CatalogEntry(Path(directory) / name, is_dir, is_file,
+                                        self._stat_function(mode, object_id), stat.S_ISLNK(mode), object_id))
+        return entries
+
+    def exists(self, path: Path) -> bool:
+        return self._lookup(path) is not None
+
+    def is_dir(self, path: Path) -> bool:
+        entry = self._lookup(path)
+        return entry is not None and stat.S_ISDIR(entry[0])
+
+    def read_bytes(self, path: Path) -> bytes:
+        entry = self._lookup(path)
+        if entry is None:
+            raise FileNotFoundError(f"No such file in {self.name}: '{path}'")
+        if stat.S_ISDIR(entry[0]):
+            raise IsADirectoryError(f"Is a directory in {self.name}: '{path}'")
+        _, data = self.reader.contents(entry[1])
+        return data
+
+    def read_text(self, path: Path) -> str:
+        # Decode like open() in text mode, with universal newlines
+        return io.TextIOWrapper(io.BytesIO(self.read_bytes(path)), encoding='utf-8').read()
+
+    def open_binary(self, path: Path) -> BinaryIO:
+        return io.BytesIO(self.read_bytes(path))
+
+    @contextlib.contextmanager
+    def map_file(self, path: Path) -> Iterator[Buffer]:
+        # Blobs arrive through the cat-file pipe, so their contents are in memory already
+        yield self.read_bytes(path)
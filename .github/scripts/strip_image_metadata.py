@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Metadata remover for images in antenna directories.
+Rewrites JPEG, PNG and WebP images without EXIF (GPS location, thumbnails), XMP,
+comments and text chunks by copying only the needed segments and chunks, so image
+data is never re-encoded. Files are replaced atomically, images are processed in
+parallel and images already stripped are recorded in a hash manifest and skipped.
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+# Import configuration
+try:
+    from config import (
+        ANTENNAS_DIR, IMAGES_DIR_NAME, ALLOWED_IMAGE_EXTENSIONS, STRIPPED_IMAGES_MANIFEST_FILE,
+        ERROR_TEMPLATES, SUCCESS_TEMPLATES, PROGRESS_TEMPLATES
+    )
+    from catalog import CatalogEntry, CatalogSnapshot
+    from image_metadata import apply_plan, plan_strip
+    from optimize_images import OptimizedManifest, write_atomic
+except ImportError:
+    print("❌ Error: Could not import configuration file")
+    sys.exit(1)
+
+# Bump when the stripped metadata changes to check all images again
+MANIFEST_FORMAT_VERSION = 1
+
+class StrippedImage(NamedTuple):
+    """Result of stripping a single image."""
+    path: Path
+    # Names of removed metadata, empty if the image was clean
+    removed: List[str]
+    old_size: int
+    new_size: int
+    # SHA-256 of the image as it is on disk afterwards
+    data_hash: str
+
+def strip_image(snapshot: CatalogSnapshot, entry: CatalogEntry, manifest: Optional[OptimizedManifest],
+                strip_icc: bool = False, dry_run: bool = False) -> Optional[StrippedImage]:
+    """
+    Remove metadata from a single image.
+
+    Args:
+        manifest: Skip the image if the manifest has its hash (None to always check it)
+
+    Returns:
+        Result, or None if the image was skipped or isn't a supported image
+    """
+    with snapshot.map_file(entry.path) as data:
+        data_hash = hashlib.sha256(data).hexdigest()
+        if manifest is not None and manifest.is_optimized(entry.path, data_hash):
+            return None
+        plan = plan_strip(data, strip_icc)
+        if plan is None:
+            return None
+        if not plan.removed:
+            return StrippedImage(entry.path, [], len(data), len(data), data_hash)
+        old_size = len(data)
+        stripped = apply_plan(data, plan)
+
+    if not dry_run:
+        write_atomic(entry.path, stripped)
+    return StrippedImage(entry.path, plan.removed, old_size, len(stripped), hashlib.sha256(stripped).hexdigest())
+
+def strip_images(snapshot: CatalogSnapshot, manifest: OptimizedManifest, jobs: int = 1,
+                 strip_icc: bool = False, dry_run: bool = False) -> List[str]:
+    """
+    Remove metadata from all images in antenna 'images/' directories.
+
+    Images are rewritten on a thread pool, results are reported and recorded in the
+    manifest from the calling thread in catalog order.
+
+    Returns:
+        List of error messages
+    """
+    errors = []
+    print(PROGRESS_TEMPLATES['stripping_images'])
+
+    entries = [
+        entry
+        for antenna in snapshot.antenna_dirs()
+        for entry in snapshot.files(antenna.path / IMAGES_DIR_NAME)
+        if entry.path.suffix.lower() in ALLOWED_IMAGE_EXTENSIONS
+    ]
+    # The manifest only covers the default metadata, ICC profiles are checked every time
+    lookup = None if strip_icc else manifest
+
+    def run(entry: CatalogEntry):
+        try:
+            return strip_image(snapshot, entry, lookup, strip_icc, dry_run), None
+        except (OSError, ValueError) as e:
+            return None, ERROR_TEMPLATES['image_strip_error'].format(path=entry.path, error=e)
+
+    stripped = 0
+    saved = 0
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        for result, error_msg in executor.map(run, entries):
+            if error_msg:
+                errors.append(error_msg)
+                print(error_msg)
+                continue
+            if result is None:
+                continue
+            if result.removed:
+                print(PROGRESS_TEMPLATES['stripped_image'].format(
+                    path=result.path, metadata=', '.join(result.removed),
+                    old_size=result.old_size / 1024, new_size=result.new_size / 1024
+                ))
+                stripped += 1
+                saved += result.old_size - result.new_size
+            if not dry_run:
+                manifest.mark(result.path, result.data_hash)
+
+    print(SUCCESS_TEMPLATES['images_stripped'].format(count=stripped, saved=saved / 1024))
+    return errors
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Remove EXIF, GPS and other metadata from antenna images.")
+    parser.add_argument('antennas', nargs='*', metavar='ANTENNA', help="antenna directory names (default: all)")
+    parser.add_argument(
+        '--jobs', '-j', type=int, default=os.cpu_count() or 1, metavar='N',
+        help="number of images processed in parallel (default: number of CPUs)"
+    )
+    parser.add_argument(
+        '--strip-icc', action='store_true',
+        help="also remove ICC color profiles (colors of wide-gamut photos may change)"
+    )
+    parser.add_argument('--dry-run', action='store_true', help="only show what would be changed")
+    args = parser.parse_args()
+
+    try:
+        snapshot = CatalogSnapshot(ANTENNAS_DIR, antenna_names=args.antennas or None)
+        if not snapshot.antennas_dir_exists:
+            print(ERROR_TEMPLATES['no_antennas_dir'])
+            sys.exit(0)
+
+        manifest = OptimizedManifest(STRIPPED_IMAGES_MANIFEST_FILE, MANIFEST_FORMAT_VERSION)
+        errors = strip_images(snapshot, manifest, args.jobs, args.strip_icc, args.dry_run)
+        if not args.dry_run:
+            manifest.save()
+        sys.exit(1 if errors else 0)
+    except Exception as e:
+        print(f"❌ Unexpected error in image metadata stripping: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Resonance and bandwidth analysis of Touchstone sweeps.
+Stacks the sweeps of the whole catalog into padded 2D arrays and finds SWR minima,
+SWR < 2 and -10 dB return loss intervals and detuning from target bands for all
+sweeps in one batched computation. Requires NumPy.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Import configuration and utilities
+try:
+    from config import (
+        ANTENNAS_DIR, DATA_DIR_NAME, DETAILS_FILE_NAME, ALLOWED_DATA_EXTENSIONS,
+        RESONANCE_MAX_SWR, BANDWIDTH_MAX_SWR, BANDWIDTH_MIN_RETURN_LOSS_DB
+    )
+    from messages import ERROR_TEMPLATES, SUCCESS_TEMPLATES, PROGRESS_TEMPLATES
+    from markdown_tree import parse_markdown
+    from measurements import band_range_hz, extract_measurements
+    from generate_readme import ROOT_README, ANTENNAS_SECTION, parse_block_antenna
+    from touchstone import Sweep, compute_metrics, format_frequency, load_touchstone, np
+    from catalog import CatalogSnapshot
+except ImportError as e:
+    print(f"❌ Error: Could not import required modules: {e}")
+    sys.exit(1)
+
+class Resonance(NamedTuple):
+    frequency: float
+    swr: float
+
+class Detuning(NamedTuple):
+    """Offset of the nearest resonance from the center of a target band."""
+    band: str
+    resonance: Optional[float]
+    offset: Optional[float]
+    # Whether the whole band is inside an SWR < 2 interval
+    covered: bool
+
+class SweepAnalysis(NamedTuple):
+    antenna: str
+    path: Path
+    resonances: List[Resonance]
+    # (start, stop) frequency intervals
+    swr_bandwidth: List[Tuple[float, float]]
+    return_loss_bandwidth: List[Tuple[float, float]]
+    detuning: List[Detuning]
+
+def stack_sweeps(sweeps: List[Sweep]):
+    """
+    Stack sweeps of different lengths into NaN-padded 2D arrays (one row per sweep).
+
+    Returns:
+        Tuple of (frequency, gamma, reference impedance column)
+    """
+    width = max(len(sweep.frequency) for sweep in sweeps)
+    frequency = np.full((len(sweeps), width), np.nan)
+    gamma = np.full((len(sweeps), width), np.nan, dtype=complex)
+    for row, sweep in enumerate(sweeps):
+        frequency[row, :len(sweep.frequency)] = sweep.frequency
+        gamma[row, :len(sweep.gamma)] = sweep.gamma
+    reference = np.array([[sweep.reference_impedance] for sweep in sweeps])
+    return frequency, gamma, reference
+
+def find_runs(mask: 'np.ndarray'):
+    """
+    Find runs of consecutive True values in every row of a 2D mask.
+
+    Returns:
+        Tuple of (row, first column, last column, run id per flat position) arrays;
+        positions outside runs have run id -1
+    """
+    rows, width = mask.shape
+    # A False separator column keeps runs from continuing into the next row
+    flat = np.concatenate([mask, np.zeros((rows, 1), dtype=bool)], axis=1).ravel()
+    edges = np.diff(flat.astype(np.int8), prepend=0)
+    starts = np.flatnonzero(edges == 1)
+    stops = np.flatnonzero(edges == -1) - 1
+
+    run_ids = np.cumsum(edges == 1) - 1
+    run_ids[~flat] = -1
+
+    return starts // (width + 1), starts % (width + 1), stops % (width + 1), run_ids
+
+def find_intervals(mask: 'np.ndarray', frequency: 'np.ndarray') -> List[List[Tuple[float, float]]]:
+    """Return frequency intervals of True runs for every row of a mask."""
+    rows, first, last, _ = find_runs(mask)
+    intervals = [[] for _ in range(mask.shape[0])]
+    for row, start, stop in zip(rows, frequency[rows, first], frequency[rows, last]):
+        intervals[row].append((float(start), float(stop)))
+    return intervals
+
+def find_resonances(swr: 'np.ndarray', frequency: 'np.ndarray',
+                    max_swr: float = RESONANCE_MAX_SWR) -> List[List[Resonance]]:
+    """
+    Find the lowest SWR point of every region below `max_swr` for every row.
+
+    Taking one minimum per region instead of every local minimum ignores measurement
+    noise around a resonance.
+    """
+    mask = swr < max_swr
+    rows, _, _, run_ids = find_runs(mask)
+    width = swr.shape[1]
+
+    flat_swr = np.concatenate([swr, np.full((swr.shape[0], 1), np.inf)], axis=1).ravel()
+    positions = np.flatnonzero(run_ids >= 0)
+    # Sort by run, then by SWR: the first position of every run is its minimum
+    order = positions[np.lexsort((flat_swr[positions], run_ids[positions]))]
+    _, first = np.unique(run_ids[order], return_index=True)
+    minima = order[first]
+
+    resonances = [[] for _ in range(swr.shape[0])]
+    for row, column in zip(minima // (width + 1), minima % (width + 1)):
+        resonances[row].append(Resonance(float(frequency[row, column]), float(swr[row, column])))
+    return resonances
+
+def compute_detuning(bands: List[str], resonances: List[Resonance],
+                     swr_bandwidth: List[Tuple[float, float]]) -> List[Detuning]:
+    """Compute offsets of the nearest resonance from the center of each target band."""
+    detuning = []
+    for band in bands:
+        band_range = band_range_hz(band)
+        if band_range is None:
+            continue
+        low, high = band_range
+        center = (low + high) / 2
+        covered = any(start <= low and high <= stop for start, stop in swr_bandwidth)
+
+        nearest = min(resonances, key=lambda resonance: abs(resonance.frequency - center), default=None)
+        if nearest is None:
+            detuning.append(Detuning(band, None, None, covered))
+        else:
+            detuning.append(Detuning(band, nearest.frequency, nearest.frequency - center, covered))
+    return detuning
+
+def analyze_sweeps(sweeps: List[Sweep], bands: List[List[str]]) -> List[tuple]:
+    """
+    Analyze sweeps in one batched computation.
+
+    Args:
+        sweeps: Sweeps to analyze
+        bands: Target bands for every sweep
+
+    Returns:
+        List of (resonances, SWR bandwidth, return loss bandwidth, detuning) tuples, one per sweep
+    """
+    if not sweeps:
+        return []
+
+    frequency, gamma, reference = stack_sweeps(sweeps)
+    metrics = compute_metrics(frequency, gamma, reference)
+    # NaN padding compares as False and never becomes part of a run
+    with np.errstate(invalid='ignore'):
+        swr = np.where(np.isnan(metrics.swr), np.inf, metrics.swr)
+        swr_intervals = find_intervals(swr < BANDWIDTH_MAX_SWR, frequency)
+        return_loss_intervals = find_intervals(metrics.return_loss >= BANDWIDTH_MIN_RETURN_LOSS_DB, frequency)
+    resonances = find_resonances(swr, frequency)
+
+    return [
+        (resonances[row], swr_intervals[row], return_loss_intervals[row],
+         compute_detuning(bands[row], resonances[row], swr_intervals[row]))
+        for row in range(len(sweeps))
+    ]
+
+def readme_target_bands(readme_content: str) -> Dict[str, List[str]]:
+    """Return '#### <freq>' headings of each antenna block in the root README.md "Antennas" section."""
+    document = parse_markdown(readme_content)
+    section = document.find(ANTENNAS_SECTION, level=2)
+    bands = {}
+    if section is None:
+        return bands
+    for block in section.iter(level=3):
+        antenna = parse_block_antenna(block.title)
+        if antenna:
+            bands.setdefault(antenna, []).extend(node.title for node in block.iter(level=4))
+    return bands
+
+def analyze_catalog(snapshot: CatalogSnapshot, readme_content: str = '') -> Tuple[List[SweepAnalysis], List[str]]:
+    """
+    Load all sweeps of a catalog and analyze them at once.
+
+    Target bands come from the root README.md; antennas without a block there
+    use the measurement bands of their own README.md.
+
+    Returns:
+        Tuple of (analysis results, error messages of unreadable sweep files)
+    """
+    errors = []
+    readme_bands = readme_target_bands(readme_content)
+    sweeps, owners, bands = [], [], []
+
+    for antenna in snapshot.antenna_dirs():
+        data_dir = antenna.path / DATA_DIR_NAME
+        if not snapshot.is_dir(data_dir):
+            continue
+
+        antenna_bands = readme_bands.get(antenna.name)
+        if antenna_bands is None:
+            readme_file = antenna.path / DETAILS_FILE_NAME
+            records = extract_measurements(antenna.name, snapshot.read_text(readme_file)) \
+                if snapshot.exists(readme_file) else []
+            antenna_bands = list(dict.fromkeys(record.band for record in records))
+
+        for entry in snapshot.files(data_dir):
+            if entry.path.suffix.lower() not in ALLOWED_DATA_EXTENSIONS:
+                continue
+            try:
+                sweeps.append(load_touchstone(snapshot.read_text(entry.path)))
+            except (OSError, UnicodeDecodeError, ValueError) as e:
+                errors.append(ERROR_TEMPLATES['sweep_parse_error'].format(path=entry.path, error=e))
+                continue
+            owners.append((antenna.name, entry.path))
+            bands.append(antenna_bands)
+
+    results = [
+        SweepAnalysis(antenna, path, *analysis)
+        for (antenna, path), analysis in zip(owners, analyze_sweeps(sweeps, bands))
+    ]
+    return results, errors
+
+def format_interval(interval: Tuple[float, float]) -> str:
+    return f"{format_frequency(interval[0])}-{format_frequency(interval[1])}"
+
+def print_analysis(result: SweepAnalysis):
+    """Print a human-readable report of a single sweep."""
+    print(f"  📄 {result.path}")
+    resonances = ', '.join(f"{format_frequency(r.frequency)} (SWR {r.swr:.3f})" for r in result.resonances)
+    print(f"    Resonances: {resonances or 'none'}")
+    print(f"    SWR < {BANDWIDTH_MAX_SWR:g}: {', '.join(map(format_interval, result.swr_bandwidth)) or 'none'}")
+    print(f"    Return loss ≥ {BANDWIDTH_MIN_RETURN_LOSS_DB:g} dB: "
+          f"{', '.join(map(format_interval, result.return_loss_bandwidth)) or 'none'}")
+    for item in result.detuning:
+        status = '✅' if item.covered else '⚠️ '
+        if item.resonance is None:
+            print(f"    {status} {item.band}: no resonance")
+        else:
+            print(f"    {status} {item.band}: nearest resonance {format_frequency(item.resonance)} "
+                  f"({item.offset / 1e6:+.2f} MHz)")
+
+def analysis_to_json(result: SweepAnalysis) -> dict:
+    return {
+        'antenna': result.antenna,
+        'path': result.path.as_posix(),
+        'resonances': [r._asdict() for r in result.resonances],
+        'swr_bandwidth': result.swr_bandwidth,
+        'return_loss_bandwidth': result.return_loss_bandwidth,
+        'detuning': [d._asdict() for d in result.detuning]
+    }
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Find resonances and bandwidth of antenna sweeps.")
+    parser.add_argument('antennas', nargs='*', metavar='ANTENNA', help="antenna directory names (default: all)")
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    args = parser.parse_args()
+
+    if np is None:
+        print(ERROR_TEMPLATES['numpy_required'])
+        sys.exit(1)
+
+    try:
+        snapshot = CatalogSnapshot(ANTENNAS_DIR, antenna_names=args.antennas or None)
+        if not snapshot.antennas_dir_exists:
+            print(ERROR_TEMPLATES['no_antennas_dir'])
+            sys.exit(0)
+
+        readme_content = ROOT_README.read_text(encoding='utf-8') if ROOT_README.exists() else ''
+        results, errors = analyze_catalog(snapshot, readme_content)
+
+        if args.json:
+            print(json.dumps([analysis_to_json(result) for result in results], indent=2))
+        else:
+            print(PROGRESS_TEMPLATES['analyzing_sweeps'])
+            for result in results:
+                print_analysis(result)
+            for error in errors:
+                print(error)
+            print(SUCCESS_TEMPLATES['sweeps_analyzed'].format(
+                sweeps=len(results), antennas=len({result.antenna for result in results})
+            ))
+        sys.exit(1 if errors else 0)
+    except Exception as e:
+        print(f"❌ Unexpected error in sweep analysis: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Tests of the external link checker against a local stub HTTP server.
+Run with: python -m unittest discover -s .github/scripts -p 'test_*.py'
+"""
+
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from check_external_links import (  # noqa: E402
+    LINK_DEAD, LINK_OK, LINK_UNVERIFIED, MAX_DRAINED_BODY_BYTES, LinkCache, LinkResult, check_urls
+)
+
+# Larger than what the checker drains to keep a connection alive
+LARGE_BODY_BYTES = 16 * MAX_DRAINED_BODY_BYTES
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves fixed responses by path."""
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_empty(self, status: int, headers: dict = None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_HEAD(self):
+        if self.path == '/ok':
+            self.send_empty(200)
+        elif self.path == '/redirect':
+            self.send_empty(301, {'Location': '/ok'})
+        elif self.path in ('/head-not-allowed', '/large'):
+            self.send_empty(405)
+        else:
+            self.send_empty(404)
+
+    def do_GET(self):
+        if self.path == '/head-not-allowed':
+            body = b'page'
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif self.path == '/large':
+            # No length, the body ends when the server closes the connection
+            self.send_response(200)
+            self.send_header('Connection', 'close')
+            self.end_headers()
+            self.close_connection = True
+            try:
+                self.wfile.write(b'x' * LARGE_BODY_BYTES)
+            except OSError:
+                # The checker doesn't read large bodies and closes the connection
+                pass
+        else:
+            self.do_HEAD()
+
+class CheckUrlsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        cls.server.daemon_threads = True
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def check(self, *paths: str) -> dict:
+        urls = [self.base + path for path in paths]
+        results = check_urls(urls, timeout=5)
+        return {url[len(self.base):]: result for url, result in results.items()}
+
+    def test_ok(self):
+        result = self.check('/ok')['/ok']
+        self.assertEqual((result.state, result.status), (LINK_OK, 200))
+
+    def test_not_found_is_dead(self):
+        result = self.check('/missing')['/missing']
+        self.assertEqual((result.state, result.status), (LINK_DEAD, 404))
+
+    def test_head_not_allowed_falls_back_to_get(self):
+        result = self.check('/head-not-allowed')['/head-not-allowed']
+        self.assertEqual((result.state, result.status), (LINK_OK, 200))
+
+    def test_redirect_is_followed(self):
+        result = self.check('/redirect')['/redirect']
+        self.assertEqual((result.state, result.status), (LINK_OK, 200))
+
+    def test_large_body_closing_connection(self):
+        # Requests after the large body need new connections from the pool
+        results = self.check('/large', '/ok', '/missing', '/head-not-allowed')
+        self.assertEqual(results['/large'].state, LINK_OK)
+        self.assertEqual(results['/ok'].state, LINK_OK)
+        self.assertEqual(results['/missing'].state, LINK_DEAD)
+        self.assertEqual(results['/head-not-allowed'].state, LINK_OK)
+
+    def test_unknown_host_is_dead(self):
+        # '.invalid' names never resolve (RFC 2606)
+        url = 'http://shop.nonexistent.invalid/item'
+        result = check_urls([url], timeout=5)[url]
+        self.assertEqual(result.state, LINK_DEAD)
+        self.assertIsNone(result.status)
+        self.assertEqual(result.error, "host not found")
+
+class LinkCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / 'link_check.json'
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_results_expire_after_their_ttl(self):
+        cache = LinkCache(self.path, ttl=100, failure_ttl=10)
+        cache.put('https://example.com/ok', LinkResult(LINK_OK, 200, None, 1000.0))
+        cache.put('https://example.com/busy', LinkResult(LINK_UNVERIFIED, 503, None, 1000.0))
+
+        self.assertIsNotNone(cache.get('https://example.com/ok', now=1050.0))
+        self.assertIsNotNone(cache.get('https://example.com/busy', now=1005.0))
+        # Failures expire sooner than working links
+        self.assertIsNone(cache.get('https://example.com/busy', now=1050.0))
+        self.assertIsNone(cache.get('https://example.com/ok', now=1100.0))
+        self.assertIsNone(cache.get('https://example.com/unknown', now=1000.0))
+
+    def test_save_drops_expired_results(self):
+        cache = LinkCache(self.path, ttl=3600, failure_ttl=3600)
+        fresh = LinkResult(LINK_OK, 200, None, 10 ** 10)
+        cache.put('https://example.com/fresh', fresh)
+        cache.put('https://example.com/expired', LinkResult(LINK_OK, 200, None, 0.0))
+        cache.save()
+
+        reloaded = LinkCache(self.path, ttl=3600, failure_ttl=3600)
+        self.assertEqual(reloaded.get('https://example.com/fresh', now=10 ** 10), fresh)
+        self.assertIsNone(reloaded.get('https://example.com/expired', now=0.0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Touchstone (.s1p) sweep loader.
+Parses 1-port Touchstone files exported by NanoVNA and similar devices and computes
+reflection coefficient, SWR, impedance and return loss for all points at once with NumPy.
+Requires NumPy.
+"""
+
+import io
+from typing import NamedTuple, Optional
+
+# NumPy is only needed for sweep files, the rest of the validation works without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+FREQUENCY_MULTIPLIERS = {'hz': 1.0, 'khz': 1e3, 'mhz': 1e6, 'ghz': 1e9}
+DATA_FORMATS = {'ma', 'db', 'ri'}
+
+# Touchstone defaults when the option line omits a value
+DEFAULT_FREQUENCY_UNIT = 'ghz'
+DEFAULT_DATA_FORMAT = 'ma'
+DEFAULT_REFERENCE_IMPEDANCE = 50.0
+
+class Sweep(NamedTuple):
+    """1-port sweep: frequencies in Hz and complex reflection coefficients (S11)."""
+    frequency: 'np.ndarray'
+    gamma: 'np.ndarray'
+    reference_impedance: float
+
+class SweepMetrics(NamedTuple):
+    """Derived per-point values of a sweep, all arrays have the same length."""
+    frequency: 'np.ndarray'
+    gamma: 'np.ndarray'
+    # |Γ|
+    reflection: 'np.ndarray'
+    swr: 'np.ndarray'
+    # Complex impedance in ohms
+    impedance: 'np.ndarray'
+    # Return loss in dB (positive)
+    return_loss: 'np.ndarray'
+
+def parse_option_line(line: str):
+    """
+    Parse a Touchstone option line like '# MHz S RI R 50'.
+
+    Returns:
+        Tuple of (frequency multiplier, data format, reference impedance)
+
+    Raises:
+        ValueError: If the option line describes something other than S-parameters
+    """
+    tokens = line[1:].lower().split()
+    unit, data_format, reference = DEFAULT_FREQUENCY_UNIT, DEFAULT_DATA_FORMAT, DEFAULT_REFERENCE_IMPEDANCE
+
+    position = 0
+    while position < len(tokens):
+        token = tokens[position]
+        if token in FREQUENCY_MULTIPLIERS:
+            unit = token
+        elif token in DATA_FORMATS:
+            data_format = token
+        elif token == 'r' and position + 1 < len(tokens):
+            position += 1
+            reference = float(tokens[position])
+        elif token != 's':
+            raise ValueError(f"unsupported option '{token}', only S-parameters are supported")
+        position += 1
+
+    return FREQUENCY_MULTIPLIERS[unit], data_format, reference
+
+def load_touchstone(text: str) -> Sweep:
+    """
+    Parse 1-port Touchstone (version 1) file content.
+
+    Args:
+        text: File content
+
+    Returns:
+        Parsed sweep
+
+    Raises:
+        ValueError: If the content isn't a valid 1-port Touchstone file
+    """
+    option_line = next((line for line in text.splitlines() if line.lstrip().startswith('#')), '#')
+    multiplier, data_format, reference = parse_option_line(option_line.strip())
+
+    # Comments start with '!' and the option line with '#', both are skipped by the parser
+    data = np.loadtxt(io.StringIO(text), comments=('!', '#'), ndmin=2)
+    if data.size == 0:
+        raise ValueError("no data points")
+    if data.shape[1] != 3:
+        raise ValueError(f"expected 3 columns of a 1-port file, found {data.shape[1]}")
+
+    frequency = data[:, 0] * multiplier
+    if np.any(np.diff(frequency) <= 0):
+        raise ValueError("frequencies must be strictly increasing")
+
+    first, second = data[:, 1], data[:, 2]
+    if data_format == 'ri':
+        gamma = first + 1j * second
+    else:
+        magnitude = 10 ** (first / 20) if data_format == 'db' else first
+        gamma = magnitude * np.exp(1j * np.deg2rad(second))
+
+    return Sweep(frequency, gamma, reference)
+
+def compute_metrics(frequency: 'np.ndarray', gamma: 'np.ndarray',
+                    reference_impedance: float = DEFAULT_REFERENCE_IMPEDANCE) -> SweepMetrics:
+    """
+    Compute derived values for all points at once.
+
+    Works on arrays of any shape, e.g. several sweeps of the same length stacked into rows.
+    Points with |Γ| >= 1 get infinite SWR (and infinite impedance at Γ = 1).
+    """
+    reflection = np.abs(gamma)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        swr = np.where(reflection < 1, (1 + reflection) / (1 - reflection), np.inf)
+        impedance = reference_impedance * (1 + gamma) / (1 - gamma)
+        return_loss = -20 * np.log10(reflection)
+    return SweepMetrics(frequency, gamma, reflection, swr, impedance, return_loss)
+
+def sweep_metrics(sweep: Sweep) -> SweepMetrics:
+    return compute_metrics(sweep.frequency, sweep.gamma, sweep.reference_impedance)
+
+def metrics_at(sweep: Sweep, frequency: float) -> Optional[SweepMetrics]:
+    """
+    Interpolate a sweep at a single frequency.
+
+    The reflection coefficient is interpolated (real and imaginary parts) and the other
+    values are derived from it, which is more accurate than interpolating SWR or impedance.
+
+    Returns:
+        Metrics with scalar values, or None if the frequency is outside of the sweep
+    """
+    if frequency < sweep.frequency[0] or frequency > sweep.frequency[-1]:
+        return None
+    gamma = (np.interp(frequency, sweep.frequency, sweep.gamma.real)
+             + 1j * np.interp(frequency, sweep.frequency, sweep.gamma.imag))
+    return compute_metrics(np.float64(frequency), gamma, sweep.reference_impedance)
+
+def format_frequency(frequency: float) -> str:
+    """Format a frequency in Hz with a readable unit, e.g. '868 MHz'."""
+    for unit, multiplier in (('GHz', 1e9), ('MHz', 1e6), ('kHz', 1e3)):
+        if frequency >= multiplier:
+            return f"{frequency / multiplier:g} {unit}"
+    return f"{frequency:g} Hz"
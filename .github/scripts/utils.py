@@ -3,51 +3,11 @@
 Utility functions for validation scripts.
 """
 
+import posixpath
 import re
 from pathlib import Path
-from typing import Dict, Any, List, Set, Tuple
-
-def extract_sections_from_markdown(content: str) -> Dict[str, Dict[str, Any]]:
-    """
-    Extract sections and their content from markdown content.
-    
-    Args:
-        content: Markdown content as string
-        
-    Returns:
-        Dictionary with section names as keys and section info as values
-    """
-    sections = {}
-    
-    # Split content into lines
-    lines = content.split('\n')
-    current_section = None
-    current_content = []
-    
-    for line in lines:
-        # Check for h2 headers (##)
-        if line.startswith('## '):
-            # Save previous section if exists
-            if current_section:
-                sections[current_section] = {
-                    'content': '\n'.join(current_content).strip(),
-                    'lines': current_content.copy()
-                }
-            
-            # Start new section
-            current_section = line[3:].strip()  # Remove '## '
-            current_content = []
-        elif current_section:
-            current_content.append(line)
-    
-    # Save last section
-    if current_section:
-        sections[current_section] = {
-            'content': '\n'.join(current_content).strip(),
-            'lines': current_content.copy()
-        }
-    
-    return sections
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from urllib.parse import unquote, urlparse
 
 def check_parameter_in_section(section_text: str, parameter: str) -> bool:
     """
@@ -96,8 +56,92 @@ def extract_image_links(content: str) -> List[str]:
     for alt_text, url in matches:
         image_links.append(url)
     
+    # Find HTML images: <img src="url">
+    html_pattern = r'<img\s[^>]*?src\s*=\s*["\']([^"\']+)["\']'
+    image_links.extend(re.findall(html_pattern, content, re.IGNORECASE))
+    
     return image_links
 
+class ImageReference(NamedTuple):
+    """An image reference of a README.md file."""
+    readme: Path
+    # Link as written in the README.md, e.g. './images/photo.jpg "Photo"'
+    link: str
+    # Target path relative to the repository root, None if it points outside the repository
+    path: Optional[Path]
+    # Whether the link starts with '/' (only resolved relative to the repository root on GitHub)
+    absolute: bool
+
+def resolve_image_link(link: str, readme: Path) -> Optional[ImageReference]:
+    """
+    Resolve an image link of a README.md file to a path in the repository.
+    
+    Handles './' prefixes, '<...>' destinations, optional titles, URL-encoded
+    characters, query strings and fragments.
+    
+    Args:
+        link: Image link as returned by extract_image_links()
+        readme: Path of the README.md file relative to the repository root
+        
+    Returns:
+        Resolved reference, or None for external URLs
+    """
+    target = link.strip()
+    if target.startswith('<') and '>' in target:
+        target = target[1:target.index('>')]
+    elif target:
+        # Drop a title, e.g. 'images/photo.jpg "Photo"'
+        target = target.split()[0]
+    if not target or target.startswith('//') or urlparse(target).scheme:
+        return None
+    target = unquote(target.split('#', 1)[0].split('?', 1)[0])
+    
+    absolute = target.startswith('/')
+    base = '' if absolute else readme.parent.as_posix()
+    normalized = posixpath.normpath(posixpath.join(base, target.lstrip('/')))
+    if normalized == '..' or normalized.startswith('../'):
+        return ImageReference(readme, link, None, absolute)
+    return ImageReference(readme, link, Path(normalized), absolute)
+
+class ReferenceIndex:
+    """Reverse index of image references: image path -> references to it."""
+    
+    def __init__(self):
+        self.references: Dict[Path, List[ImageReference]] = {}
+    
+    def add_readme(self, readme: Path, content: str) -> List[ImageReference]:
+        """
+        Index the image references of a README.md file.
+        
+        Returns:
+            References of the file in document order, external URLs excluded
+            (references outside the repository have no path and aren't indexed)
+        """
+        references = []
+        for link in extract_image_links(content):
+            reference = resolve_image_link(link, readme)
+            if reference is None:
+                continue
+            references.append(reference)
+            if reference.path is not None:
+                self.references.setdefault(reference.path, []).append(reference)
+        return references
+    
+    def dangling(self, files: Set[Path], exists: Callable[[Path], bool]) -> Set[Path]:
+        """
+        Return referenced paths that don't exist.
+        
+        Args:
+            files: Paths of listed files (e.g. of a catalog snapshot)
+            exists: Existence check of paths that aren't listed files, e.g. paths
+                outside the listed directories
+        """
+        return {path for path in set(self.references) - files if not exists(path)}
+    
+    def orphans(self, files: Iterable[Path]) -> List[Path]:
+        """Return files without any reference."""
+        return [path for path in files if path not in self.references]
+
 def extract_links_from_readme(readme_path: Path) -> Tuple[List[str], List[str]]:
     """
     Extract all links from README.md file.
@@ -108,17 +152,29 @@ def extract_links_from_readme(readme_path: Path) -> Tuple[List[str], List[str]]:
     Returns:
         Tuple of (internal_links, external_links)
     """
-    internal_links = []
-    external_links = []
-    
     try:
         with open(readme_path, 'r', encoding='utf-8') as f:
             content = f.read()
     except FileNotFoundError:
-        return internal_links, external_links
+        return [], []
     except Exception as e:
         print(f"❌ Error reading README.md: {e}")
-        return internal_links, external_links
+        return [], []
+    
+    return extract_links(content)
+
+def extract_links(content: str) -> Tuple[List[str], List[str]]:
+    """
+    Extract all links from markdown content.
+    
+    Args:
+        content: Markdown content as string
+        
+    Returns:
+        Tuple of (internal_links, external_links)
+    """
+    internal_links = []
+    external_links = []
     
     # Find all markdown links: [text](url)
     link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
@@ -133,6 +189,30 @@ def extract_links_from_readme(readme_path: Path) -> Tuple[List[str], List[str]]:
     
     return internal_links, external_links
 
+def extract_external_links(content: str) -> List[str]:
+    """
+    Extract http(s) URLs from markdown content.
+    
+    Covers markdown links ([text](url "title")), autolinks (<url>) and bare URLs.
+    
+    Args:
+        content: Markdown content as string
+        
+    Returns:
+        List of unique URLs in order of appearance
+    """
+    links = []
+    
+    # Markdown links and images, an optional title follows the URL after a space
+    for url in re.findall(r'\]\(\s*(https?://[^)\s]+)', content):
+        links.append(url)
+    
+    # Autolinks and bare URLs (not already inside a markdown link)
+    for url in re.findall(r'(?<![(\w])(https?://[^\s)<>\]]+)', content):
+        links.append(url.rstrip('.,;:!?\'"'))
+    
+    return list(dict.fromkeys(links))
+
 def get_antenna_directories(antennas_dir: Path) -> Set[str]:
     """
     Get all antenna directory names.
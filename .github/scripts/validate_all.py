@@ -5,32 +5,71 @@ This script coordinates all validation checks and provides clear error messages.
 Imports functions from individual validation scripts to avoid code duplication.
 """
 
+import argparse
+import contextlib
+import os
 import sys
-from typing import List
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
 
 # Import configuration
 try:
-    from config import ERROR_TEMPLATES, SUCCESS_TEMPLATES, PROGRESS_TEMPLATES
+    from config import ANTENNAS_DIR, ERROR_TEMPLATES, SUCCESS_TEMPLATES, PROGRESS_TEMPLATES
 except ImportError:
     print("❌ Error: Could not import configuration file")
     sys.exit(1)
 
-# Import validation functions from individual scripts
+# Import validation infrastructure; validator modules are imported lazily by the registry
 try:
-    from check_directory_naming import check_directory_naming
-    from check_file_sizes import check_file_sizes
-    from validate_images import validate_images
-    from validate_required_files import validate_required_files
-    from validate_readme import validate_readme_links
-    from validate_details import validate_antenna_readme_files
+    from catalog import CatalogSnapshot, Shard
+    from git_changes import GitChangesError, get_changed_antennas, list_commits
+    from storage import GitObjectReader, GitTree, StorageError
+    from results_cache import ValidationCache
+    from instrumentation import DEFAULT_PROFILE_DIR, DEFAULT_TIMINGS_FILE, StageRecorder
+    from report import QuietOutput, Reporter
+    from registry import (
+        Validator, ValidatorFunction, affected_validators, load, run_scheduled, schedule, select_validators, stage_names
+    )
+    from watch import changed_antennas, changed_inputs, create_watcher, wait_for_changes
 except ImportError as e:
     print(f"❌ Error: Could not import validation modules: {e}")
     sys.exit(1)
 
-def run_all_validations() -> List[str]:
+def run_all_validations(antenna_names: Optional[Iterable[str]] = None, use_cache: bool = True,
+                        jobs: int = 1, recorder: Optional[StageRecorder] = None,
+                        reporter: Optional[Reporter] = None, quiet: bool = False,
+                        stages: Optional[Iterable[str]] = None, max_errors: Optional[int] = None,
+                        cache: Optional[ValidationCache] = None, storage=None,
+                        shard: Optional[Shard] = None) -> List[str]:
     """
     Run all validation checks and return a list of all errors found.
     
+    Stages run cheap first; with `jobs` > 1 stages that don't read the same files run
+    concurrently (see registry.schedule). Measuring stages with a recorder runs them
+    one at a time, since process-wide counters can't be split between concurrent stages.
+    
+    With a shard, 'antenna' stages only check the antenna directories of the shard and
+    'catalog' stages (see registry.SCOPES) run on the first shard only, against the
+    whole catalog, so every finding is reported by exactly one shard.
+    
+    Args:
+        antenna_names: Restrict per-antenna checks to these directories (all if None).
+            'catalog' stages (root README.md cross-checks, duplicate and orphan images)
+            always cover the whole catalog.
+        use_cache: Reuse per-antenna results of unchanged antennas from the results cache
+        jobs: Number of worker threads for stages and per-antenna checks
+        recorder: Records cost of every stage (see instrumentation.StageRecorder)
+        reporter: Receives findings of every stage as it finishes (see report.Reporter)
+        quiet: Hide progress and per-file output of validators, keeping warnings
+        stages: Run only these stages (names or aliases from registry.VALIDATORS, all if None)
+        max_errors: Skip stages that haven't started once this many errors were found
+        cache: Results cache owned by the caller, used instead of loading and saving
+            the cache file (watch mode keeps one cache in memory between runs)
+        storage: Storage backend to read the catalog from (see storage.py), the
+            working tree by default
+        shard: Part of the catalog to validate (see catalog.Shard), all of it if None
+    
     Returns:
         List[str]: List of error messages from all validation checks
     """
@@ -38,79 +77,402 @@ def run_all_validations() -> List[str]:
     
     print(PROGRESS_TEMPLATES['starting'])
     
-    # Run directory naming validation
+    validators = select_validators(stages)
+    if shard is not None and not shard.is_primary:
+        validators = [validator for validator in validators if validator.scope != 'catalog']
     try:
-        errors = check_directory_naming()
-        all_errors.extend(errors)
-    except Exception as e:
-        error_msg = f"❌ Error in directory naming validation: {e}"
-        all_errors.append(error_msg)
-        print(error_msg)
+        functions = {validator.stage: load(validator) for validator in validators}
+    except (ImportError, AttributeError) as e:
+        print(f"❌ Error: Could not import validation modules: {e}")
+        sys.exit(1)
     
-    # Run file size validation
-    try:
-        errors = check_file_sizes()
-        all_errors.extend(errors)
-    except Exception as e:
-        error_msg = f"❌ Error in file size validation: {e}"
-        all_errors.append(error_msg)
-        print(error_msg)
+    def measure(stage: str, snapshot: Optional[CatalogSnapshot] = None):
+        return recorder.measure(stage, snapshot) if recorder else contextlib.nullcontext()
+    
+    # Walk the antennas directory once and share the snapshot between validators
+    with measure('scan'):
+        snapshot = CatalogSnapshot(antenna_names=antenna_names, jobs=jobs, storage=storage, shard=shard)
+        # Catalog-wide stages compare all antennas, also when only some are selected
+        # (e.g. a change to the root README.md affects every antenna)
+        catalog_snapshot = snapshot
+        if ((antenna_names is not None or shard is not None)
+                and any(validator.scope == 'catalog' for validator in validators)):
+            catalog_snapshot = CatalogSnapshot(jobs=jobs, storage=storage)
+    if cache is not None:
+        snapshot.results_cache = cache
+    elif use_cache:
+        snapshot.results_cache = ValidationCache()
+    catalog_snapshot.results_cache = snapshot.results_cache
+    
+    if shard is not None:
+        print(PROGRESS_TEMPLATES['shard'].format(shard=shard, count=len(snapshot.antenna_dirs()),
+                                                 total=len(snapshot.all_antenna_dirs())))
+        if catalog_snapshot is not snapshot:
+            print(PROGRESS_TEMPLATES['shard_catalog_stages'].format(shard=shard, stages=', '.join(
+                validator.stage for validator in validators if validator.scope == 'catalog'
+            )))
+    
+    # Stage durations, reported from the calling thread in schedule order
+    durations = {}
+    
+    def run_stage(validator: Validator, function: ValidatorFunction) -> List[str]:
+        start = time.perf_counter()
+        try:
+            stage_snapshot = catalog_snapshot if validator.scope == 'catalog' else snapshot
+            with measure(validator.stage, stage_snapshot):
+                errors = function(stage_snapshot)
+        except Exception as e:
+            errors = [f"❌ Error in {validator.label} validation: {e}"]
+            print(errors[0])
+        durations[validator.stage] = time.perf_counter() - start
+        return errors
+    
+    concurrency = 1 if recorder is not None else jobs
+    with contextlib.ExitStack() as stack:
+        if quiet:
+            stack.enter_context(contextlib.redirect_stdout(QuietOutput(sys.stdout)))
+        for result in run_scheduled(validators, functions, run_stage, concurrency, max_errors):
+            if result.errors is None:
+                print(ERROR_TEMPLATES['stage_skipped'].format(stage=result.validator.stage))
+                continue
+            sys.stdout.write(result.output)
+            all_errors.extend(result.errors)
+            if reporter is not None:
+                reporter.add_stage(result.validator.stage, result.errors, durations[result.validator.stage])
+    
+    if snapshot.results_cache is not None:
+        results_cache = snapshot.results_cache
+        print(PROGRESS_TEMPLATES['cache_stats'].format(hits=results_cache.hits,
+                                                       total=results_cache.hits + results_cache.misses))
+        if cache is None:
+            save_cache(results_cache)
     
-    # Run image validation
+    return all_errors
+
+def save_cache(cache: ValidationCache):
+    """Write the results cache, reporting failures as a warning."""
     try:
-        errors = validate_images()
-        all_errors.extend(errors)
-    except Exception as e:
-        error_msg = f"❌ Error in image validation: {e}"
-        all_errors.append(error_msg)
-        print(error_msg)
+        cache.save()
+    except OSError as e:
+        print(ERROR_TEMPLATES['cache_write_error'].format(path=cache.path, error=e))
+
+def report_results(all_errors: List[str]) -> bool:
+    """Print the list of issues and the summary line; return whether validation passed."""
+    if all_errors:
+        print(f"\n❌ Antenna structure validation failed!")
+        print(f"\nTotal issues found: {len(all_errors)}")
+        print("\nIssues found:")
+        for i, error in enumerate(all_errors, 1):
+            print(f"  {i}. {error}")
+        print(f"\n❌ Validation failed with {len(all_errors)} issue(s)")
+        return False
+    
+    print(f"\n{SUCCESS_TEMPLATES['all_checks']}")
+    return True
+
+def watch_validations(args: argparse.Namespace):
+    """
+    Validate the catalog, then re-validate on every change until interrupted.
+    
+    Per-antenna results stay in an in-memory results cache, so only antennas whose
+    files changed are checked again, and only stages reading the changed kind of
+    input run (see watch.changed_inputs). Other stages keep their previous errors.
+    With --no-cache the cache file is neither loaded nor saved.
+    """
+    selected = select_validators(args.only)
+    order = [validator.stage for validator, _ in schedule(selected)]
+    cache = ValidationCache(load=not args.no_cache)
+    watcher = create_watcher(polling=args.poll)
+    stage_errors: Dict[str, List[str]] = {}
+    changes = None
     
-    # Run required files validation
+    print(PROGRESS_TEMPLATES['watching'].format(mode=watcher.name))
     try:
-        errors = validate_required_files()
-        all_errors.extend(errors)
-    except Exception as e:
-        error_msg = f"❌ Error in required files validation: {e}"
-        all_errors.append(error_msg)
-        print(error_msg)
+        while True:
+            if changes is None:
+                # First run or lost events: everything may have changed
+                stages = [validator.stage for validator in selected]
+                cache.forget_fingerprints()
+            else:
+                stages = [validator.stage for validator in affected_validators(selected, changed_inputs(changes))]
+                cache.forget_fingerprints(ANTENNAS_DIR / name for name in changed_antennas(changes))
+                print(PROGRESS_TEMPLATES['watch_changes'].format(
+                    count=len(changes), stages=', '.join(stages) or '-'
+                ))
+            
+            if stages:
+                start = time.perf_counter()
+                cache.hits = cache.misses = 0
+                reporter = Reporter()
+                run_all_validations(jobs=args.jobs, reporter=reporter, quiet=not args.verbose,
+                                    stages=stages, max_errors=args.max_errors, cache=cache)
+                for stage in stages:
+                    # Stages skipped because of --max-errors have no current results
+                    stage_errors.pop(stage, None)
+                for finding in reporter.findings:
+                    stage_errors.setdefault(finding.stage, []).append(finding.message)
+                for stage in reporter.stages:
+                    stage_errors.setdefault(stage, [])
+                
+                report_results([error for stage in order for error in stage_errors.get(stage, [])])
+                print(PROGRESS_TEMPLATES['watch_finished'].format(seconds=time.perf_counter() - start))
+            
+            changes = wait_for_changes(watcher)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+        if not args.no_cache:
+            save_cache(cache)
+
+def validate_range(args: argparse.Namespace) -> bool:
+    """
+    Validate every commit of a revision range from the git object store.
+    
+    Commits are read through one shared `git cat-file` process. Per-antenna results
+    are reused for antenna directories whose git tree didn't change, and commits
+    whose antennas tree and root README.md are identical to an earlier commit reuse
+    its results entirely. For each failing commit the issues it introduced are listed.
     
-    # Run README validation
+    Returns:
+        Whether all commits passed
+    """
     try:
-        errors = validate_readme_links()
-        all_errors.extend(errors)
-    except Exception as e:
-        error_msg = f"❌ Error in README validation: {e}"
-        all_errors.append(error_msg)
-        print(error_msg)
+        commits = list_commits(args.range)
+    except GitChangesError as e:
+        print(ERROR_TEMPLATES['git_range_error'].format(range=args.range, error=e))
+        return False
     
-    # Run README.md validation
+    print(PROGRESS_TEMPLATES['range_commits'].format(count=len(commits), range=args.range))
+    cache = ValidationCache(load=not args.no_cache)
+    reader = GitObjectReader()
+    # (antennas tree id, README.md blob id) -> (short commit SHA, errors)
+    results: Dict[Tuple[Optional[str], Optional[str]], Tuple[str, List[str]]] = {}
+    previous_errors: List[str] = []
+    failed = []
     try:
-        errors = validate_antenna_readme_files()
-        all_errors.extend(errors)
-    except Exception as e:
-        error_msg = f"❌ Error in README.md validation: {e}"
-        all_errors.append(error_msg)
-        print(error_msg)
+        for sha, subject in commits:
+            commit = sha[:12]
+            antennas_tree = reader.info(f"{sha}:{ANTENNAS_DIR.as_posix()}")
+            readme_blob = reader.info(f"{sha}:README.md")
+            key = (antennas_tree and antennas_tree.object_id, readme_blob and readme_blob.object_id)
+            
+            note = ''
+            if key in results:
+                source, errors = results[key]
+                note = PROGRESS_TEMPLATES['range_reused'].format(commit=source)
+            else:
+                cache.forget_fingerprints()
+                cache.hits = cache.misses = 0
+                with contextlib.redirect_stdout(QuietOutput(sys.stdout)) if not args.verbose else contextlib.nullcontext():
+                    errors = run_all_validations(jobs=args.jobs, quiet=not args.verbose, stages=args.only,
+                                                 max_errors=args.max_errors, cache=cache,
+                                                 storage=GitTree(sha, reader), shard=args.shard)
+                results[key] = (commit, errors)
+            
+            if errors:
+                failed.append(commit)
+                previous = set(previous_errors)
+                new_errors = [error for error in errors if error not in previous]
+                print(PROGRESS_TEMPLATES['range_commit_failed'].format(
+                    commit=commit, subject=subject, count=len(errors), new=len(new_errors),
+                    fixed=len(previous.difference(errors)), note=note
+                ))
+                for error in new_errors:
+                    print(PROGRESS_TEMPLATES['range_new_issue'].format(error=error))
+            else:
+                print(PROGRESS_TEMPLATES['range_commit_passed'].format(commit=commit, subject=subject, note=note))
+            previous_errors = errors
+    finally:
+        reader.close()
+        if not args.no_cache:
+            save_cache(cache)
     
-    return all_errors
+    if failed:
+        print(f"\n{ERROR_TEMPLATES['range_failed'].format(failed=len(failed), count=len(commits), commit=failed[0])}")
+        return False
+    print(f"\n{SUCCESS_TEMPLATES['range'].format(count=len(commits))}")
+    return True
+
+def parse_shard(text: str) -> Shard:
+    """Parse --shard, reporting invalid values with the reason."""
+    try:
+        return Shard.parse(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Validate antenna directory structure.")
+    parser.add_argument(
+        '--root', type=Path, metavar='DIR',
+        help="validate the catalog in DIR instead of the current directory "
+             "(report, timings and profile paths stay relative to the current directory)"
+    )
+    parser.add_argument(
+        '--shard', type=parse_shard, metavar='i/N',
+        help="validate only the i-th of N parts of the antenna directories, assigned by a hash "
+             "of their names; catalog-wide checks run on shard 1"
+    )
+    parser.add_argument(
+        '--since', metavar='REF',
+        help="only validate antenna directories changed since this git ref "
+             "(root README.md is always checked)"
+    )
+    parser.add_argument(
+        '--rev', metavar='REV',
+        help="validate a git revision (commit, branch or tag) straight from the object store, without a checkout"
+    )
+    parser.add_argument(
+        '--range', metavar='A..B',
+        help="validate every commit of a git revision range, reusing results of unchanged trees"
+    )
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help="don't reuse or store cached per-antenna validation results"
+    )
+    parser.add_argument(
+        '--jobs', '-j', type=int, default=os.cpu_count() or 1, metavar='N',
+        help="number of worker threads for per-antenna checks (default: CPU count)"
+    )
+    parser.add_argument(
+        '--timings', nargs='?', const=DEFAULT_TIMINGS_FILE, type=Path, metavar='FILE',
+        help="report wall/CPU time, files, bytes read and memory per stage and write them as JSON "
+             f"(default: {DEFAULT_TIMINGS_FILE})"
+    )
+    parser.add_argument(
+        '--only', type=lambda text: [name.strip() for name in text.split(',') if name.strip()],
+        metavar='STAGE,...', help=f"run only these stages: {', '.join(stage_names())}"
+    )
+    parser.add_argument(
+        '--check-links', action='store_true',
+        help="also check that external links of README.md files are alive (needs network access)"
+    )
+    parser.add_argument(
+        '--max-errors', type=int, metavar='N',
+        help="stop starting new stages once N errors were found"
+    )
+    parser.add_argument(
+        '--watch', action='store_true',
+        help="keep running and re-validate antennas and README.md whenever they change"
+    )
+    parser.add_argument(
+        '--poll', action='store_true',
+        help="with --watch, poll for changes instead of using inotify"
+    )
+    parser.add_argument(
+        '--verbose', '-v', action='store_true',
+        help="print progress and every checked file (default: only failures and a summary)"
+    )
+    parser.add_argument('--jsonl', type=Path, metavar='FILE', help="stream findings as JSON Lines to FILE")
+    parser.add_argument('--junit', type=Path, metavar='FILE', help="write a JUnit XML report with a test case per stage")
+    parser.add_argument('--sarif', type=Path, metavar='FILE', help="write a SARIF 2.1.0 report for code scanning annotations")
+    parser.add_argument(
+        '--profile', nargs='?', const=DEFAULT_PROFILE_DIR, type=Path, metavar='DIR',
+        help=f"write a cProfile dump per stage, implies --jobs 1 (default: {DEFAULT_PROFILE_DIR})"
+    )
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.watch and (args.since or args.timings or args.profile or args.jsonl or args.junit or args.sarif):
+        parser.error("--watch can't be combined with --since, --timings, --profile or report files")
+    if args.rev and args.range:
+        parser.error("--rev and --range are mutually exclusive")
+    if (args.rev or args.range) and (args.since or args.watch):
+        parser.error("--rev and --range can't be combined with --since or --watch")
+    if args.range and (args.timings or args.profile or args.jsonl or args.junit or args.sarif):
+        parser.error("--range can't be combined with --timings, --profile or report files")
+    if args.shard and args.watch:
+        parser.error("--shard can't be combined with --watch")
+    if args.root:
+        if not args.root.is_dir():
+            parser.error(f"--root: '{args.root}' is not a directory")
+        # Resolve output paths before main() changes into the root directory
+        for name in ('jsonl', 'junit', 'sarif', 'timings', 'profile'):
+            if getattr(args, name) is not None:
+                setattr(args, name, getattr(args, name).resolve())
+    if args.max_errors is not None and args.max_errors < 1:
+        parser.error("--max-errors must be at least 1")
+    if args.only is not None:
+        try:
+            select_validators(args.only)
+        except ValueError as e:
+            parser.error(str(e))
+    if args.check_links:
+        # External links are an optional stage, added to the selected (or default) stages
+        args.only = (args.only or [validator.stage for validator in select_validators()]) + ['external_links']
+    return args
 
 def main():
     """Main validation function."""
+    args = parse_args()
+    if args.root:
+        # Catalog paths and caches are relative to the catalog root
+        os.chdir(args.root)
+    
     try:
-        all_errors = run_all_validations()
+        if args.watch:
+            watch_validations(args)
+            sys.exit(0)
+        
+        if args.range:
+            sys.exit(0 if validate_range(args) else 1)
+        
+        storage = None
+        if args.rev:
+            try:
+                storage = GitTree(args.rev)
+            except StorageError as e:
+                print(ERROR_TEMPLATES['git_revision_error'].format(rev=args.rev, error=e))
+                sys.exit(1)
+            print(PROGRESS_TEMPLATES['validating_revision'].format(name=storage.name, rev=args.rev))
+        
+        antenna_names = None
+        if args.since:
+            try:
+                antenna_names = get_changed_antennas(args.since)
+            except GitChangesError as e:
+                print(ERROR_TEMPLATES['git_diff_error'].format(ref=args.since, error=e))
+                sys.exit(1)
+            
+            if antenna_names is None:
+                print(PROGRESS_TEMPLATES['rules_changed'].format(ref=args.since))
+            else:
+                print(PROGRESS_TEMPLATES['changed_antennas'].format(count=len(antenna_names), ref=args.since))
+        
+        recorder = None
+        if args.timings or args.profile:
+            recorder = StageRecorder(args.profile)
+        # cProfile only sees the main thread
+        jobs = 1 if args.profile else args.jobs
+        
+        reporter = None
+        if args.jsonl or args.junit or args.sarif:
+            reporter = Reporter(args.jsonl, args.junit, args.sarif)
+        
+        all_errors = run_all_validations(antenna_names, use_cache=not args.no_cache, jobs=jobs,
+                                         recorder=recorder, reporter=reporter, quiet=not args.verbose,
+                                         stages=args.only, max_errors=args.max_errors, storage=storage,
+                                         shard=args.shard)
+        if storage is not None:
+            storage.reader.close()
+        if reporter is not None:
+            try:
+                reporter.close()
+            except OSError as e:
+                print(ERROR_TEMPLATES['report_write_error'].format(error=e))
+        
+        if recorder is not None:
+            recorder.print_table()
+            summary_path = args.timings or args.profile / DEFAULT_TIMINGS_FILE.name
+            try:
+                recorder.write(summary_path)
+                print(PROGRESS_TEMPLATES['timings_written'].format(path=summary_path))
+            except OSError as e:
+                print(ERROR_TEMPLATES['timings_write_error'].format(path=summary_path, error=e))
         
         # Report results
-        if all_errors:
-            print(f"\n❌ Antenna structure validation failed!")
-            print(f"\nTotal issues found: {len(all_errors)}")
-            print("\nIssues found:")
-            for i, error in enumerate(all_errors, 1):
-                print(f"  {i}. {error}")
-            print(f"\n❌ Validation failed with {len(all_errors)} issue(s)")
-            sys.exit(1)
-        else:
-            print(f"\n{SUCCESS_TEMPLATES['all_checks']}")
-            sys.exit(0)
+        sys.exit(0 if report_results(all_errors) else 1)
             
     except Exception as e:
         print(f"❌ Unexpected error in validation process: {e}")
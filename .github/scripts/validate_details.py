@@ -7,26 +7,28 @@ Checks that all README.md files have required sections and valid image reference
 import re
 import sys
 from pathlib import Path
-from typing import List, Set
+from typing import List, Optional, Set
 from urllib.parse import urlparse
 
 # Import configuration and utilities
 try:
-    from config import ANTENNAS_DIR, ALLOWED_IMAGE_EXTENSIONS
+    from config import ANTENNAS_DIR, ALLOWED_IMAGE_EXTENSIONS, DETAILS_FILE_NAME
     from messages import ERROR_TEMPLATES, SUCCESS_TEMPLATES, PROGRESS_TEMPLATES
-    from utils import extract_sections_from_markdown, check_parameter_in_section, extract_image_links
+    from utils import ReferenceIndex, check_parameter_in_section
+    from markdown_tree import HeadingNode, parse_markdown
+    from catalog import CatalogEntry, CatalogSnapshot
 except ImportError as e:
     print(f"❌ Error: Could not import required modules: {e}")
     sys.exit(1)
 
 
 
-def validate_required_sections(sections: dict, antenna_name: str) -> List[str]:
+def validate_required_sections(document: HeadingNode, antenna_name: str) -> List[str]:
     """
     Validate that required sections exist and have proper content.
     
     Args:
-        sections: Dictionary of sections from markdown
+        document: Heading tree of the markdown file
         antenna_name: Name of the antenna directory
         
     Returns:
@@ -38,129 +40,100 @@ def validate_required_sections(sections: dict, antenna_name: str) -> List[str]:
     
     # Check that all required sections exist
     for section in required_sections:
-        if section not in sections:
+        section_node = document.find(section, level=2)
+        if section_node is None:
             errors.append(ERROR_TEMPLATES['missing_required_section'].format(name=antenna_name, section=section))
             continue
         
-        section_content = sections[section]['content']
-        
         # Validate "Where to buy" section
         if section == 'Where to buy':
             # Check for at least one link
             link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
-            links = re.findall(link_pattern, section_content)
+            links = re.findall(link_pattern, section_node.content)
             if not links:
                 errors.append(ERROR_TEMPLATES['missing_buy_link'].format(name=antenna_name))
         
         # Validate "Measurements" section
         elif section == 'Measurements':
             # Check for at least one subsection (h3)
-            subsection_pattern = r'^### '
-            subsections = re.findall(subsection_pattern, section_content, re.MULTILINE)
+            subsections = list(section_node.iter(level=3))
             if not subsections:
                 errors.append(ERROR_TEMPLATES['missing_measurements_subsection'].format(name=antenna_name))
-            else:
-                # Check each subsection for SWR and Impedance
-                lines = sections[section]['lines']
-                current_subsection = None
-                subsection_content = []
-                
-                for line in lines:
-                    if line.startswith('### '):
-                        # Validate previous subsection
-                        if current_subsection and subsection_content:
-                            content_text = '\n'.join(subsection_content)
-                            if not check_parameter_in_section(content_text, 'SWR'):
-                                errors.append(ERROR_TEMPLATES['missing_swr_in_subsection'].format(name=antenna_name, subsection=current_subsection))
-                            if not check_parameter_in_section(content_text, 'Impedance'):
-                                errors.append(ERROR_TEMPLATES['missing_impedance_in_subsection'].format(name=antenna_name, subsection=current_subsection))
-                        
-                        # Start new subsection
-                        current_subsection = line[4:].strip()
-                        subsection_content = []
-                    elif current_subsection:
-                        subsection_content.append(line)
-                
-                # Validate last subsection
-                if current_subsection and subsection_content:
-                    content_text = '\n'.join(subsection_content)
-                    if not check_parameter_in_section(content_text, 'SWR'):
-                        errors.append(ERROR_TEMPLATES['missing_swr_in_subsection'].format(name=antenna_name, subsection=current_subsection))
-                    if not check_parameter_in_section(content_text, 'Impedance'):
-                        errors.append(ERROR_TEMPLATES['missing_impedance_in_subsection'].format(name=antenna_name, subsection=current_subsection))
+            
+            # Check each subsection for SWR and Impedance
+            for subsection in subsections:
+                if not subsection.has_body:
+                    continue
+                content_text = subsection.body
+                if not check_parameter_in_section(content_text, 'SWR'):
+                    errors.append(ERROR_TEMPLATES['missing_swr_in_subsection'].format(name=antenna_name, subsection=subsection.title))
+                if not check_parameter_in_section(content_text, 'Impedance'):
+                    errors.append(ERROR_TEMPLATES['missing_impedance_in_subsection'].format(name=antenna_name, subsection=subsection.title))
     
     return errors
 
-def validate_image_references(image_links: List[str], antenna_dir: Path, antenna_name: str) -> List[str]:
+def validate_image_references(content: str, antenna_dir: Path, antenna_name: str,
+                              snapshot: Optional[CatalogSnapshot] = None) -> List[str]:
     """
     Validate that all image references point to existing files.
     
     Args:
-        image_links: List of image links found in the markdown
+        content: Markdown content of the antenna README.md
         antenna_dir: Path to the antenna directory
         antenna_name: Name of the antenna directory
+        snapshot: Catalog snapshot used for existence checks
         
     Returns:
         List of error messages
     """
     errors = []
     
-    for image_link in image_links:
-        # Skip external URLs
-        if image_link.startswith('http'):
-            continue
+    if snapshot is None:
+        snapshot = CatalogSnapshot(ANTENNAS_DIR)
+    
+    index = ReferenceIndex()
+    references = index.add_readme(antenna_dir / DETAILS_FILE_NAME, content)
+    # Images of other antennas are looked up outside the listing of this one
+    dangling = index.dangling({entry.path for entry in snapshot.files(antenna_dir)}, snapshot.exists)
+    
+    for reference in references:
+        image_link = reference.link
         
-        # Handle relative paths
-        if image_link.startswith('./'):
-            image_link = image_link[2:]
-        elif not image_link.startswith('/'):
-            # Relative to antenna directory
-            image_path = antenna_dir / image_link
-        else:
-            # Absolute path
-            image_path = Path(image_link)
+        # GitHub resolves '/...' against the repository root, not the antenna directory
+        if reference.absolute:
+            errors.append(ERROR_TEMPLATES['absolute_image_reference'].format(name=antenna_name, image=image_link))
         
         # Check if file exists
-        if not image_path.exists():
+        if reference.path is None or reference.path in dangling:
             errors.append(ERROR_TEMPLATES['non_existing_image'].format(name=antenna_name, image=image_link))
             continue
         
         # Check if it's an image file
-        if image_path.suffix.lower() not in ALLOWED_IMAGE_EXTENSIONS:
+        if reference.path.suffix.lower() not in ALLOWED_IMAGE_EXTENSIONS:
             errors.append(ERROR_TEMPLATES['non_image_file'].format(name=antenna_name, image=image_link))
     
     return errors
 
-def validate_photo_at_top(content: str, antenna_name: str) -> List[str]:
+def validate_photo_at_top(document: HeadingNode, antenna_name: str) -> List[str]:
     """
     Validate that the antenna photo is displayed at the top of the file.
     
     Args:
-        content: The markdown content
+        document: Heading tree of the markdown file
         antenna_name: Name of the antenna directory
         
     Returns:
         List of error messages
     """
     errors = []
-    
-    # Split content into lines
-    lines = content.split('\n')
     photo_found = False
     
-    # Find the first h2 section (##) to define the top section
-    first_h2_index = -1
-    for i, line in enumerate(lines):
-        if line.startswith('## '):
-            first_h2_index = i
-            break
-    
-    # If no h2 sections found, check the entire content
-    if first_h2_index == -1:
-        first_h2_index = len(lines)
+    # The top section ends at the first h2 section (##), or covers the entire content if there is none
+    first_h2 = next(document.iter(level=2), None)
+    top_end = first_h2.start if first_h2 is not None else document.end
     
     # Look for any image in the top section (before first h2)
-    for i, line in enumerate(lines[:first_h2_index]):
+    for line in document.source[:top_end].split('\n'):
         # Check for markdown image syntax: ![alt text](image_path)
         if '![' in line and '](' in line and ')' in line:
             # Basic validation that it looks like an image link
@@ -169,14 +142,61 @@ def validate_photo_at_top(content: str, antenna_name: str) -> List[str]:
                 break
     
     if not photo_found:
-        errors.append(f"❌ {antenna_name}: Antenna photo should be displayed at the top of the file after the header")
+        errors.append(ERROR_TEMPLATES['missing_top_photo'].format(name=antenna_name))
     
     return errors
 
-def validate_antenna_readme_files() -> List[str]:
+def validate_antenna_readme(snapshot: CatalogSnapshot, antenna: CatalogEntry) -> List[str]:
+    """
+    Validate README.md file of a single antenna directory.
+    
+    Args:
+        snapshot: Catalog snapshot the antenna belongs to
+        antenna: Antenna directory entry
+    
+    Returns:
+        List of error messages
+    """
+    errors = []
+    
+    antenna_dir = antenna.path
+    antenna_name = antenna.name
+    readme_file = antenna_dir / "README.md"
+    
+    if not snapshot.exists(readme_file):
+        errors.append(ERROR_TEMPLATES['missing_details'].format(name=antenna_name))
+        return errors
+    
+    try:
+        content = snapshot.read_text(readme_file)
+    except Exception as e:
+        errors.append(ERROR_TEMPLATES['details_read_error'].format(name=antenna_name, error=e))
+        return errors
+    
+    # Parse heading tree once for all section checks
+    document = parse_markdown(content)
+    
+    # Validate required sections
+    section_errors = validate_required_sections(document, antenna_name)
+    errors.extend(section_errors)
+    
+    # Validate photo placement
+    photo_errors = validate_photo_at_top(document, antenna_name)
+    errors.extend(photo_errors)
+    
+    # Validate image references
+    image_errors = validate_image_references(content, antenna_dir, antenna_name, snapshot)
+    errors.extend(image_errors)
+    
+    return errors
+
+def validate_antenna_readme_files(snapshot: Optional[CatalogSnapshot] = None) -> List[str]:
     """
     Validate all README.md files in antenna directories.
     
+    Args:
+        snapshot: Catalog snapshot to validate, a fresh one is taken if omitted
+    
     Returns:
         List of error messages
     """
@@ -184,43 +204,14 @@ def validate_antenna_readme_files() -> List[str]:
     
     print(PROGRESS_TEMPLATES.get('details_validation', "📄 Validating README.md files..."))
     
-    if not ANTENNAS_DIR.exists():
+    if snapshot is None:
+        snapshot = CatalogSnapshot(ANTENNAS_DIR)
+    
+    if not snapshot.antennas_dir_exists:
         print("ℹ️  No antennas directory found, skipping README validation")
         return errors
     
-    for antenna_dir in ANTENNAS_DIR.iterdir():
-        if not antenna_dir.is_dir():
-            continue
-        
-        antenna_name = antenna_dir.name
-        readme_file = antenna_dir / "README.md"
-        
-        if not readme_file.exists():
-            errors.append(ERROR_TEMPLATES['missing_details'].format(name=antenna_name))
-            continue
-        
-        try:
-            with open(readme_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            errors.append(ERROR_TEMPLATES['details_read_error'].format(name=antenna_name, error=e))
-            continue
-        
-        # Extract sections
-        sections = extract_sections_from_markdown(content)
-        
-        # Validate required sections
-        section_errors = validate_required_sections(sections, antenna_name)
-        errors.extend(section_errors)
-        
-        # Validate photo placement
-        photo_errors = validate_photo_at_top(content, antenna_name)
-        errors.extend(photo_errors)
-        
-        # Extract and validate image references
-        image_links = extract_image_links(content)
-        image_errors = validate_image_references(image_links, antenna_dir, antenna_name)
-        errors.extend(image_errors)
+    errors.extend(snapshot.run_per_antenna('details', validate_antenna_readme))
     
     return errors
 
@@ -2,65 +2,124 @@
 """
 Validate image locations and formats in antenna directories.
 Ensures images are only in allowed subdirectories and use correct formats.
+Image headers are probed to check the real format and resolution without decoding pixels.
 """
 
+import os
 import sys
 from pathlib import Path
+from typing import List, Optional
 
 # Import configuration
 try:
     from config import (
         ANTENNAS_DIR, ALLOWED_IMAGE_EXTENSIONS, ALL_IMAGE_EXTENSIONS,
-        IMAGE_NAMING_PATTERN, IMAGES_DIR_NAME,
+        IMAGE_NAMING_PATTERN, IMAGES_DIR_NAME, MAX_IMAGE_DIMENSION,
         ERROR_TEMPLATES, SUCCESS_TEMPLATES, PROGRESS_TEMPLATES
     )
+    from catalog import CatalogEntry, CatalogSnapshot
+    from image_headers import EXTENSION_FORMATS, probe_image
 except ImportError:
     print("❌ Error: Could not import configuration file")
     sys.exit(1)
 
-def validate_images():
+def validate_image_contents(snapshot: CatalogSnapshot, entry: CatalogEntry) -> List[str]:
+    """Check that image data matches its extension and resolution is within limits."""
+    errors = []
+    file_path = entry.path
+    file_ext = file_path.suffix.lower()
+    
+    try:
+        with snapshot.open_binary(file_path) as f:
+            info = probe_image(f)
+    except OSError as e:
+        errors.append(ERROR_TEMPLATES['image_read_error'].format(path=file_path, error=e))
+        print(f"  ❌ {file_path}: Could not read image")
+        return errors
+    
+    if info is None:
+        errors.append(ERROR_TEMPLATES['image_unrecognized'].format(path=file_path))
+        print(f"  ❌ {file_path}: Not an image")
+    elif info.format != EXTENSION_FORMATS[file_ext]:
+        errors.append(ERROR_TEMPLATES['image_format_mismatch'].format(
+            path=file_path, ext=file_ext, format=info.format.upper()
+        ))
+        print(f"  ❌ {file_path}: Contains {info.format.upper()} data")
+    elif info.width is not None and max(info.width, info.height) > MAX_IMAGE_DIMENSION:
+        errors.append(ERROR_TEMPLATES['image_resolution_exceeded'].format(
+            path=file_path, width=info.width, height=info.height, max_size=MAX_IMAGE_DIMENSION
+        ))
+        print(f"  ❌ {file_path}: Resolution {info.width}x{info.height}")
+    
+    return errors
+
+def validate_image_file(snapshot: CatalogSnapshot, entry: CatalogEntry) -> List[str]:
+    """Check location, format and naming of a single file if it's an image."""
+    errors = []
+    file_path = entry.path
+    file_ext = file_path.suffix.lower()
+    
+    if file_ext in ALL_IMAGE_EXTENSIONS:
+        if file_path.parent.parent.name == ANTENNAS_DIR.name and file_path.parent.name != IMAGES_DIR_NAME:
+            errors.append(ERROR_TEMPLATES['image_wrong_location'].format(path=file_path))
+            print(f"  ❌ {file_path}: Wrong location")
+        
+        elif file_path.parent.name == IMAGES_DIR_NAME:
+            if file_ext not in ALLOWED_IMAGE_EXTENSIONS:
+                errors.append(ERROR_TEMPLATES['image_unsupported_format'].format(
+                    path=file_path, ext=file_ext
+                ))
+                print(f"  ❌ {file_path}: Unsupported format {file_ext}")
+            else:
+                if not IMAGE_NAMING_PATTERN.match(file_path.name.lower()):
+                    errors.append(ERROR_TEMPLATES['image_invalid_naming'].format(path=file_path))
+                    print(f"  ❌ {file_path}: Invalid naming convention")
+                else:
+                    content_errors = validate_image_contents(snapshot, entry)
+                    errors.extend(content_errors)
+                    if not content_errors:
+                        print(PROGRESS_TEMPLATES['valid_image'].format(path=file_path))
+    
+    return errors
+
+def validate_antenna_images(snapshot: CatalogSnapshot, antenna: CatalogEntry) -> List[str]:
+    """Check all images in a single antenna directory."""
+    errors = []
+    for entry in snapshot.files(antenna.path):
+        errors.extend(validate_image_file(snapshot, entry))
+    return errors
+
+def validate_images(snapshot: Optional[CatalogSnapshot] = None):
     """Check image locations, formats, and naming conventions."""
     errors = []
     
-    if not ANTENNAS_DIR.exists():
+    if snapshot is None:
+        snapshot = CatalogSnapshot(ANTENNAS_DIR)
+    
+    if not snapshot.antennas_dir_exists:
         print(ERROR_TEMPLATES['no_antennas_dir'])
         return errors
     
     print(PROGRESS_TEMPLATES['images'])
     
-    try:
-        for file_path in ANTENNAS_DIR.rglob('*'):
-            if file_path.is_file():
-                file_ext = file_path.suffix.lower()
-                
-                if file_ext in ALL_IMAGE_EXTENSIONS:
-                    if file_path.parent.parent.name == ANTENNAS_DIR.name and file_path.parent.name != IMAGES_DIR_NAME:
-                        errors.append(ERROR_TEMPLATES['image_wrong_location'].format(path=file_path))
-                        print(f"  ❌ {file_path}: Wrong location")
-                    
-                    elif file_path.parent.name == IMAGES_DIR_NAME:
-                        if file_ext not in ALLOWED_IMAGE_EXTENSIONS:
-                            errors.append(ERROR_TEMPLATES['image_unsupported_format'].format(
-                                path=file_path, ext=file_ext
-                            ))
-                            print(f"  ❌ {file_path}: Unsupported format {file_ext}")
-                        else:
-                            if not IMAGE_NAMING_PATTERN.match(file_path.name.lower()):
-                                errors.append(ERROR_TEMPLATES['image_invalid_naming'].format(path=file_path))
-                                print(f"  ❌ {file_path}: Invalid naming convention")
-                            else:
-                                print(PROGRESS_TEMPLATES['valid_image'].format(path=file_path))
-    except OSError as e:
+    for e in snapshot.scan_errors:
         error_msg = f"❌ Error traversing antennas directory: {e}"
         errors.append(error_msg)
         print(error_msg)
     
+    # Files placed directly in antennas/ don't belong to any antenna
+    for entry in snapshot.loose_files():
+        errors.extend(validate_image_file(snapshot, entry))
+    
+    errors.extend(snapshot.run_per_antenna('images', validate_antenna_images))
+    
     return errors
 
 def main():
     """Main function."""
     try:
-        errors = validate_images()
+        # Probing reads only image headers, so spread it over a thread pool
+        errors = validate_images(CatalogSnapshot(ANTENNAS_DIR, jobs=os.cpu_count() or 1))
         
         if errors:
             print(f"\n❌ Image validation failed!")
@@ -2,13 +2,14 @@
 """
 README.md validation script.
 Checks that all antenna directories are linked from README.md and that all links are valid.
-Also validates antenna sections structure and frequency subsections.
+Also validates antenna sections structure and frequency subsections, and compares
+their values with the antenna README.md files.
 """
 
 import re
 import sys
 from pathlib import Path
-from typing import List, Set, Tuple
+from typing import List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 # Import configuration and utilities
@@ -16,85 +17,80 @@ try:
     from config import ANTENNAS_DIR
     from messages import ERROR_TEMPLATES, SUCCESS_TEMPLATES, PROGRESS_TEMPLATES
     from utils import (
-        extract_sections_from_markdown, 
         check_parameter_in_section, 
         is_frequency_subsection,
-        extract_links_from_readme,
-        get_antenna_directories,
+        extract_links,
         extract_link_title
     )
+    from markdown_tree import HeadingNode, parse_markdown
+    from validate_summary import check_summary_consistency
+    from catalog import CatalogSnapshot
 except ImportError as e:
     print(f"❌ Error: Could not import required modules: {e}")
     sys.exit(1)
 
 
 
-def validate_antenna_sections(readme_path: Path) -> List[str]:
+def validate_antenna_sections(readme_path: Path, snapshot: Optional[CatalogSnapshot] = None) -> List[str]:
     """
     Validate antenna sections in README.md.
     
     Args:
         readme_path: Path to README.md file
+        snapshot: Catalog snapshot used for existence checks
         
     Returns:
         List of error messages
     """
     errors = []
     
+    if snapshot is None:
+        snapshot = CatalogSnapshot(ANTENNAS_DIR)
+    
     try:
-        with open(readme_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = snapshot.read_text(readme_path)
     except Exception as e:
         errors.append(ERROR_TEMPLATES['readme_error'].format(error=e))
         return errors
     
-    # Extract sections
-    sections = extract_sections_from_markdown(content)
+    # Parse heading tree once
+    document = parse_markdown(content)
     
     # Check if "Antennas" section exists
-    if 'Antennas' not in sections:
+    antennas_section = document.find('Antennas', level=2)
+    if antennas_section is None:
         errors.append(ERROR_TEMPLATES['missing_antennas_section'])
         return errors
     
-    antennas_section = sections['Antennas']
-    lines = antennas_section['lines']
-    
-    # Find all antenna subsections (h3 headers)
-    antenna_subsections = []
-    current_subsection = None
-    current_content = []
-    
-    for line in lines:
-        if line.startswith('### '):
-            # Save previous subsection if exists
-            if current_subsection:
-                antenna_subsections.append({
-                    'name': current_subsection,
-                    'content': '\n'.join(current_content).strip(),
-                    'lines': current_content.copy()
-                })
-            
-            # Start new subsection
-            current_subsection = line[4:].strip()  # Remove '### '
-            current_content = []
-        elif current_subsection:
-            current_content.append(line)
-    
-    # Save last subsection
-    if current_subsection:
-        antenna_subsections.append({
-            'name': current_subsection,
-            'content': '\n'.join(current_content).strip(),
-            'lines': current_content.copy()
-        })
-    
-    # Validate each antenna subsection
-    for subsection in antenna_subsections:
-        subsection_name = subsection['name']
-        subsection_content = subsection['content']
+    return validate_antenna_subsections(antennas_section, snapshot)
+
+def validate_antenna_subsections(antennas_section: HeadingNode, snapshot: CatalogSnapshot) -> List[str]:
+    """
+    Validate antenna subsections (h3 headers) of the parsed "Antennas" section.
+    
+    Args:
+        antennas_section: "Antennas" section of README.md
+        snapshot: Catalog snapshot used for existence checks
+        
+    Returns:
+        List of error messages
+    """
+    errors = []
+    link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
+    
+    # Antenna directories summarized by a block with frequency subsections; other blocks
+    # linking to them are aliases (e.g. "_Same as EByte TX868-JZ-5_") and need none
+    summarized_dirs = set()
+    for subsection in antennas_section.iter(level=3):
+        links = re.findall(link_pattern, subsection.title)
+        if links and next(subsection.iter(level=4), None) is not None:
+            summarized_dirs.add(Path(links[0][1]).parent)
+    
+    # Validate each antenna subsection (h3 headers)
+    for subsection in antennas_section.iter(level=3):
+        subsection_name = subsection.title
         
         # Check if it's a link to README.md
-        link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
         links = re.findall(link_pattern, subsection_name)
         
         if not links:
@@ -109,66 +105,88 @@ def validate_antenna_sections(readme_path: Path) -> List[str]:
         
         # Check that the README.md file exists
         readme_path = Path(link_url)
-        if not readme_path.exists():
+        if not snapshot.exists(readme_path):
             errors.append(ERROR_TEMPLATES['antenna_file_not_exists'].format(subsection=extract_link_title(subsection_name), link=link_url))
             continue
         
         # Check that the antenna directory exists
         antenna_dir = readme_path.parent
-        if not antenna_dir.exists() or not antenna_dir.is_dir():
+        if not snapshot.is_dir(antenna_dir):
             errors.append(ERROR_TEMPLATES['antenna_dir_invalid'].format(subsection=extract_link_title(subsection_name), dir=antenna_dir))
             continue
         
-        # Check for frequency subsections
-        frequency_subsections = []
-        current_freq_subsection = None
-        current_freq_content = []
-        
-        for line in subsection['lines']:
-            if line.startswith('#### '):
-                # Save previous frequency subsection if exists
-                if current_freq_subsection:
-                    frequency_subsections.append({
-                        'name': current_freq_subsection,
-                        'content': '\n'.join(current_freq_content).strip()
-                    })
-                
-                # Start new frequency subsection
-                current_freq_subsection = line[5:].strip()  # Remove '#### '
-                current_freq_content = []
-            elif current_freq_subsection:
-                current_freq_content.append(line)
-        
-        # Save last frequency subsection
-        if current_freq_subsection:
-            frequency_subsections.append({
-                'name': current_freq_subsection,
-                'content': '\n'.join(current_freq_content).strip()
-            })
+        # Check for frequency subsections (h4 headers)
+        frequency_subsections = list(subsection.iter(level=4))
         
         # Check that there's at least one frequency subsection
         if not frequency_subsections:
+            if antenna_dir in summarized_dirs:
+                continue
             errors.append(ERROR_TEMPLATES['missing_frequency_subsection'].format(subsection=extract_link_title(subsection_name)))
             continue
         
         # Check that at least one subsection has frequency in its name
         has_frequency_subsection = False
         for freq_subsection in frequency_subsections:
-            if is_frequency_subsection(freq_subsection['name']):
+            if is_frequency_subsection(freq_subsection.title):
                 has_frequency_subsection = True
                 # Check that frequency subsections contain SWR
-                if not check_parameter_in_section(freq_subsection['content'], 'SWR'):
-                    errors.append(ERROR_TEMPLATES['frequency_missing_swr'].format(frequency=freq_subsection['name'], subsection=extract_link_title(subsection_name)))
+                if not check_parameter_in_section(freq_subsection.content, 'SWR'):
+                    errors.append(ERROR_TEMPLATES['frequency_missing_swr'].format(frequency=freq_subsection.title, subsection=extract_link_title(subsection_name)))
         
         if not has_frequency_subsection:
             errors.append(ERROR_TEMPLATES['no_frequency_subsection'].format(subsection=extract_link_title(subsection_name)))
     
     return errors
 
-def validate_readme_links() -> List[str]:
+def validate_readme_sections(snapshot: Optional[CatalogSnapshot] = None) -> List[str]:
+    """
+    Validate the README.md "Antennas" section.
+    
+    Parses README.md once, checks the structure of antenna subsections and compares
+    their values with the antenna README.md files.
+    
+    Args:
+        snapshot: Catalog snapshot to validate against, a fresh one is taken if omitted
+    
+    Returns:
+        List of error messages
+    """
+    errors = []
+    
+    print(PROGRESS_TEMPLATES['readme_sections'])
+    
+    if snapshot is None:
+        snapshot = CatalogSnapshot(ANTENNAS_DIR)
+    
+    # A missing README.md is reported by the links validation
+    readme_path = Path("README.md")
+    if not snapshot.exists(readme_path):
+        return errors
+    
+    try:
+        content = snapshot.read_text(readme_path)
+    except Exception as e:
+        errors.append(ERROR_TEMPLATES['readme_error'].format(error=e))
+        return errors
+    
+    antennas_section = parse_markdown(content).find('Antennas', level=2)
+    if antennas_section is None:
+        errors.append(ERROR_TEMPLATES['missing_antennas_section'])
+        return errors
+    
+    errors.extend(validate_antenna_subsections(antennas_section, snapshot))
+    errors.extend(check_summary_consistency(antennas_section, snapshot))
+    
+    return errors
+
+def validate_readme_links(snapshot: Optional[CatalogSnapshot] = None) -> List[str]:
     """
     Validate README.md links and antenna directory coverage.
     
+    Args:
+        snapshot: Catalog snapshot to validate against, a fresh one is taken if omitted
+    
     Returns:
         List of error messages
     """
@@ -176,19 +194,26 @@ def validate_readme_links() -> List[str]:
     
     print(PROGRESS_TEMPLATES.get('readme_validation', "📖 Validating README.md links..."))
     
+    if snapshot is None:
+        snapshot = CatalogSnapshot(ANTENNAS_DIR)
+    
     readme_path = Path("README.md")
-    if not readme_path.exists():
+    if not snapshot.exists(readme_path):
         errors.append(ERROR_TEMPLATES['readme_missing'])
         return errors
     
     # Get all antenna directories
-    antenna_dirs = get_antenna_directories(ANTENNAS_DIR)
+    antenna_dirs = {entry.name for entry in snapshot.all_antenna_dirs()}
     if not antenna_dirs:
         print(ERROR_TEMPLATES['no_antennas_dir'])
         return errors
     
     # Extract links from README
-    internal_links, external_links = extract_links_from_readme(readme_path)
+    try:
+        internal_links, external_links = extract_links(snapshot.read_text(readme_path))
+    except Exception as e:
+        errors.append(ERROR_TEMPLATES['readme_error'].format(error=e))
+        return errors
     
     # Check that all antenna directories are linked
     linked_antennas = set()
@@ -202,7 +227,7 @@ def validate_readme_links() -> List[str]:
     
     # Find unlinked antenna directories
     unlinked_antennas = antenna_dirs - linked_antennas
-    for antenna in unlinked_antennas:
+    for antenna in sorted(unlinked_antennas):
         errors.append(ERROR_TEMPLATES['antenna_not_linked'].format(name=antenna))
     
     # Check for broken internal links
@@ -210,7 +235,7 @@ def validate_readme_links() -> List[str]:
         if link.startswith('antennas/'):
             # Check if the linked file/directory exists
             link_path = Path(link)
-            if not link_path.exists():
+            if not snapshot.exists(link_path):
                 errors.append(ERROR_TEMPLATES['broken_internal_link'].format(link=link))
     
     # Check for broken external links (basic validation)
@@ -228,17 +253,14 @@ def main():
     """Main validation function."""
     try:
         errors = []
+        snapshot = CatalogSnapshot(ANTENNAS_DIR)
         
         # Validate basic links
-        link_errors = validate_readme_links()
+        link_errors = validate_readme_links(snapshot)
         errors.extend(link_errors)
         
-        # Validate antenna sections structure
-        readme_path = Path("README.md")
-        if readme_path.exists():
-            print(PROGRESS_TEMPLATES.get('readme_sections', "📋 Validating README.md antenna sections..."))
-            section_errors = validate_antenna_sections(readme_path)
-            errors.extend(section_errors)
+        # Validate antenna sections structure and their values
+        errors.extend(validate_readme_sections(snapshot))
         
         if errors:
             print(f"\n❌ README.md validation failed!")
@@ -6,63 +6,82 @@ Ensures each antenna directory contains required files and no unauthorized files
 
 import sys
 from pathlib import Path
+from typing import List, Optional
 
 # Import configuration
 try:
     from config import (
         ANTENNAS_DIR, REQUIRED_FILES, ALLOWED_DIRECTORIES,
-        DETAILS_FILE_NAME, IMAGES_DIR_NAME,
+        DETAILS_FILE_NAME, IMAGES_DIR_NAME, DATA_DIR_NAME,
         ERROR_TEMPLATES, SUCCESS_TEMPLATES, PROGRESS_TEMPLATES
     )
+    from catalog import CatalogEntry, CatalogSnapshot
 except ImportError:
     print("❌ Error: Could not import configuration file")
     sys.exit(1)
 
-def validate_required_files():
+def validate_antenna_required_files(snapshot: CatalogSnapshot, antenna: CatalogEntry) -> List[str]:
+    """Check that a single antenna directory contains required files and no unauthorized files."""
+    errors = []
+    
+    print(PROGRESS_TEMPLATES['checking_dir'].format(name=antenna.name))
+    
+    subitems = snapshot.children(antenna.path)
+    subitem_names = {subitem.name for subitem in subitems}
+    
+    if DETAILS_FILE_NAME not in subitem_names:
+        errors.append(ERROR_TEMPLATES['missing_details'].format(name=antenna.name))
+        print(f"    ❌ Missing {DETAILS_FILE_NAME}")
+    else:
+        print(PROGRESS_TEMPLATES['found_details'])
+    
+    for subitem in subitems:
+        if subitem.name not in REQUIRED_FILES + ALLOWED_DIRECTORIES:
+            if subitem.is_file:
+                errors.append(ERROR_TEMPLATES['unauthorized_file'].format(
+                    name=antenna.name, file=subitem.name
+                ))
+                print(f"    ❌ Unauthorized file: {subitem.name}")
+            elif subitem.is_dir:
+                errors.append(ERROR_TEMPLATES['unauthorized_subdir'].format(
+                    name=antenna.name, subdir=subitem.name
+                ))
+                print(f"    ❌ Unauthorized subdirectory: {subitem.name}")
+        elif subitem.name == IMAGES_DIR_NAME:
+            if subitem.is_dir:
+                print(PROGRESS_TEMPLATES['found_images'])
+            else:
+                errors.append(ERROR_TEMPLATES['images_not_directory'].format(name=antenna.name))
+                print(f"    ❌ '{IMAGES_DIR_NAME}' is not a directory")
+        elif subitem.name == DATA_DIR_NAME:
+            if subitem.is_dir:
+                print(PROGRESS_TEMPLATES['found_data'])
+            else:
+                errors.append(ERROR_TEMPLATES['data_not_directory'].format(name=antenna.name))
+                print(f"    ❌ '{DATA_DIR_NAME}' is not a directory")
+    
+    return errors
+
+def validate_required_files(snapshot: Optional[CatalogSnapshot] = None):
     """Check that each antenna directory contains required files and no unauthorized files."""
     errors = []
     
-    if not ANTENNAS_DIR.exists():
+    if snapshot is None:
+        snapshot = CatalogSnapshot(ANTENNAS_DIR)
+    
+    if not snapshot.antennas_dir_exists:
         print(ERROR_TEMPLATES['no_antennas_dir'])
         return errors
     
     print(PROGRESS_TEMPLATES['required_files'])
     
-    try:
-        for item in ANTENNAS_DIR.iterdir():
-            if item.is_dir():
-                print(PROGRESS_TEMPLATES['checking_dir'].format(name=item.name))
-                
-                details_file = item / DETAILS_FILE_NAME
-                if not details_file.exists():
-                    errors.append(ERROR_TEMPLATES['missing_details'].format(name=item.name))
-                    print(f"    ❌ Missing {DETAILS_FILE_NAME}")
-                else:
-                    print(PROGRESS_TEMPLATES['found_details'])
-                
-                for subitem in item.iterdir():
-                    if subitem.name not in REQUIRED_FILES + ALLOWED_DIRECTORIES:
-                        if subitem.is_file():
-                            errors.append(ERROR_TEMPLATES['unauthorized_file'].format(
-                                name=item.name, file=subitem.name
-                            ))
-                            print(f"    ❌ Unauthorized file: {subitem.name}")
-                        elif subitem.is_dir():
-                            errors.append(ERROR_TEMPLATES['unauthorized_subdir'].format(
-                                name=item.name, subdir=subitem.name
-                            ))
-                            print(f"    ❌ Unauthorized subdirectory: {subitem.name}")
-                    elif subitem.name == IMAGES_DIR_NAME:
-                        if subitem.is_dir():
-                            print(PROGRESS_TEMPLATES['found_images'])
-                        else:
-                            errors.append(ERROR_TEMPLATES['images_not_directory'].format(name=item.name))
-                            print(f"    ❌ '{IMAGES_DIR_NAME}' is not a directory")
-    except OSError as e:
+    for e in snapshot.scan_errors:
         error_msg = f"❌ Error accessing antennas directory: {e}"
         errors.append(error_msg)
         print(error_msg)
     
+    errors.extend(snapshot.run_per_antenna('required_files', validate_antenna_required_files))
+    
     return errors
 
 def main():
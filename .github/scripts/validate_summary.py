@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Consistency check of the root README.md "Antennas" summary.
+Parses every antenna block of the summary and every antenna README.md once, joins
+them by antenna directory and reports gains, bands, units and SWR/impedance values
+of the summary that don't match the antenna's own README.md.
+"""
+
+import sys
+from typing import Dict, List
+
+# Import configuration and utilities
+try:
+    from config import ANTENNAS_DIR, DETAILS_FILE_NAME
+    from messages import ERROR_TEMPLATES, SUCCESS_TEMPLATES, PROGRESS_TEMPLATES
+    from markdown_tree import HeadingNode, parse_markdown
+    from measurements import MeasurementRecord, extract_declared_gain, extract_measurements
+    from generate_readme import (
+        ANTENNAS_SECTION, ROOT_README, SummaryBlock, format_gain, format_impedance, format_swr,
+        parse_summary_block, select_summary_records
+    )
+    from catalog import CatalogSnapshot
+except ImportError as e:
+    print(f"❌ Error: Could not import required modules: {e}")
+    sys.exit(1)
+
+def describe_unit(label: str) -> str:
+    return f"'{label}'" if label else "the main measurement"
+
+def compare_block(block: SummaryBlock, content: str) -> List[str]:
+    """Compare a summary block with the README.md content of its antenna."""
+    errors = []
+    name = block.antenna
+
+    records = extract_measurements(name, content)
+    if block.gain is not None:
+        declared = records[0].gain if records else extract_declared_gain(parse_markdown(content))
+        if block.gain != format_gain(declared):
+            errors.append(ERROR_TEMPLATES['summary_gain_mismatch'].format(
+                name=name, summary=block.gain, declared=format_gain(declared)
+            ))
+
+    band_records: Dict[str, List[MeasurementRecord]] = {}
+    for record in records:
+        band_records.setdefault(record.band, []).append(record)
+    # band -> unit label -> record shown in the summary
+    measured = {
+        band: {record.label: record for record in select_summary_records(records_of_band)}
+        for band, records_of_band in band_records.items()
+    }
+
+    for band in measured:
+        if band not in block.bands:
+            errors.append(ERROR_TEMPLATES['summary_band_missing'].format(name=name, band=band))
+    for band in block.bands:
+        if band not in measured:
+            errors.append(ERROR_TEMPLATES['summary_band_extra'].format(name=name, band=band))
+
+    for band, units in block.bands.items():
+        expected = measured.get(band)
+        if expected is None:
+            continue
+        for label in expected:
+            if label not in units:
+                errors.append(ERROR_TEMPLATES['summary_unit_missing'].format(
+                    name=name, band=band, unit=describe_unit(label)
+                ))
+        for label, unit in units.items():
+            record = expected.get(label)
+            if record is None:
+                errors.append(ERROR_TEMPLATES['summary_unit_extra'].format(
+                    name=name, band=band, unit=describe_unit(label)
+                ))
+                continue
+
+            actual_swr = format_swr(record.swr) if record.swr is not None else None
+            if unit.swr != actual_swr:
+                errors.append(ERROR_TEMPLATES['summary_value_mismatch'].format(
+                    name=name, field='SWR', summary=unit.swr or 'nothing', band=band,
+                    unit=describe_unit(label), actual=actual_swr or 'nothing'
+                ))
+
+            actual_impedance = format_impedance(record)
+            if unit.impedance != actual_impedance:
+                errors.append(ERROR_TEMPLATES['summary_value_mismatch'].format(
+                    name=name, field='impedance', summary=', '.join(unit.impedance) or 'nothing', band=band,
+                    unit=describe_unit(label), actual=', '.join(actual_impedance) or 'nothing'
+                ))
+
+    return errors
+
+def check_summary_consistency(antennas_section: HeadingNode, snapshot: CatalogSnapshot) -> List[str]:
+    """
+    Join the summary blocks with antenna README.md files and report differences.
+
+    Blocks are indexed by antenna directory in one pass over the summary, then every
+    antenna README.md is parsed once and compared with its blocks. All antennas are
+    compared, also when the snapshot selects only some of them, since an edit of the
+    root README.md alone can break the summary of any antenna.
+
+    Args:
+        antennas_section: Parsed "Antennas" section of the root README.md
+        snapshot: Catalog snapshot with antenna README.md files
+
+    Returns:
+        List of error messages
+    """
+    errors = []
+
+    blocks: Dict[str, List[SummaryBlock]] = {}
+    for node in antennas_section.iter(level=3):
+        block = parse_summary_block(node)
+        if block is not None:
+            blocks.setdefault(block.antenna, []).append(block)
+
+    for antenna in snapshot.all_antenna_dirs():
+        readme_file = antenna.path / DETAILS_FILE_NAME
+        if antenna.name not in blocks or not snapshot.exists(readme_file):
+            # Unlinked antennas and missing README.md files are reported by other stages
+            continue
+        try:
+            content = snapshot.read_text(readme_file)
+        except (OSError, UnicodeDecodeError):
+            continue
+        for block in blocks[antenna.name]:
+            errors.extend(compare_block(block, content))
+
+    return errors
+
+def main():
+    """Main function."""
+    try:
+        print(PROGRESS_TEMPLATES['summary_consistency'])
+        snapshot = CatalogSnapshot(ANTENNAS_DIR)
+        section = parse_markdown(snapshot.read_text(ROOT_README)).find(ANTENNAS_SECTION, level=2)
+        if section is None:
+            print(ERROR_TEMPLATES['missing_antennas_section'])
+            sys.exit(1)
+
+        errors = check_summary_consistency(section, snapshot)
+
+        if errors:
+            print(f"\n❌ README.md summary check failed!")
+            print(f"Total issues: {len(errors)}")
+            for error in errors:
+                print(f"  {error}")
+            sys.exit(1)
+        else:
+            print(f"\n{SUCCESS_TEMPLATES['summary_consistency']}")
+            sys.exit(0)
+    except Exception as e:
+        print(f"❌ Unexpected error in README.md summary check: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Validate Touchstone sweep files in antenna 'data/' directories.
+Checks that sweep files can be parsed and that SWR and impedance quoted in
+the antenna README.md agree with the sweep at the same frequency.
+"""
+
+import sys
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# Import configuration and utilities
+try:
+    from config import (
+        ANTENNAS_DIR, DATA_DIR_NAME, DETAILS_FILE_NAME, ALLOWED_DATA_EXTENSIONS,
+        SWEEP_SWR_TOLERANCE, SWEEP_IMPEDANCE_TOLERANCE, SWEEP_IMPEDANCE_TOLERANCE_OHMS
+    )
+    from messages import ERROR_TEMPLATES, SUCCESS_TEMPLATES, PROGRESS_TEMPLATES
+    from measurements import MeasurementRecord, band_range_hz, extract_measurements
+    from touchstone import Sweep, SweepMetrics, format_frequency, load_touchstone, metrics_at, np
+    from catalog import CatalogEntry, CatalogSnapshot
+except ImportError as e:
+    print(f"❌ Error: Could not import required modules: {e}")
+    sys.exit(1)
+
+def format_values(swr: Optional[float], resistance: Optional[float], reactance: Optional[float]) -> str:
+    """Format measured values for messages, e.g. 'SWR 1.234, Z 38.09+5.84j Ω'."""
+    parts = []
+    if swr is not None:
+        parts.append(f"SWR {swr:.3f}")
+    if resistance is not None:
+        impedance = f"Z {resistance:.2f}"
+        if reactance is not None:
+            impedance += f"{reactance:+.2f}j"
+        parts.append(impedance + " Ω")
+    return ', '.join(parts)
+
+def measurement_deviation(record: MeasurementRecord, point: SweepMetrics) -> float:
+    """
+    Return the largest deviation of README.md values from a sweep point relative to tolerances.
+
+    Values up to 1.0 are within tolerances.
+    """
+    deviation = 0.0
+    if record.swr is not None:
+        allowed = SWEEP_SWR_TOLERANCE * float(point.swr)
+        deviation = max(deviation, abs(record.swr - float(point.swr)) / allowed)
+
+    if record.resistance is not None:
+        impedance = complex(point.impedance)
+        quoted = complex(record.resistance, record.reactance if record.reactance is not None else impedance.imag)
+        allowed = max(SWEEP_IMPEDANCE_TOLERANCE_OHMS, SWEEP_IMPEDANCE_TOLERANCE * abs(impedance))
+        deviation = max(deviation, abs(quoted - impedance) / allowed)
+
+    return deviation
+
+def compare_measurement(antenna_name: str, record: MeasurementRecord,
+                        sweeps: List[Tuple[Path, Sweep]]) -> Optional[str]:
+    """
+    Compare a README.md measurement with sweeps covering its frequency.
+
+    The measurement matches if it agrees with any of the sweeps, since an antenna
+    may have sweeps of several units or setups.
+
+    Returns:
+        Error message, or None if it matches or no sweep covers the frequency
+    """
+    band = band_range_hz(record.band)
+    # Ranges don't say which frequency the values were measured at
+    if band is None or band[0] != band[1]:
+        return None
+    frequency = band[0]
+
+    closest = None
+    for path, sweep in sweeps:
+        point = metrics_at(sweep, frequency)
+        if point is None:
+            continue
+        deviation = measurement_deviation(record, point)
+        if deviation <= 1.0:
+            return None
+        if closest is None or deviation < closest[0]:
+            closest = (deviation, path, point)
+
+    if closest is None:
+        return None
+
+    _, path, point = closest
+    impedance = complex(point.impedance)
+    measurement = f"{record.band} ({record.label})" if record.label else record.band
+    return ERROR_TEMPLATES['sweep_value_mismatch'].format(
+        name=antenna_name, measurement=measurement, path=path, frequency=format_frequency(frequency),
+        quoted=format_values(record.swr, record.resistance, record.reactance),
+        measured=format_values(
+            float(point.swr) if record.swr is not None else None,
+            impedance.real if record.resistance is not None else None,
+            impedance.imag if record.reactance is not None else None
+        )
+    )
+
+def validate_antenna_sweeps(snapshot: CatalogSnapshot, antenna: CatalogEntry) -> List[str]:
+    """Check sweep files of a single antenna directory against its README.md."""
+    errors = []
+    data_dir = antenna.path / DATA_DIR_NAME
+    if not snapshot.is_dir(data_dir):
+        return errors
+
+    sweeps = []
+    for entry in snapshot.files(data_dir):
+        file_ext = entry.path.suffix.lower()
+        if file_ext not in ALLOWED_DATA_EXTENSIONS:
+            errors.append(ERROR_TEMPLATES['unsupported_data_file'].format(path=entry.path, ext=file_ext))
+            print(f"  ❌ {entry.path}: Unsupported format {file_ext}")
+            continue
+
+        if np is None:
+            continue
+
+        try:
+            sweep = load_touchstone(snapshot.read_text(entry.path))
+        except (OSError, UnicodeDecodeError, ValueError) as e:
+            errors.append(ERROR_TEMPLATES['sweep_parse_error'].format(path=entry.path, error=e))
+            print(f"  ❌ {entry.path}: Invalid Touchstone file")
+            continue
+
+        sweeps.append((entry.path, sweep))
+        print(PROGRESS_TEMPLATES['valid_sweep'].format(
+            path=entry.path, points=len(sweep.frequency),
+            start=format_frequency(sweep.frequency[0]), stop=format_frequency(sweep.frequency[-1])
+        ))
+
+    readme_file = antenna.path / DETAILS_FILE_NAME
+    if not sweeps or not snapshot.exists(readme_file):
+        return errors
+
+    try:
+        content = snapshot.read_text(readme_file)
+    except Exception as e:
+        errors.append(ERROR_TEMPLATES['details_read_error'].format(name=antenna.name, error=e))
+        return errors
+
+    for record in extract_measurements(antenna.name, content):
+        error_msg = compare_measurement(antenna.name, record, sweeps)
+        if error_msg:
+            errors.append(error_msg)
+            print(f"  {error_msg}")
+
+    return errors
+
+def validate_sweeps(snapshot: Optional[CatalogSnapshot] = None) -> List[str]:
+    """Check sweep files in all antenna directories."""
+    errors = []
+
+    if snapshot is None:
+        snapshot = CatalogSnapshot(ANTENNAS_DIR)
+
+    if not snapshot.antennas_dir_exists:
+        print(ERROR_TEMPLATES['no_antennas_dir'])
+        return errors
+
+    print(PROGRESS_TEMPLATES['sweeps'])
+
+    # Results without NumPy only cover file formats, cache them separately
+    stage = 'sweeps'
+    if np is None:
+        print(ERROR_TEMPLATES['numpy_missing'])
+        stage = 'sweeps_without_numpy'
+
+    errors.extend(snapshot.run_per_antenna(stage, validate_antenna_sweeps))
+
+    return errors
+
+def main():
+    """Main function."""
+    try:
+        errors = validate_sweeps()
+
+        if errors:
+            print(f"\n❌ Sweep validation failed!")
+            print(f"Total issues: {len(errors)}")
+            for error in errors:
+                print(f"  {error}")
+            sys.exit(1)
+        else:
+            print(f"\n{SUCCESS_TEMPLATES['sweeps']}")
+            sys.exit(0)
+    except Exception as e:
+        print(f"❌ Unexpected error in sweep validation: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
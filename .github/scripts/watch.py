@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+File system watching for validate_all.py --watch.
+Reports changes below antennas/ and to the root README.md, using inotify through
+ctypes on Linux and polling elsewhere, and maps changed paths to the validation
+inputs they affect.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+# Import configuration
+try:
+    from config import (
+        ANTENNAS_DIR, DATA_DIR_NAME, DETAILS_FILE_NAME, IMAGES_DIR_NAME,
+        WATCH_DEBOUNCE_SECONDS, WATCH_POLL_INTERVAL_SECONDS
+    )
+except ImportError:
+    print("❌ Error: Could not import configuration file")
+    sys.exit(1)
+
+ROOT_README = Path(DETAILS_FILE_NAME)
+
+# Change kinds
+CREATED = 'created'
+DELETED = 'deleted'
+MODIFIED = 'modified'
+
+class Change(NamedTuple):
+    """A changed path relative to the repository root."""
+    path: Path
+    kind: str
+
+# Constants from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_CLOEXEC = 0o2000000
+IN_NONBLOCK = 0o4000
+
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+
+# struct inotify_event: int wd; uint32_t mask, cookie, len; char name[len]
+EVENT_HEADER = struct.Struct('iIII')
+READ_BUFFER_SIZE = 64 * 1024
+
+class InotifyWatcher:
+    """
+    Watches the antennas tree and the root README.md with inotify (Linux only).
+
+    Directories created later are watched as they appear. read() returns None when
+    the kernel event queue overflowed and changes may have been lost.
+    """
+
+    name = 'inotify'
+
+    def __init__(self, directory: Path = ANTENNAS_DIR):
+        if not sys.platform.startswith('linux'):
+            raise OSError("inotify is only available on Linux")
+        library = ctypes.util.find_library('c')
+        self._libc = ctypes.CDLL(library or 'libc.so.6', use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+
+        self.directory = Path(directory)
+        self._watches: Dict[int, Path] = {}
+        # The repository root is watched without recursion for README.md and the antennas directory itself
+        self._add_watch(Path('.'))
+        self._add_tree(self.directory)
+
+    def _add_watch(self, path: Path):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        # Directories may disappear before the watch is added
+        if wd >= 0:
+            self._watches[wd] = path
+
+    def _add_tree(self, directory: Path) -> List[Change]:
+        """Watch a directory tree and return its files as created (they may predate the watch)."""
+        created = []
+        for root, dirs, files in os.walk(directory):
+            root_path = Path(root)
+            self._add_watch(root_path)
+            created.extend(Change(root_path / name, CREATED) for name in sorted(files))
+        return created
+
+    def _is_relevant(self, path: Path) -> bool:
+        return path == ROOT_README or path == self.directory or path.is_relative_to(self.directory)
+
+    def read(self, timeout: Optional[float] = None) -> Optional[List[Change]]:
+        """Wait up to `timeout` seconds (forever if None) for events and return the changes."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self._fd, READ_BUFFER_SIZE)
+        except BlockingIOError:
+            return []
+
+        changes = []
+        overflow = False
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            raw_name = data[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + length]
+            offset += EVENT_HEADER.size + length
+
+            if mask & IN_Q_OVERFLOW:
+                overflow = True
+                continue
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+
+            name = os.fsdecode(raw_name.rstrip(b'\0'))
+            path = directory / name if name else directory
+            if not self._is_relevant(path):
+                continue
+
+            if mask & (IN_CREATE | IN_MOVED_TO):
+                if mask & IN_ISDIR:
+                    changes.append(Change(path, CREATED))
+                    changes.extend(self._add_tree(path))
+                else:
+                    changes.append(Change(path, CREATED))
+            elif mask & (IN_DELETE | IN_MOVED_FROM | IN_DELETE_SELF):
+                changes.append(Change(path, DELETED))
+            else:
+                changes.append(Change(path, MODIFIED))
+        return None if overflow else changes
+
+    def close(self):
+        os.close(self._fd)
+
+# Polling state of a path: (is directory, size, mtime in ns)
+PathState = Tuple[bool, int, int]
+
+class PollingWatcher:
+    """Detects changes by comparing stat results of the watched tree at an interval."""
+
+    name = 'polling'
+
+    def __init__(self, directory: Path = ANTENNAS_DIR, interval: float = WATCH_POLL_INTERVAL_SECONDS):
+        self.directory = Path(directory)
+        self.interval = interval
+        self._state = self._take_state()
+
+    def _take_state(self) -> Dict[Path, PathState]:
+        state = {}
+        for path in (ROOT_README, self.directory):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            state[path] = (path.is_dir(), stat.st_size, stat.st_mtime_ns)
+
+        pending = [self.directory] if self.directory.is_dir() else []
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as iterator:
+                    for entry in iterator:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                        stat = entry.stat(follow_symlinks=False)
+                        state[Path(entry.path)] = (is_dir, stat.st_size, stat.st_mtime_ns)
+                        if is_dir:
+                            pending.append(Path(entry.path))
+            except OSError:
+                continue
+        return state
+
+    def read(self, timeout: Optional[float] = None) -> Optional[List[Change]]:
+        """Poll until something changed or `timeout` seconds passed (forever if None)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            delay = self.interval if deadline is None else max(0.0, min(self.interval, deadline - time.monotonic()))
+            time.sleep(delay)
+
+            state = self._take_state()
+            changes = [Change(path, DELETED) for path in self._state.keys() - state.keys()]
+            for path, current in state.items():
+                previous = self._state.get(path)
+                if previous is None:
+                    changes.append(Change(path, CREATED))
+                elif previous != current and not current[0]:
+                    changes.append(Change(path, MODIFIED))
+            self._state = state
+
+            if changes or (deadline is not None and time.monotonic() >= deadline):
+                return sorted(changes)
+
+    def close(self):
+        pass
+
+def create_watcher(directory: Path = ANTENNAS_DIR, polling: bool = False):
+    """Return an inotify watcher, or a polling one if inotify isn't available (or requested)."""
+    if not polling:
+        try:
+            return InotifyWatcher(directory)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(directory)
+
+def wait_for_changes(watcher, debounce: float = WATCH_DEBOUNCE_SECONDS) -> Optional[List[Change]]:
+    """
+    Block until something changes, then collect events until none arrived for `debounce` seconds.
+
+    Returns:
+        Changes in arrival order (duplicates removed), or None if changes may have been lost
+    """
+    changes: Optional[List[Change]] = []
+    while changes == []:
+        changes = watcher.read()
+
+    while True:
+        more = watcher.read(debounce)
+        if not more and more is not None:
+            break
+        if more is None or changes is None:
+            changes = None
+        else:
+            changes.extend(more)
+
+    return None if changes is None else list(dict.fromkeys(changes))
+
+def changed_antennas(changes: Iterable[Change]) -> Set[str]:
+    """Return names of antenna directories containing (or being) changed paths."""
+    names = set()
+    for change in changes:
+        if change.path.is_relative_to(ANTENNAS_DIR) and change.path != ANTENNAS_DIR:
+            names.add(change.path.relative_to(ANTENNAS_DIR).parts[0])
+    return names
+
+def changed_inputs(changes: Iterable[Change]) -> Set[str]:
+    """Map changed paths to the validation inputs they affect (see registry.INPUTS)."""
+    inputs = set()
+    for change in changes:
+        if change.path == ROOT_README:
+            inputs.add('root_readme')
+            continue
+        if change.path == ANTENNAS_DIR:
+            inputs.add('listing')
+            continue
+        if not change.path.is_relative_to(ANTENNAS_DIR):
+            continue
+
+        # Modified contents don't change directory listings
+        if change.kind != MODIFIED:
+            inputs.add('listing')
+        inputs.add('stats')
+        parts = change.path.relative_to(ANTENNAS_DIR).parts
+        if len(parts) < 2:
+            continue
+        if parts[1:] == (DETAILS_FILE_NAME,):
+            inputs.add('readme')
+        elif parts[1] == IMAGES_DIR_NAME:
+            inputs.update(('image_headers', 'image_data'))
+        elif parts[1] == DATA_DIR_NAME:
+            inputs.add('sweep_data')
+    return inputs